@@ -35,6 +35,7 @@ It preserves cultural artifacts and provides interactive learning experiences fo
 - Smooth exhibition rotation control
 - Real-time visitor feedback processing
 - Cultural significance calculations
+- The AthenaMist checkout (ATHENAMIST_PATH) is added to sys.path only if it exists
 
 🔒 SECURITY IMPLICATIONS:
 - Cultural artifact protection
@@ -49,19 +50,23 @@ It preserves cultural artifacts and provides interactive learning experiences fo
 - 2024-12-19: Improved exhibition management
 """
 
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import json
-import uuid
+from functools import lru_cache
+import logging
+import numpy as np
 import sys
 import os
+from src.eden_core.athena_path import add_athena_mist_path
+from src.eden_core.clock import coarse_now
+from src.eden_core.id_generator import new_id
 from src.eden_core.module_interface import EdenModuleInterface
 
-# Add AthenaMist-Blended to path for brain integration
-ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
-if ATHENA_MIST_PATH not in sys.path:
-    sys.path.append(ATHENA_MIST_PATH)
+logger = logging.getLogger(__name__)
+
+# Add AthenaMist-Blended to path for brain integration (ATHENAMIST_PATH, if it exists)
+ATHENA_MIST_PATH = add_athena_mist_path()
 
 try:
     from athena_mist import AthenaMistBrain, CulturalProcessor, ExhibitionManager
@@ -70,7 +75,7 @@ except ImportError:
     print("⚠️  Warning: AthenaMist-Blended not available. Using fallback cultural processing.")
     BRAIN_AVAILABLE = False
 
-@dataclass
+@dataclass(slots=True)
 class CulturalArtifact:
     """
     Represents a cultural artifact in the system.
@@ -91,7 +96,7 @@ class CulturalArtifact:
     brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended analysis results
     visitor_resonance: float  # 0.0 to 1.0 - Visitor emotional resonance
 
-@dataclass
+@dataclass(slots=True)
 class Exhibition:
     """
     Represents an exhibition in the rotating sphere.
@@ -111,6 +116,112 @@ class Exhibition:
     brain_optimization: Optional[Dict[str, Any]]  # AthenaMist-Blended optimization data
     cultural_impact_score: float  # 0.0 to 1.0 - Calculated by brain
 
+    @property
+    def duration_days(self) -> int:
+        """Whole days between start_date and end_date."""
+        return (self.end_date - self.start_date).days
+
+class ScoreColumns:
+    """
+    Struct-of-arrays store for per-record numeric scores.
+    
+    📋 QUANTUM DOCUMENTATION: Keeps one contiguous NumPy column per score,
+    addressed by record ID, so aggregate analytics run as vectorized
+    reductions instead of Python loops over dataclasses. Columns named in
+    *quantized* hold 0.0-1.0 scores as uint8 fixed point (1/255 steps).
+    """
+    
+    QUANT_SCALE = 255.0
+    
+    def __init__(self, *names: str, quantized: Tuple[str, ...] = (), capacity: int = 64):
+        self.quantized: Set[str] = set(quantized)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=np.uint8 if name in self.quantized else np.float32)
+            for name in names
+        }
+        self.row_of: Dict[str, int] = {}
+        self.ids: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def set(self, record_id: str, **values: float) -> None:
+        """Insert or update the scores for *record_id*."""
+        row = self.row_of.get(record_id)
+        if row is None:
+            row = len(self.ids)
+            if row >= self._capacity():
+                self._grow()
+            self.row_of[record_id] = row
+            self.ids.append(record_id)
+        columns = self.columns
+        quantized = self.quantized
+        for name, value in values.items():
+            if name in quantized:
+                value = round(min(1.0, max(0.0, value)) * self.QUANT_SCALE)
+            columns[name][row] = value
+    
+    def remove(self, record_id: str) -> bool:
+        """Remove *record_id*, moving the last row into its slot."""
+        row = self.row_of.pop(record_id, None)
+        if row is None:
+            return False
+        last = len(self.ids) - 1
+        last_id = self.ids.pop()
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.ids[row] = last_id
+            self.row_of[last_id] = row
+        return True
+    
+    def raw(self, name: str) -> np.ndarray:
+        """Return the live slice of column *name* in its stored dtype."""
+        return self.columns[name][:len(self.ids)]
+    
+    def view(self, name: str) -> np.ndarray:
+        """Return the live values of column *name* as float32 scores."""
+        values = self.raw(name)
+        if name in self.quantized:
+            return values / np.float32(self.QUANT_SCALE)
+        return values
+    
+    def mean(self, name: str) -> float:
+        """Mean of column *name*, or 0.0 when empty."""
+        if not self.ids:
+            return 0.0
+        mean = float(self.raw(name).mean())
+        return mean / self.QUANT_SCALE if name in self.quantized else mean
+    
+    def top(self, name: str, n: int) -> List[str]:
+        """IDs of the *n* records with the highest *name* score, best first."""
+        # Rank on the stored values; quantization preserves order
+        values = self.raw(name)
+        count = len(values)
+        n = min(n, count)
+        if n <= 0:
+            return []
+        rows = np.argpartition(values, count - n)[count - n:]
+        rows = rows[np.argsort(values[rows], kind='stable')[::-1]]
+        ids = self.ids
+        return [ids[row] for row in rows]
+    
+    def _capacity(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+    
+    def _grow(self) -> None:
+        for name, column in self.columns.items():
+            grown = np.zeros(max(1, len(column) * 2), dtype=column.dtype)
+            grown[:len(column)] = column
+            self.columns[name] = grown
+
+@lru_cache(maxsize=1024)
+def _cultural_impact(artifact_ids: Tuple[str, ...], theme: str) -> float:
+    """Memoized cultural impact score for a set of artifacts and a theme."""
+    # TODO: Implement sophisticated cultural impact calculation
+    # This would consider artifact significance, theme relevance, and historical context
+    return 0.7  # Placeholder
+
 class CulturalDatabase:
     """
     Manages the cultural database and artifact preservation.
@@ -122,6 +233,13 @@ class CulturalDatabase:
     def __init__(self):
         self.artifacts: Dict[str, CulturalArtifact] = {}
         self.categories: Set[str] = set()
+        self.by_category: Dict[str, Set[str]] = {}  # category -> artifact IDs
+        self.scores = ScoreColumns(
+            'cultural_significance', 'visitor_resonance',
+            quantized=('cultural_significance', 'visitor_resonance'),
+        )
+        # artifact_id -> (state key, analysis); see analyze_cultural_significance
+        self._significance_cache: Dict[str, Tuple[Tuple[str, float], Dict[str, Any]]] = {}
         self.preservation_protocols: Dict[str, Dict[str, Any]] = {}
         self.brain_processor = None
         
@@ -146,20 +264,97 @@ class CulturalDatabase:
         Returns:
             bool: Success status
         """
-        if artifact.artifact_id in self.artifacts:
+        if self.artifacts.setdefault(artifact.artifact_id, artifact) is not artifact:
             return False
+        self._significance_cache.pop(artifact.artifact_id, None)
         
         # Analyze artifact with AthenaMist-Blended
         if self.brain_processor and BRAIN_AVAILABLE:
             try:
-                analysis = self.brain_processor.analyze_artifact(artifact)
-                artifact.brain_analysis = analysis
-                artifact.cultural_significance = analysis.get('significance_score', artifact.cultural_significance)
+                self._apply_analysis(artifact, self.brain_processor.analyze_artifact(artifact))
             except Exception as e:
-                print(f"⚠️  Brain analysis failed: {e}")
+                logger.warning("Brain analysis failed: %s", e)
+        
+        self._index_artifact(artifact)
+        return True
+    
+    def add_artifacts(self, artifacts: List[CulturalArtifact]) -> List[bool]:
+        """
+        Add many cultural artifacts with a single batched brain analysis.
         
-        self.artifacts[artifact.artifact_id] = artifact
+        🧠 BRAIN INTEGRATION: New artifacts are sent to AthenaMist-Blended in one
+        analyze_batch call instead of one analyze_artifact call each.
+        
+        Args:
+            artifacts: CulturalArtifact objects to add
+            
+        Returns:
+            List[bool]: Success status per artifact, in input order
+        """
+        existing = self.artifacts
+        pending: Dict[str, CulturalArtifact] = {}
+        results = []
+        for artifact in artifacts:
+            artifact_id = artifact.artifact_id
+            if artifact_id in existing or artifact_id in pending:
+                results.append(False)
+            else:
+                pending[artifact_id] = artifact
+                results.append(True)
+        if not pending:
+            return results
+        
+        new_artifacts = list(pending.values())
+        if self.brain_processor and BRAIN_AVAILABLE:
+            try:
+                for artifact, analysis in zip(new_artifacts, self._analyze_batch(new_artifacts)):
+                    self._apply_analysis(artifact, analysis)
+            except Exception as e:
+                logger.warning("Batch brain analysis failed: %s", e)
+        
+        existing.update(pending)
+        for artifact in new_artifacts:
+            self._significance_cache.pop(artifact.artifact_id, None)
+            self._index_artifact(artifact)
+        return results
+    
+    def _analyze_batch(self, artifacts: List[CulturalArtifact]) -> List[Dict[str, Any]]:
+        """Analyze artifacts in one brain call, mapping analyze_artifact if batching is unsupported."""
+        analyze_batch = getattr(self.brain_processor, 'analyze_batch', None)
+        if analyze_batch is None:
+            return [self.brain_processor.analyze_artifact(artifact) for artifact in artifacts]
+        return analyze_batch(artifacts)
+    
+    @staticmethod
+    def _apply_analysis(artifact: CulturalArtifact, analysis: Dict[str, Any]) -> None:
+        """Store a brain analysis result on *artifact*."""
+        artifact.brain_analysis = analysis
+        artifact.cultural_significance = analysis.get('significance_score', artifact.cultural_significance)
+    
+    def _index_artifact(self, artifact: CulturalArtifact) -> None:
+        """Add a stored artifact to the category index and score columns."""
         self.categories.add(artifact.category)
+        self.by_category.setdefault(artifact.category, set()).add(artifact.artifact_id)
+        self.scores.set(
+            artifact.artifact_id,
+            cultural_significance=artifact.cultural_significance,
+            visitor_resonance=artifact.visitor_resonance,
+        )
+    
+    def remove_artifact(self, artifact_id: str) -> bool:
+        """Remove an artifact from the database and its category index."""
+        artifact = self.artifacts.pop(artifact_id, None)
+        if artifact is None:
+            return False
+        self._significance_cache.pop(artifact_id, None)
+        self.scores.remove(artifact_id)
+        
+        category_ids = self.by_category.get(artifact.category)
+        if category_ids is not None:
+            category_ids.discard(artifact_id)
+            if not category_ids:
+                del self.by_category[artifact.category]
+                self.categories.discard(artifact.category)
         return True
     
     def get_artifact(self, artifact_id: str) -> Optional[CulturalArtifact]:
@@ -168,42 +363,64 @@ class CulturalDatabase:
     
     def update_preservation_status(self, artifact_id: str, status: str) -> bool:
         """Update the preservation status of an artifact."""
-        if artifact_id not in self.artifacts:
+        artifact = self.artifacts.get(artifact_id)
+        if artifact is None:
             return False
         
-        self.artifacts[artifact_id].preservation_status = status
+        artifact.preservation_status = status
+        self._significance_cache.pop(artifact_id, None)
         return True
     
     def get_artifacts_by_category(self, category: str) -> List[CulturalArtifact]:
         """Retrieve all artifacts in a specific category."""
-        return [a for a in self.artifacts.values() if a.category == category]
+        artifacts = self.artifacts
+        return [artifacts[i] for i in self.by_category.get(category, ())]
+    
+    def mean_significance(self) -> float:
+        """Average cultural significance across all artifacts."""
+        return self.scores.mean('cultural_significance')
+    
+    def top_artifacts(self, n: int) -> List[CulturalArtifact]:
+        """Return the *n* most culturally significant artifacts, best first."""
+        artifacts = self.artifacts
+        return [artifacts[i] for i in self.scores.top('cultural_significance', n)]
     
     def analyze_cultural_significance(self, artifact_id: str) -> Dict[str, Any]:
         """
         Analyze cultural significance using AthenaMist-Blended.
         
         🧠 BRAIN INTEGRATION: Provides deep cultural analysis and recommendations.
+        Results are cached per artifact until its preservation status or
+        significance changes.
         """
-        if artifact_id not in self.artifacts:
+        artifact = self.artifacts.get(artifact_id)
+        if artifact is None:
             return {"error": "Artifact not found"}
         
-        artifact = self.artifacts[artifact_id]
+        state_key = (artifact.preservation_status, artifact.cultural_significance)
+        cached = self._significance_cache.get(artifact_id)
+        if cached is not None and cached[0] == state_key:
+            return cached[1]
         
+        analysis = None
         if self.brain_processor and BRAIN_AVAILABLE:
             try:
                 analysis = self.brain_processor.deep_cultural_analysis(artifact)
                 artifact.brain_analysis = analysis
-                return analysis
             except Exception as e:
-                print(f"⚠️  Deep cultural analysis failed: {e}")
-        
-        # Fallback analysis
-        return {
-            "significance_score": artifact.cultural_significance,
-            "preservation_priority": "medium",
-            "exhibition_recommendation": "suitable",
-            "cultural_context": "standard"
-        }
+                logger.warning("Deep cultural analysis failed: %s", e)
+        
+        if analysis is None:
+            # Fallback analysis
+            analysis = {
+                "significance_score": artifact.cultural_significance,
+                "preservation_priority": "medium",
+                "exhibition_recommendation": "suitable",
+                "cultural_context": "standard"
+            }
+        
+        self._significance_cache[artifact_id] = (state_key, analysis)
+        return analysis
 
 class ExhibitionManager:
     """
@@ -215,6 +432,10 @@ class ExhibitionManager:
     
     def __init__(self):
         self.exhibitions: Dict[str, Exhibition] = {}
+        self.scores = ScoreColumns(
+            'cultural_impact_score', 'rotation_speed',
+            quantized=('cultural_impact_score',),
+        )
         self.current_exhibition: Optional[str] = None
         self.rotation_control = RotationControl()
         self.brain_manager = None
@@ -251,7 +472,7 @@ class ExhibitionManager:
         Returns:
             str: Exhibition ID
         """
-        exhibition_id = str(uuid.uuid4())
+        exhibition_id = new_id()
         
         # Calculate cultural impact score
         cultural_impact_score = self._calculate_cultural_impact(artifacts, theme)
@@ -276,23 +497,35 @@ class ExhibitionManager:
                 optimization = self.brain_manager.optimize_exhibition(exhibition)
                 exhibition.brain_optimization = optimization
             except Exception as e:
-                print(f"⚠️  Exhibition optimization failed: {e}")
+                logger.warning("Exhibition optimization failed: %s", e)
         
         self.exhibitions[exhibition_id] = exhibition
+        self.scores.set(
+            exhibition_id,
+            cultural_impact_score=exhibition.cultural_impact_score,
+            rotation_speed=exhibition.rotation_speed,
+        )
         return exhibition_id
     
     def _calculate_cultural_impact(self, artifacts: List[str], theme: str) -> float:
         """Calculate cultural impact score for an exhibition."""
-        # TODO: Implement sophisticated cultural impact calculation
-        # This would consider artifact significance, theme relevance, and historical context
-        return 0.7  # Placeholder
+        return _cultural_impact(tuple(sorted(artifacts)), theme)
+    
+    def mean_cultural_impact(self) -> float:
+        """Average cultural impact score across all exhibitions."""
+        return self.scores.mean('cultural_impact_score')
+    
+    def top_exhibitions(self, n: int) -> List[Exhibition]:
+        """Return the *n* exhibitions with the highest cultural impact, best first."""
+        exhibitions = self.exhibitions
+        return [exhibitions[i] for i in self.scores.top('cultural_impact_score', n)]
     
     def start_exhibition(self, exhibition_id: str) -> bool:
         """Start an exhibition and begin sphere rotation."""
-        if exhibition_id not in self.exhibitions:
+        exhibition = self.exhibitions.get(exhibition_id)
+        if exhibition is None:
             return False
         
-        exhibition = self.exhibitions[exhibition_id]
         exhibition.status = "active"
         self.current_exhibition = exhibition_id
         self.rotation_control.set_rotation_speed(exhibition.rotation_speed)
@@ -300,10 +533,10 @@ class ExhibitionManager:
     
     def end_exhibition(self, exhibition_id: str) -> bool:
         """End an exhibition and stop sphere rotation."""
-        if exhibition_id not in self.exhibitions:
+        exhibition = self.exhibitions.get(exhibition_id)
+        if exhibition is None:
             return False
         
-        exhibition = self.exhibitions[exhibition_id]
         exhibition.status = "completed"
         if self.current_exhibition == exhibition_id:
             self.current_exhibition = None
@@ -320,17 +553,18 @@ class ExhibitionManager:
         🧠 BRAIN INTEGRATION: Feedback is analyzed by AthenaMist-Blended
         for exhibition optimization and visitor experience improvement.
         """
-        if exhibition_id not in self.exhibitions:
+        exhibition = self.exhibitions.get(exhibition_id)
+        if exhibition is None:
             return False
         
-        self.exhibitions[exhibition_id].visitor_feedback[feedback_type] = rating
+        exhibition.visitor_feedback[feedback_type] = rating
         
         # Analyze feedback with AthenaMist-Blended
         if self.brain_manager and BRAIN_AVAILABLE:
             try:
                 self.brain_manager.analyze_visitor_feedback(exhibition_id, feedback_type, rating)
             except Exception as e:
-                print(f"⚠️  Feedback analysis failed: {e}")
+                logger.warning("Feedback analysis failed: %s", e)
         
         return True
     
@@ -340,11 +574,10 @@ class ExhibitionManager:
         
         🧠 BRAIN INTEGRATION: Provides deep analytics using AthenaMist-Blended.
         """
-        if exhibition_id not in self.exhibitions:
+        exhibition = self.exhibitions.get(exhibition_id)
+        if exhibition is None:
             return {"error": "Exhibition not found"}
         
-        exhibition = self.exhibitions[exhibition_id]
-        
         analytics = {
             "exhibition_id": exhibition_id,
             "name": exhibition.name,
@@ -353,7 +586,7 @@ class ExhibitionManager:
             "cultural_impact_score": exhibition.cultural_impact_score,
             "visitor_feedback": exhibition.visitor_feedback,
             "artifacts_count": len(exhibition.artifacts),
-            "duration_days": (exhibition.end_date - exhibition.start_date).days,
+            "duration_days": exhibition.duration_days,
             "rotation_speed": exhibition.rotation_speed
         }
         
@@ -362,7 +595,7 @@ class ExhibitionManager:
                 brain_analytics = self.brain_manager.get_exhibition_analytics(exhibition_id)
                 analytics["brain_analytics"] = brain_analytics
             except Exception as e:
-                print(f"⚠️  Brain analytics failed: {e}")
+                logger.warning("Brain analytics failed: %s", e)
         
         return analytics
 
@@ -374,6 +607,8 @@ class RotationControl:
     for optimal visitor experience and artifact presentation.
     """
     
+    __slots__ = ('current_speed', 'max_speed', 'acceleration', 'target_speed')
+    
     def __init__(self):
         self.current_speed: float = 0.0
         self.max_speed: float = 2.0  # Rotations per hour
@@ -517,14 +752,14 @@ class CulturalEngine(EdenModuleInterface):
         Returns:
             str: Artifact ID
         """
-        artifact_id = str(uuid.uuid4())
+        artifact_id = new_id()
         artifact = CulturalArtifact(
             artifact_id=artifact_id,
             name=name,
             category=category,
             description=description,
             cultural_significance=cultural_significance,
-            creation_date=datetime.now(),
+            creation_date=coarse_now(),
             origin=origin,
             metadata=metadata,
             preservation_status="active",
@@ -558,8 +793,8 @@ class CulturalEngine(EdenModuleInterface):
         Returns:
             str: Exhibition ID
         """
-        start_date = datetime.now()
-        end_date = datetime.now() + timedelta(days=duration_days)
+        start_date = coarse_now()
+        end_date = start_date + timedelta(days=duration_days)
         
         return self.exhibition_manager.create_exhibition(
             name=name,
@@ -577,7 +812,7 @@ class CulturalEngine(EdenModuleInterface):
             'artifacts_count': len(self.db.artifacts),
             'exhibitions_count': len(self.exhibition_manager.exhibitions),
             'current_exhibition': self.exhibition_manager.current_exhibition,
-            'last_sync_time': datetime.now()
+            'last_sync_time': coarse_now()
         }
 
 # Example usage
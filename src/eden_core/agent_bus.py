@@ -29,33 +29,118 @@ Eden One City - Multi-Agent AI Communication Bus
 - 2024-06-19: Initial scaffold for multi-agent bus.
 """
 
+import json
+import keyword
+import re
 import threading
-import queue
-import uuid
-from typing import Dict, Any, Callable
+from collections import deque
+from dataclasses import make_dataclass
+from typing import Dict, Any, Callable, Optional, Sequence, Tuple
+
+from src.eden_core.id_generator import new_id
+
+# Maximum number of audit records kept in memory per bus
+AUDIT_LOG_CAPACITY = 100_000
+
+def compile_event_builder(event_type: str, fields: Sequence[str]) -> Callable[[Dict[str, Any]], Any]:
+    """Generate a builder turning event data into a slotted, frozen event object.
+
+    The returned function takes the event data mapping and returns an
+    instance with a ``type`` attribute plus one attribute per schema field.
+    Field access is compiled into the builder instead of looped over.
+    """
+    for name in fields:
+        if not name.isidentifier() or keyword.iskeyword(name) or name == 'type':
+            raise ValueError(f'Invalid event schema field: {name!r}')
+    class_name = 'Event_' + re.sub(r'\W', '_', event_type)
+    event_cls = make_dataclass(
+        class_name, ('type', *fields), frozen=True, slots=True
+    )
+    args = ''.join(f', data[{name!r}]' for name in fields)
+    source = f'def build(data):\n    return event_cls(event_type{args})\n'
+    namespace = {'event_cls': event_cls, 'event_type': event_type}
+    exec(source, namespace)
+    return namespace['build']
 
 class Agent:
     """Represents an AI agent participating in the bus."""
 
-    def __init__(self, name: str, public_key: str):
-        """Initialize an agent with a name and public key."""
+    __slots__ = ('name', 'public_key', 'inbox', 'wakeup')
+
+    def __init__(self, name: str, public_key: str, blocking: bool = False):
+        """Initialize an agent with a name and public key.
+
+        The inbox is a single-consumer ``deque``; pass ``blocking=True`` to
+        attach a wake-up event so :meth:`receive` can wait for new messages.
+        """
         self.name = name
         self.public_key = public_key
-        self.inbox = queue.Queue()
+        self.inbox = deque()
+        self.wakeup: Optional[threading.Event] = threading.Event() if blocking else None
+
+    def deliver(self, item: Any):
+        """Append *item* to the inbox and wake a blocked consumer, if any."""
+        self.inbox.append(item)
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def receive(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Pop the oldest inbox item, or return ``None`` if the inbox is empty.
+
+        Agents created with ``blocking=True`` wait up to *timeout* seconds
+        for a message before giving up.
+        """
+        try:
+            return self.inbox.popleft()
+        except IndexError:
+            if self.wakeup is None:
+                return None
+        self.wakeup.clear()
+        # Re-check after clearing so a message delivered in between isn't missed
+        try:
+            return self.inbox.popleft()
+        except IndexError:
+            pass
+        if not self.wakeup.wait(timeout):
+            return None
+        try:
+            return self.inbox.popleft()
+        except IndexError:
+            return None
 
 class AgentBus:
     """Thread-safe communication bus for registered agents."""
 
-    def __init__(self):
-        """Prepare internal registries and synchronization primitives."""
+    def __init__(self,
+                 audit_capacity: int = AUDIT_LOG_CAPACITY,
+                 audit_path: Optional[str] = None,
+                 flush_interval: float = 1.0):
+        """Prepare internal registries and synchronization primitives.
+
+        The in-memory audit log keeps the most recent *audit_capacity*
+        records. When *audit_path* is given, records are also appended to
+        that file as JSON lines by a background flusher every
+        *flush_interval* seconds.
+        """
         self.agents: Dict[str, Agent] = {}
-        self.event_hooks: Dict[str, Callable] = {}
-        self.audit_log = []
+        # Hooks are stored as tuples, replaced on registration, so dispatch can use a snapshot
+        self.event_hooks: Dict[str, Tuple[Callable, ...]] = {}
+        self.event_builders: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self.audit_log = deque(maxlen=audit_capacity)
         self.lock = threading.Lock()
+        self._audit_path = audit_path
+        self._audit_pending: Optional[deque] = deque() if audit_path else None
+        self._audit_stop = threading.Event()
+        self._audit_flusher: Optional[threading.Thread] = None
+        if audit_path:
+            self._audit_flusher = threading.Thread(
+                target=self._run_audit_flusher, args=(flush_interval,), daemon=True
+            )
+            self._audit_flusher.start()
 
     def register_agent(self, agent: Agent) -> str:
         """Register *agent* and return its unique identifier."""
-        agent_id = str(uuid.uuid4())
+        agent_id = new_id()
         with self.lock:
             self.agents[agent_id] = agent
             self._log_action('register_agent', {'agent_id': agent_id, 'name': agent.name})
@@ -68,27 +153,82 @@ class AgentBus:
         """
         # Placeholder: encrypt and authenticate message
         with self.lock:
-            if recipient_id in self.agents:
-                self.agents[recipient_id].inbox.put((sender_id, message))
-                self._log_action('send_message', {'from': sender_id, 'to': recipient_id, 'message': message})
-                return True
-        return False
+            recipient = self.agents.get(recipient_id)
+            if recipient is None:
+                return False
+            self._log_action('send_message', {'from': sender_id, 'to': recipient_id, 'message': message})
+        recipient.deliver((sender_id, message))
+        return True
 
     def broadcast_event(self, event_type: str, data: Any):
-        """Send an event with *data* to all registered agents."""
+        """Send an event with *data* to all registered agents.
+
+        Event types registered with a schema are delivered as a single
+        slotted event object shared by every inbox.
+        """
+        builder = self.event_builders.get(event_type)
+        if builder is not None:
+            payload = ('event', builder(data))
+        else:
+            payload = ('event', {'type': event_type, 'data': data})
+        # Snapshot recipients so delivery happens outside the critical section
         with self.lock:
-            for agent_id, agent in self.agents.items():
-                agent.inbox.put(('event', {'type': event_type, 'data': data}))
+            targets = tuple(self.agents.values())
+            hooks = self.event_hooks.get(event_type)
             self._log_action('broadcast_event', {'event_type': event_type, 'data': data})
-        if event_type in self.event_hooks:
-            self.event_hooks[event_type](data)
-
-    def add_event_hook(self, event_type: str, callback: Callable):
-        """Attach a callback to be invoked for *event_type*."""
-        self.event_hooks[event_type] = callback
+        for agent in targets:
+            agent.deliver(payload)
+        if hooks is not None:
+            for hook in hooks:
+                hook(data)
+
+    def add_event_hook(self, event_type: str, callback: Callable,
+                       schema: Optional[Sequence[str]] = None):
+        """Attach a callback to be invoked for *event_type*.
+
+        Multiple callbacks may be attached to the same event type; they run
+        in registration order. When *schema* lists the fields of the event
+        data, broadcasts of this type use a generated builder instead of a
+        generic dict payload.
+        """
+        builder = compile_event_builder(event_type, schema) if schema is not None else None
+        with self.lock:
+            self.event_hooks[event_type] = self.event_hooks.get(event_type, ()) + (callback,)
+            if builder is not None:
+                self.event_builders[event_type] = builder
         self._log_action('add_event_hook', {'event_type': event_type})
 
+    def flush_audit_log(self):
+        """Write pending audit records to the audit file in one batch."""
+        pending = self._audit_pending
+        if not pending:
+            return
+        lines = []
+        try:
+            while True:
+                lines.append(json.dumps(pending.popleft(), default=str))
+        except IndexError:
+            pass
+        with open(self._audit_path, 'a', encoding='utf-8') as audit_file:
+            audit_file.write('\n'.join(lines) + '\n')
+
+    def close(self):
+        """Stop the background flusher and persist any pending audit records."""
+        self._audit_stop.set()
+        if self._audit_flusher is not None:
+            self._audit_flusher.join()
+            self._audit_flusher = None
+        self.flush_audit_log()
+
+    def _run_audit_flusher(self, interval: float):
+        """Periodically drain pending audit records until :meth:`close`."""
+        while not self._audit_stop.wait(interval):
+            self.flush_audit_log()
+
     def _log_action(self, action: str, data: Any):
         """Record an action in the audit log."""
-        self.audit_log.append({'action': action, 'data': data})
+        record = {'action': action, 'data': data}
+        self.audit_log.append(record)
+        if self._audit_pending is not None:
+            self._audit_pending.append(record)
 
@@ -9,37 +9,191 @@ Eden One City - AINCRAD Integration
 from src.eden_core.aincrad_integration import send_zone_update, listen_for_aincrad_events
 send_zone_update({'zone': 'Zero-G Dome', 'event': 'new_garden', 'details': {...}})
 listen_for_aincrad_events(on_event_callback)
+
+# From async code, updates are coalesced into batched POSTs:
+await send_zone_update_async({'zone': 'Zero-G Dome', 'event': 'new_garden'})
 """
 
+import asyncio
+import logging
+import weakref
+import orjson
 import requests
-import threading
-import time
-# Optional: import websockets if AINCRAD supports it
-# import websockets
+from requests.adapters import HTTPAdapter
+
+from src.eden_core.event_stream import start_listener
 
 AINCRAD_API_URL = 'http://localhost:8000/api/zone_update'  # Update as needed
+AINCRAD_BATCH_URL = 'http://localhost:8000/api/zone_update_batch'  # Update as needed
 AINCRAD_WS_URL = 'ws://localhost:8000/ws/events'  # Update as needed
+AINCRAD_TIMEOUT = 5  # Seconds
+ZONE_BATCH_SIZE = 32  # Max updates per batched POST
+ZONE_BATCH_INTERVAL = 0.05  # Seconds to wait for a batch to fill
+# Numpy values appear in engine analytics payloads. Their datetimes are naive local
+# time (datetime.now()), so they are sent without an offset rather than labelled UTC
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+logger = logging.getLogger(__name__)
+
+# Shared session so zone updates reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'Content-Type': 'application/json'})
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
 
 
 def send_zone_update(data):
     """Send a zone update to AINCRAD via REST API."""
     try:
-        response = requests.post(AINCRAD_API_URL, json=data)
-        print(f'[AINCRAD Integration] Sent zone update: {data}, Response: {response.status_code}')
-        return response.json()
+        payload = orjson.dumps(data, option=JSON_OPTIONS)
+        response = _SESSION.post(AINCRAD_API_URL, data=payload, timeout=AINCRAD_TIMEOUT)
+        logger.debug('Sent zone update: %s, Response: %s', data, response.status_code)
+        return orjson.loads(response.content)
     except Exception as e:
-        print(f'[AINCRAD Integration] Error sending zone update: {e}')
+        logger.warning('Error sending zone update: %s', e)
         return {'status': 'error', 'message': str(e)}
 
 
+class ZoneUpdateBatcher:
+    """Coalesces zone updates into batched POSTs to AINCRAD on an asyncio loop.
+
+    Updates are sent once *batch_size* are queued or *interval* seconds
+    after the first queued update, whichever comes first. Closing the batcher
+    fails every update still waiting for a response with RuntimeError.
+    """
+
+    def __init__(self, batch_size=ZONE_BATCH_SIZE, interval=ZONE_BATCH_INTERVAL):
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue = None
+        self._session = None
+        self._task = None
+        self._closed = False
+
+    async def start(self):
+        """Open the HTTP session and start the background drain task."""
+        import aiohttp
+        self._queue = asyncio.Queue()
+        self._session = aiohttp.ClientSession(
+            headers={'Content-Type': 'application/json'},
+            timeout=aiohttp.ClientTimeout(total=AINCRAD_TIMEOUT),
+        )
+        self._task = asyncio.create_task(self._drain())
+
+    async def submit(self, data):
+        """Queue *data* and wait for the response of the batch it was sent in."""
+        if self._closed:
+            raise RuntimeError('zone update batcher is closed')
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((data, future))
+        return await future
+
+    async def close(self):
+        """Stop the drain task, fail any unsent updates and close the HTTP session."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # The drain task fails pending updates itself, unless it was cancelled before it first ran
+        if self._queue is not None:
+            self._fail_pending([])
+        await self._close_session()
+
+    async def _close_session(self):
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self._post(batch)
+        finally:
+            # Also reached when asyncio.run() cancels leftover tasks at shutdown, so the
+            # session is closed and the loop's registry entry dropped before the loop closes
+            if _batchers.get(loop) is self:
+                del _batchers[loop]
+            self._fail_pending(batch)
+            await self._close_session()
+
+    def _fail_pending(self, batch):
+        """Fail the in-flight *batch* and every queued update so no submit() waits forever."""
+        self._closed = True
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError('zone update batcher closed before the update was sent'))
+
+    async def _post(self, batch):
+        try:
+            payload = orjson.dumps([data for data, _ in batch], option=JSON_OPTIONS)
+            async with self._session.post(AINCRAD_BATCH_URL, data=payload) as response:
+                result = orjson.loads(await response.read())
+        except Exception as e:
+            result = {'status': 'error', 'message': str(e)}
+        # The batch endpoint answers with one result per update when it can
+        per_item = isinstance(result, list) and len(result) == len(batch)
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(result[index] if per_item else result)
+
+
+# One batcher per event loop; weakly keyed so a discarded loop doesn't stay registered
+_batchers = weakref.WeakKeyDictionary()
+
+
+async def send_zone_update_async(data):
+    """Send a zone update to AINCRAD through the running loop's batcher."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        # Registered only once started, so a failed start (e.g. aiohttp missing) leaves nothing behind
+        batcher = ZoneUpdateBatcher()
+        await batcher.start()
+        _batchers[loop] = batcher
+    return await batcher.submit(data)
+
+
+async def close_zone_batcher():
+    """Stop the running loop's zone-update batcher and close its HTTP session."""
+    batcher = _batchers.pop(asyncio.get_running_loop(), None)
+    if batcher is not None:
+        await batcher.close()
+
+
+def submit_zone_update(data, loop):
+    """Send a zone update from synchronous code via the batcher running on *loop*.
+
+    Blocks until the batch is answered, so it must not be called from *loop*'s own thread.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError('submit_zone_update would deadlock on its own loop; await send_zone_update_async instead')
+    return asyncio.run_coroutine_threadsafe(send_zone_update_async(data), loop).result()
+
+
 def listen_for_aincrad_events(callback):
-    """Stub for listening to AINCRAD events via WebSocket (to be implemented if supported)."""
-    def _listen():
-        print('[AINCRAD Integration] Listening for AINCRAD events (stub)...')
-        # Example: Simulate receiving events
-        while True:
-            time.sleep(10)
-            event = {'event': 'zone_rendered', 'details': {'zone': 'Zero-G Dome'}}
-            callback(event)
-    thread = threading.Thread(target=_listen, daemon=True)
-    thread.start() 
\ No newline at end of file
+    """Listen for AINCRAD events via WebSocket and pass each one to *callback*.
+
+    Returns the listener task or future so the caller can cancel it.
+    """
+    return start_listener(AINCRAD_WS_URL, callback, 'AINCRAD')
@@ -0,0 +1,29 @@
+"""
+Eden One City - AthenaMist-Blended Import Path
+
+📋 QUANTUM DOCUMENTATION:
+- Makes the AthenaMist-Blended checkout importable for the engines' brain integration.
+- The checkout location comes from the ATHENAMIST_PATH environment variable, with the
+  historical development path as the default.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.athena_path import add_athena_mist_path
+ATHENA_MIST_PATH = add_athena_mist_path()
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- The path is appended to sys.path only if the directory exists, so a missing checkout
+  isn't probed by every later import in the process.
+"""
+
+import os
+import sys
+
+DEFAULT_ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
+
+
+def add_athena_mist_path() -> str:
+    """Append the AthenaMist-Blended checkout to sys.path if it exists; return its path."""
+    path = os.environ.get("ATHENAMIST_PATH", DEFAULT_ATHENA_MIST_PATH)
+    if os.path.isdir(path) and path not in sys.path:
+        sys.path.append(path)
+    return path
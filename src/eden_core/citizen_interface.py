@@ -14,12 +14,19 @@ Eden One City - Citizen Interface Layer
 
 💡 USAGE EXAMPLES:
 - interface = CitizenInterface()
-- interface.handle_voice_input(audio_data)
-- interface.handle_gesture_input(gesture_data)
-- interface.handle_neural_input(neural_data)
+- await interface.handle_voice_input(audio_data)
+- await interface.handle_gesture_input(gesture_data)
+- await interface.handle_neural_input(neural_data)
+- await interface.close()
 
 ⚡ PERFORMANCE CONSIDERATIONS:
 - Asynchronous, non-blocking input handling.
+- Inputs go to a bounded asyncio queue per modality; one worker per modality
+  processes them in batches of up to 16, so bursts amortize downstream work.
+- install_uvloop() (called by the entrypoint, never on import) switches the
+  process to uvloop's event loop policy when uvloop is available.
+- Queues and workers belong to the loop that first submits input; a later loop
+  (e.g. a second asyncio.run) gets fresh ones.
 
 🔒 SECURITY IMPLICATIONS:
 - All input data is privacy-protected and access-controlled.
@@ -28,42 +35,117 @@ Eden One City - Citizen Interface Layer
 - 2024-06-19: Initial scaffold for citizen interface layer.
 """
 
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop():
+    """Use uvloop's event loop policy process-wide if uvloop is installed; returns whether it was."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+# Maximum number of input records kept in the feedback log
+FEEDBACK_LOG_CAPACITY = 10_000
+# Inputs buffered per modality before handle_*_input applies backpressure
+INPUT_QUEUE_SIZE = 256
+# Maximum inputs a worker takes from its queue in one batch
+INPUT_BATCH_SIZE = 16
+
+MODALITIES = ('voice', 'gesture', 'neural')
+
 class CitizenInterface:
+    __slots__ = ('voice_callbacks', 'gesture_callbacks', 'neural_callbacks', 'feedback_log',
+                 '_queues', '_workers', '_loop')
+
     def __init__(self):
-        self.voice_callbacks = []
-        self.gesture_callbacks = []
-        self.neural_callbacks = []
-        self.feedback_log = []
-
-    def handle_voice_input(self, audio_data):
-        """Process voice input and trigger callbacks."""
-        print(f'[CitizenInterface] Voice input: {audio_data}')
-        for cb in self.voice_callbacks:
-            cb(audio_data)
-        self.feedback_log.append({'type': 'voice', 'data': audio_data})
-
-    def handle_gesture_input(self, gesture_data):
-        """Process gesture input and trigger callbacks."""
-        print(f'[CitizenInterface] Gesture input: {gesture_data}')
-        for cb in self.gesture_callbacks:
-            cb(gesture_data)
-        self.feedback_log.append({'type': 'gesture', 'data': gesture_data})
-
-    def handle_neural_input(self, neural_data):
-        """Process neural input and trigger callbacks."""
-        print(f'[CitizenInterface] Neural input: {neural_data}')
-        for cb in self.neural_callbacks:
-            cb(neural_data)
-        self.feedback_log.append({'type': 'neural', 'data': neural_data})
+        # Callbacks are stored as tuples, rebuilt on registration, for fast iteration
+        self.voice_callbacks = ()
+        self.gesture_callbacks = ()
+        self.neural_callbacks = ()
+        self.feedback_log = deque(maxlen=FEEDBACK_LOG_CAPACITY)
+        # Per-modality queues and one worker task per modality, created on first input
+        # on the running loop and replaced if input later arrives on another loop
+        self._queues = None
+        self._workers = None
+        self._loop = None
+
+    async def handle_voice_input(self, audio_data):
+        """Queue voice input for batched processing and callbacks."""
+        await self._submit('voice', audio_data)
+
+    async def handle_gesture_input(self, gesture_data):
+        """Queue gesture input for batched processing and callbacks."""
+        await self._submit('gesture', gesture_data)
+
+    async def handle_neural_input(self, neural_data):
+        """Queue neural input for batched processing and callbacks."""
+        await self._submit('neural', neural_data)
+
+    async def _submit(self, modality, data):
+        logger.debug('%s input: %s', modality, data)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First input, or the previous loop has gone: its queues and workers died with it
+            self._loop = loop
+            self._queues = {m: asyncio.Queue(maxsize=INPUT_QUEUE_SIZE) for m in MODALITIES}
+            self._workers = [loop.create_task(self._worker(m)) for m in MODALITIES]
+        await self._queues[modality].put((time.monotonic_ns(), data))
+
+    async def _worker(self, modality):
+        queue = self._queues[modality]
+        callbacks_attr = modality + '_callbacks'
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < INPUT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            callbacks = getattr(self, callbacks_attr)
+            for received_ns, data in batch:
+                self.feedback_log.append({'type': modality, 'data': data, 'received_ns': received_ns})
+                try:
+                    for cb in callbacks:
+                        result = cb(data)
+                        if inspect.isawaitable(result):
+                            await result
+                except Exception as e:
+                    logger.warning('%s callback failed: %s', modality, e)
+                finally:
+                    queue.task_done()
+
+    async def drain(self):
+        """Wait until every queued input has been processed."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for queue in self._queues.values():
+            await queue.join()
+
+    async def close(self):
+        """Process queued inputs, then stop the worker tasks."""
+        if self._loop is not asyncio.get_running_loop():
+            self._queues = self._workers = self._loop = None
+            return
+        await self.drain()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queues = self._workers = self._loop = None
 
     def add_voice_callback(self, callback):
-        self.voice_callbacks.append(callback)
+        self.voice_callbacks = self.voice_callbacks + (callback,)
 
     def add_gesture_callback(self, callback):
-        self.gesture_callbacks.append(callback)
+        self.gesture_callbacks = self.gesture_callbacks + (callback,)
 
     def add_neural_callback(self, callback):
-        self.neural_callbacks.append(callback)
+        self.neural_callbacks = self.neural_callbacks + (callback,)
 
     def get_feedback_log(self):
-        return self.feedback_log 
\ No newline at end of file
+        return self.feedback_log
@@ -0,0 +1,39 @@
+"""
+Eden One City - Coarse Clock
+
+📋 QUANTUM DOCUMENTATION:
+- Provides a second-resolution wall clock for status reports and record timestamps.
+- The datetime for the current second is built once and shared by every caller in that second.
+- Converts monotonic_ns() timestamps back to wall-clock datetimes on demand.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.clock import coarse_now
+status = {'last_sync_time': coarse_now()}
+when = datetime_from_monotonic_ns(time.monotonic_ns())
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- One time.time() call per lookup; datetime construction happens at most once per second.
+"""
+
+import time
+from datetime import datetime
+from functools import lru_cache
+
+# Wall-clock time at monotonic zero, captured once at import
+_MONOTONIC_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+
+@lru_cache(maxsize=1)
+def _datetime_for_second(second: int) -> datetime:
+    """Build the local datetime for a whole Unix second."""
+    return datetime.fromtimestamp(second)
+
+
+def coarse_now() -> datetime:
+    """Return the current local time truncated to the second."""
+    return _datetime_for_second(int(time.time()))
+
+
+def datetime_from_monotonic_ns(ns: int) -> datetime:
+    """Return the local datetime for a ``time.monotonic_ns()`` reading."""
+    return datetime.fromtimestamp((_MONOTONIC_EPOCH_NS + ns) / 1e9)
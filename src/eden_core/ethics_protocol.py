@@ -19,6 +19,9 @@ Eden One City - Ethical AI Protocols
 
 ⚡ PERFORMANCE CONSIDERATIONS:
 - Lightweight, real-time ethical checks.
+- Verdicts for every known (zone, action) pair are precomputed into a lookup table
+  whenever policies change (the policies view is read-only); evaluation is a single dict lookup.
+- Decision history is a bounded deque; the oldest records are dropped first.
 
 🔒 SECURITY IMPLICATIONS:
 - All decisions are logged and explainable.
@@ -28,29 +31,88 @@ Eden One City - Ethical AI Protocols
 - 2024-06-19: Initial scaffold for ethical AI protocols.
 """
 
+import logging
+from collections import deque
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of decision and override records kept in the history
+DECISION_HISTORY_CAPACITY = 100_000
+
+APPROVED = (True, 'No ethical conflict detected.')
+REQUIRES_OVERRIDE = (False, 'Action requires override in this context.')
+
 class EthicsProtocol:
+    __slots__ = ('decision_history', '_policies', '_policies_view', '_table')
+
     def __init__(self):
-        self.decision_history = []
+        self.decision_history = deque(maxlen=DECISION_HISTORY_CAPACITY)
+        # Zones are frozensets so membership checks are hashed, not list scans
         self.policies = {
-            'open_portal': {'zones': ['Stargate Plaza'], 'strict': True},
-            'adjust_lighting': {'zones': ['public', 'emotional'], 'strict': False}
+            'open_portal': {'zones': frozenset({'Stargate Plaza'}), 'strict': True},
+            'adjust_lighting': {'zones': frozenset({'public', 'emotional'}), 'strict': False}
         }
 
+    @property
+    def policies(self):
+        """
+        Read-only view of the action policies. Change them by assigning a new mapping
+        or through add_policy / remove_policy, which keep the verdict table in step.
+        """
+        return self._policies_view
+
+    @policies.setter
+    def policies(self, policies):
+        self._policies = {action: self._freeze(policy) for action, policy in policies.items()}
+        self._policies_view = MappingProxyType(self._policies)
+        self._rebuild_table()
+
+    def add_policy(self, action, policy):
+        """Add or replace the policy for *action*."""
+        self._policies[action] = self._freeze(policy)
+        self._rebuild_table()
+
+    def remove_policy(self, action):
+        """Remove the policy for *action* (KeyError if it has none)."""
+        del self._policies[action]
+        self._rebuild_table()
+
+    @staticmethod
+    def _freeze(policy):
+        """Normalize a policy into a read-only mapping with hashed zones and a strict flag."""
+        return MappingProxyType({**policy, 'zones': frozenset(policy.get('zones', ())),
+                                 'strict': policy.get('strict', False)})
+
+    def _rebuild_table(self):
+        """Precompute the verdict for every known (zone, action) pair."""
+        zones = set().union(*(policy['zones'] for policy in self._policies.values()))
+        # Zones outside every policy are approved by _evaluate, which is the lookup default
+        self._table = {(zone, action): self._evaluate(zone, action)
+                       for action in self._policies for zone in zones}
+
+    def _evaluate(self, zone, action):
+        """Return (approved, explanation) for *action* in *zone*."""
+        policy = self._policies.get(action)
+        if policy is None or not policy['strict'] or zone not in policy['zones']:
+            return APPROVED
+        return REQUIRES_OVERRIDE
+
     def evaluate_decision(self, context, action):
         """Evaluate the ethical implications of an action with context-based policy."""
-        strict = self.policies.get(action, {}).get('strict', False)
-        approved = not strict or (context.get('zone') not in self.policies.get(action, {}).get('zones', []))
-        explanation = 'No ethical conflict detected.' if approved else 'Action requires override in this context.'
+        approved, explanation = self._table.get((context.get('zone'), action), APPROVED)
         record = {'context': context, 'action': action, 'approved': approved, 'explanation': explanation}
         self.decision_history.append(record)
-        print(f'[EthicsProtocol] Decision: {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Decision: %s', record)
         return {'approved': approved, 'explanation': explanation}
 
     def request_override(self, user, action):
         """Allow a human to override an AI decision and log it."""
         record = {'override_granted': True, 'user': user, 'action': action}
         self.decision_history.append(record)
-        print(f'[EthicsProtocol] Override: {record}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Override: %s', record)
         return record
 
     def get_decision_history(self):
@@ -0,0 +1,112 @@
+"""
+Eden One City - WebSocket Event Streams
+
+📋 QUANTUM DOCUMENTATION:
+- Receives push events from external systems (AINCRAD, LilithOS) over WebSocket.
+- Reconnects with exponential backoff when a stream drops.
+- All listeners started from synchronous code share one background event-loop thread.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.event_stream import start_listener
+start_listener('ws://localhost:8000/ws/events', on_event_callback, 'AINCRAD')
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- One asyncio task per listener instead of one OS thread; events are pushed, not polled.
+- Dispatched callbacks are bounded (MAX_DISPATCHED in flight) and their errors logged.
+- Malformed frames and callback errors are logged and skipped per event; only
+  connection errors trigger a reconnect.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_INITIAL = 1.0  # Seconds before the first reconnect attempt
+RECONNECT_MAX = 60.0  # Upper bound for reconnect backoff
+MAX_DISPATCHED = 64  # Dispatched callbacks in flight per listener before the reader waits
+
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop():
+    """Return the shared background event loop used by synchronous callers."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever, name='event-stream-loop', daemon=True
+            ).start()
+        return _background_loop
+
+
+async def stream_events(url, callback, label, dispatch=False):
+    """Pass each JSON event received from *url* to *callback*, reconnecting on failure.
+
+    *callback* may be a plain function or a coroutine function. By default
+    plain callbacks run inline on the reader, which suits cheap hand-offs
+    such as queueing an event; set *dispatch* to run them on the loop's
+    default executor instead, so a slow callback cannot stall the stream;
+    at most MAX_DISPATCHED run at once, after which the reader waits.
+    """
+    import websockets
+    loop = asyncio.get_running_loop()
+    in_flight = asyncio.Semaphore(MAX_DISPATCHED)
+
+    def dispatched(future):
+        in_flight.release()
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning('%s event callback failed: %s', label, future.exception())
+    delay = RECONNECT_INITIAL
+    while True:
+        try:
+            async with websockets.connect(url) as ws:
+                logger.info('Listening for %s events on %s', label, url)
+                delay = RECONNECT_INITIAL
+                async for raw in ws:
+                    # A bad frame or a failing callback costs that event only, not the connection
+                    try:
+                        event = orjson.loads(raw)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning('%s event stream: dropping malformed frame: %s', label, e)
+                        continue
+                    if dispatch:
+                        await in_flight.acquire()
+                        loop.run_in_executor(None, callback, event).add_done_callback(dispatched)
+                        continue
+                    try:
+                        result = callback(event)
+                        if inspect.isawaitable(result):
+                            await result
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.warning('%s event callback failed: %s', label, e)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning('%s event stream error: %s; reconnecting in %.0fs', label, e, delay)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RECONNECT_MAX)
+
+
+def start_listener(url, callback, label, dispatch=False):
+    """Start streaming events from *url* to *callback* (see :func:`stream_events`).
+
+    Inside a running event loop the listener is scheduled as a task on that
+    loop; otherwise it runs on the shared background loop. Returns the task
+    or concurrent future so the caller can cancel it.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run_coroutine_threadsafe(
+            stream_events(url, callback, label, dispatch), get_background_loop()
+        )
+    return loop.create_task(stream_events(url, callback, label, dispatch))
@@ -0,0 +1,29 @@
+"""
+Eden One City - Record ID Generator
+
+📋 QUANTUM DOCUMENTATION:
+- Generates unique, compact identifiers for internal records (artifacts, exhibitions, agents).
+- IDs combine a random per-process prefix with a monotonic counter.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.id_generator import new_id
+artifact_id = new_id()
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- No entropy syscall or UUID formatting per ID; a single counter increment and hex format.
+
+🔒 SECURITY IMPLICATIONS:
+- IDs are unique but predictable within a process; use uuid4 where unguessability matters.
+"""
+
+import itertools
+import uuid
+
+# Random per-process prefix keeps IDs unique across processes and restarts
+_PREFIX = uuid.uuid4().hex[:8]
+_counter = itertools.count()
+
+
+def new_id() -> str:
+    """Return a new unique 20-character hexadecimal record ID."""
+    return f"{_PREFIX}{next(_counter):012x}"
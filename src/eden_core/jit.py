@@ -0,0 +1,31 @@
+"""
+Eden One City - Optional JIT Compilation
+
+📋 QUANTUM DOCUMENTATION:
+- Exposes Numba's ``njit`` and ``prange`` when Numba is installed.
+- Falls back to a no-op decorator and ``range`` so kernels run as plain Python/NumPy otherwise.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.jit import njit
+
+@njit(cache=True)
+def kernel(values):
+    ...
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- Kernels should be written in the Numba-compatible subset (scalars, NumPy arrays)
+  so they compile when Numba is present and stay correct when it is not.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -10,47 +10,143 @@ from src.eden_core.lilithos_integration import log_system_event, register_servic
 register_service({'service': 'EdenOneCity', 'type': 'city_module'})
 log_system_event({'event': 'security_alert', 'level': 'critical', 'details': {...}})
 listen_for_lilithos_events(on_event_callback)
+flush_system_events()  # Before shutdown, to send any queued events
 """
 
+import logging
+import os
+import queue
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import time
 
+from src.eden_core.event_stream import start_listener
+
+logger = logging.getLogger(__name__)
+
 LILITHOS_API_URL = 'http://localhost:9000/api/system_event'  # Update as needed
+LILITHOS_BATCH_URL = 'http://localhost:9000/api/system_events'  # Update as needed
 LILITHOS_SERVICE_URL = 'http://localhost:9000/api/register_service'  # Update as needed
 LILITHOS_WS_URL = 'ws://localhost:9000/ws/events'  # Update as needed
+LILITHOS_BATCH_SIZE = int(os.environ.get('LILITHOS_BATCH_SIZE', 50))  # Max events per bulk POST
+LILITHOS_BATCH_MS = int(os.environ.get('LILITHOS_BATCH_MS', 50))  # Max wait for a batch to fill
+LILITHOS_TIMEOUT = (1, 5)  # Connect and read timeouts in seconds
+
+# Shared keep-alive session, also used by the batcher's flush thread
+_SESSION = requests.Session()
+_SESSION.headers.update({'Connection': 'keep-alive'})
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+
+class _EventBatcher:
+    """Coalesces system events into bulk POSTs sent from one background thread.
+
+    A batch is sent once *max_batch* events are queued or *max_wait_ms*
+    milliseconds after its first event, whichever comes first.
+    """
+
+    def __init__(self, url, max_batch, max_wait_ms):
+        self.url = url
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def put(self, event):
+        """Queue *event* for the next batch."""
+        if self._thread is None:
+            self._start()
+        self._queue.put(event)
+
+    def flush(self, timeout=None):
+        """Send all queued events now; return ``False`` if *timeout* expires first."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='lilithos-batcher', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch, waiters = [], []
+            self._collect(self._queue.get(), batch, waiters)
+            deadline = time.monotonic() + self.max_wait
+            # A pending flush() sends immediately instead of waiting for the batch to fill
+            while len(batch) < self.max_batch and not waiters:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._collect(self._queue.get(timeout=remaining), batch, waiters)
+                except queue.Empty:
+                    break
+            if batch:
+                self._post(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    @staticmethod
+    def _collect(item, batch, waiters):
+        if isinstance(item, threading.Event):
+            waiters.append(item)
+        else:
+            batch.append(item)
+
+    def _post(self, batch):
+        try:
+            response = _SESSION.post(self.url, json=batch, timeout=LILITHOS_TIMEOUT)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Logged %d system events, Response: %s', len(batch), response.status_code)
+        except Exception as e:
+            logger.warning('Error logging system events: %s', e)
+
+
+_batcher = _EventBatcher(LILITHOS_BATCH_URL, LILITHOS_BATCH_SIZE, LILITHOS_BATCH_MS)
 
 
 def register_service(service_data):
     """Register a service with LilithOS via REST API."""
     try:
-        response = requests.post(LILITHOS_SERVICE_URL, json=service_data)
-        print(f'[LilithOS Integration] Registered service: {service_data}, Response: {response.status_code}')
+        response = _SESSION.post(LILITHOS_SERVICE_URL, json=service_data, timeout=LILITHOS_TIMEOUT)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Registered service: %s, Response: %s', service_data, response.status_code)
         return response.json()
     except Exception as e:
-        print(f'[LilithOS Integration] Error registering service: {e}')
+        logger.warning('Error registering service: %s', e)
         return {'status': 'error', 'message': str(e)}
 
 
 def log_system_event(event):
-    """Log a system event to LilithOS via REST API."""
-    try:
-        response = requests.post(LILITHOS_API_URL, json=event)
-        print(f'[LilithOS Integration] Logged system event: {event}, Response: {response.status_code}')
-        return response.json()
-    except Exception as e:
-        print(f'[LilithOS Integration] Error logging system event: {e}')
-        return {'status': 'error', 'message': str(e)}
+    """Queue a system event for the next bulk submission to LilithOS."""
+    _batcher.put(event)
+    return {'status': 'queued'}
 
 
-def listen_for_lilithos_events(callback):
-    """Stub for listening to LilithOS events via WebSocket (to be implemented if supported)."""
-    def _listen():
-        print('[LilithOS Integration] Listening for LilithOS events (stub)...')
-        # Example: Simulate receiving events
-        while True:
-            time.sleep(15)
-            event = {'event': 'resource_update', 'details': {'service': 'EdenOneCity', 'status': 'healthy'}}
-            callback(event)
-    thread = threading.Thread(target=_listen, daemon=True)
-    thread.start() 
\ No newline at end of file
+def flush_system_events(timeout=None):
+    """Send all queued system events to LilithOS now, e.g. before shutdown."""
+    return _batcher.flush(timeout)
+
+
+def listen_for_lilithos_events(callback, dispatch=False):
+    """Listen for LilithOS events via WebSocket and pass each one to *callback*.
+
+    *callback* may be a plain function or a coroutine function. Plain
+    callbacks are called synchronously on the reader, with no thread hop:
+    forwarding events to :func:`log_system_event` only enqueues them, so no
+    dispatch is needed. Pass ``dispatch=True`` for callbacks that block.
+    All listeners started from synchronous code share one background event
+    loop. Returns the listener task or future so the caller can cancel it.
+    """
+    return start_listener(LILITHOS_WS_URL, callback, 'LilithOS', dispatch)
@@ -0,0 +1,37 @@
+"""
+Eden One City - Rate-Limited Warnings
+
+📋 QUANTUM DOCUMENTATION:
+- Emits a logger's warnings at most once per WARN_INTERVAL seconds and drops the rest.
+- Each logger has its own window, so a failure storm in one engine doesn't silence another.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.log_limit import warn_limited
+warn_limited(logger, "Brain sync failed: %s", error)
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- One time.monotonic() call and one dict lookup per suppressed warning; no lock is taken,
+  so racing threads may occasionally both emit within one window.
+"""
+
+import logging
+import time
+
+# At most one warning per logger per this many seconds, so a failure storm doesn't flood the log
+WARN_INTERVAL = 1.0
+
+# Logger name -> time.monotonic() of its last emitted warning
+_last_warned = {}
+
+
+def warn_limited(logger: logging.Logger, msg: str, *args) -> bool:
+    """Log ``msg % args`` as a warning on *logger* unless it warned within WARN_INTERVAL.
+
+    Returns whether the warning was emitted.
+    """
+    now = time.monotonic()
+    if now - _last_warned.get(logger.name, float('-inf')) <= WARN_INTERVAL:
+        return False
+    _last_warned[logger.name] = now
+    logger.warning(msg, *args)
+    return True
@@ -0,0 +1,65 @@
+"""
+Eden One City - Background Log Emission
+
+📋 QUANTUM DOCUMENTATION:
+- Moves log record emission off the calling thread with a QueueHandler/QueueListener pair.
+- The root logger's handlers are re-homed behind one listener thread; callers only enqueue.
+
+💡 USAGE EXAMPLE:
+from src.eden_core.log_queue import start_queue_logging
+logging.basicConfig(level=logging.INFO)
+start_queue_logging()
+
+⚡ PERFORMANCE CONSIDERATIONS:
+- Hot paths pay for a queue put, never for formatting or a stream write.
+- Combine with ``logger.isEnabledFor`` guards so disabled levels cost a cached flag check.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+_lock = threading.Lock()
+
+
+def start_queue_logging(handlers=None):
+    """Route root-logger output through a background listener thread.
+
+    *handlers* defaults to the root logger's current handlers, which are
+    detached from the root and attached to the listener instead. Calling
+    this again while a listener is running returns that listener.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+        root = logging.getLogger()
+        if handlers is None:
+            handlers = list(root.handlers)
+        for handler in handlers:
+            root.removeHandler(handler)
+        log_queue = queue.SimpleQueue()
+        root.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_queue_logging)
+        return _listener
+
+
+def stop_queue_logging():
+    """Drain pending records and restore the listener's handlers on the root logger."""
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        listener, _listener = _listener, None
+        listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, QueueHandler):
+                root.removeHandler(handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
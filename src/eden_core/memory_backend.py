@@ -15,10 +15,18 @@ Eden One City - Memory Backend Abstraction
 💡 USAGE EXAMPLES:
 - memory_backend = MemoryBackend(backend='redis')
 - memory_backend.store(key, value)
+- memory_backend.store_many({key: value, ...}); memory_backend.retrieve_many([key, ...])
 - memory_backend.feedback_loop(hook)
 
 ⚡ PERFORMANCE CONSIDERATIONS:
 - Asynchronous, low-latency memory operations.
+- All Redis backends share one connection pool; bulk operations use one round-trip
+  (a non-transactional pipeline for writes, MGET for reads).
+- Feedback hooks run on a small bounded thread pool, so a slow hook never blocks the caller.
+- store/retrieve are bound to the backend implementation at construction (no per-call dispatch).
+- Redis values are serialized with msgpack: compact binary payloads that round-trip
+  numbers, strings, lists and dicts without str() formatting.
+- Bound-method hooks are held weakly and drop out once their owner is collected.
 
 🔒 SECURITY IMPLICATIONS:
 - All data is encrypted in transit and at rest.
@@ -28,38 +36,130 @@ Eden One City - Memory Backend Abstraction
 - 2024-06-19: Initial scaffold for memory backend abstraction.
 """
 
-from typing import Any, Callable
+import logging
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on open Redis connections shared by all MemoryBackend instances
+REDIS_MAX_CONNECTIONS = 32
+# Worker threads used to run feedback hooks per MemoryBackend
+FEEDBACK_HOOK_WORKERS = 4
+
+_redis_pool = None
+
+def _get_redis_pool():
+    """Return the process-wide Redis connection pool, creating it on first use."""
+    global _redis_pool
+    if _redis_pool is None:
+        import redis
+        _redis_pool = redis.ConnectionPool(max_connections=REDIS_MAX_CONNECTIONS)
+    return _redis_pool
+
+def _log_hook_failure(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning('Feedback hook failed: %s', future.exception())
 
 class MemoryBackend:
+    __slots__ = ('backend', 'client', 'store', 'retrieve', 'store_many', 'retrieve_many',
+                 '_packb', '_unpackb', '_hook_refs', '_hook_exec')
+
     def __init__(self, backend: str = 'redis'):
         self.backend = backend
+        # The backend never changes, so its operations are bound once here
+        # instead of dispatching on self.backend per call
         if backend == 'redis':
+            import msgpack
             import redis
-            self.client = redis.StrictRedis()
+            self.client = redis.StrictRedis(connection_pool=_get_redis_pool())
+            self._packb = msgpack.packb
+            self._unpackb = msgpack.unpackb
+            self.store = self._redis_store
+            self.retrieve = self._redis_retrieve
+            self.store_many = self._redis_store_many
+            self.retrieve_many = self._redis_retrieve_many
         elif backend == 'mistral':
             # Placeholder for Mistral integration
             self.client = None
+            self.store = self._mistral_store
+            self.retrieve = self._mistral_retrieve
+            self.store_many = self._mistral_store_many
+            self.retrieve_many = self._mistral_retrieve_many
         else:
             raise ValueError('Unsupported backend')
-        self.feedback_hooks = []
-
-    def store(self, key: str, value: Any):
-        if self.backend == 'redis':
-            self.client.set(key, value)
-        elif self.backend == 'mistral':
-            # Implement Mistral storage
-            pass
-
-    def retrieve(self, key: str) -> Any:
-        if self.backend == 'redis':
-            return self.client.get(key)
-        elif self.backend == 'mistral':
-            # Implement Mistral retrieval
-            return None
+        # Weak references for bound methods, strong ones otherwise (plain functions, lambdas)
+        self._hook_refs = []
+        self._hook_exec = ThreadPoolExecutor(max_workers=FEEDBACK_HOOK_WORKERS, thread_name_prefix='mem-hook')
+
+    def _redis_store(self, key: str, value: Any):
+        self.client.set(key, self._packb(value, use_bin_type=True))
+
+    def _redis_retrieve(self, key: str) -> Any:
+        raw = self.client.get(key)
+        return None if raw is None else self._unpackb(raw, raw=False)
+
+    def _redis_store_many(self, items: Dict[str, Any]):
+        """Store every key/value pair in *items* in a single round-trip."""
+        packb = self._packb
+        with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, packb(value, use_bin_type=True))
+            pipe.execute()
+
+    def _redis_retrieve_many(self, keys: Iterable[str]) -> List[Any]:
+        """Retrieve the values of *keys* in a single round-trip, ``None`` for missing keys."""
+        keys = list(keys)
+        if not keys:
+            return []
+        unpackb = self._unpackb
+        return [None if raw is None else unpackb(raw, raw=False) for raw in self.client.mget(keys)]
+
+    def _mistral_store(self, key: str, value: Any):
+        # Implement Mistral storage
+        pass
+
+    def _mistral_retrieve(self, key: str) -> Any:
+        # Implement Mistral retrieval
+        return None
+
+    def _mistral_store_many(self, items: Dict[str, Any]):
+        # Implement Mistral bulk storage
+        pass
+
+    def _mistral_retrieve_many(self, keys: Iterable[str]) -> List[Any]:
+        # Implement Mistral bulk retrieval
+        return [None for _ in keys]
 
     def feedback_loop(self, hook: Callable):
-        self.feedback_hooks.append(hook)
+        if hasattr(hook, '__self__') and hasattr(hook, '__func__'):
+            ref = weakref.WeakMethod(hook)
+        else:
+            ref = lambda hook=hook: hook
+        self._hook_refs.append(ref)
+
+    @property
+    def feedback_hooks(self) -> List[Callable]:
+        """Registered hooks whose owners are still alive."""
+        hooks = []
+        live = []
+        for ref in self._hook_refs:
+            hook = ref()
+            if hook is not None:
+                hooks.append(hook)
+                live.append(ref)
+        if len(live) != len(self._hook_refs):
+            self._hook_refs = live
+        return hooks
+
+    def trigger_feedback(self, key: str, value: Any) -> List[Future]:
+        """Run every live hook with (key, value) on the hook pool and return their futures."""
+        futures = [self._hook_exec.submit(hook, key, value) for hook in self.feedback_hooks]
+        for future in futures:
+            future.add_done_callback(_log_hook_failure)
+        return futures
 
-    def trigger_feedback(self, key: str, value: Any):
-        for hook in self.feedback_hooks:
-            hook(key, value) 
\ No newline at end of file
+    def shutdown(self):
+        """Stop the hook pool, cancelling hooks that have not started yet."""
+        self._hook_exec.shutdown(wait=False, cancel_futures=True)
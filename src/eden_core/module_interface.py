@@ -7,6 +7,7 @@ Quantum-detailed interface for all plug-and-play system modules.
 - Defines the standard interface for all core modules (engines) in Eden One City.
 - Ensures plug-and-play compatibility, dynamic loading/unloading, and unified system orchestration.
 - All modules must implement this interface for system integration.
+- EdenModuleProtocol describes the same contract structurally, for modules that do not subclass it.
 
 🧩 FEATURE CONTEXT:
 - Enables modular, scalable, and adaptive architecture.
@@ -31,6 +32,7 @@ Quantum-detailed interface for all plug-and-play system modules.
 """
 
 from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 class EdenModuleInterface(ABC):
     """
@@ -65,4 +67,19 @@ class EdenModuleInterface(ABC):
         Returns:
             bool: Success status.
         """
-        pass 
\ No newline at end of file
+        pass
+
+
+@runtime_checkable
+class EdenModuleProtocol(Protocol):
+    """
+    Structural type for modules, for static checking and debug-time validation.
+
+    Runtime ``isinstance`` checks against a Protocol are slow; keep them
+    behind ``if __debug__:`` and dispatch on the methods directly.
+    """
+    def register(self, system_context) -> bool: ...
+
+    def process(self, input_data) -> dict: ...
+
+    def shutdown(self) -> bool: ...
@@ -14,30 +14,307 @@ Eden One City - Performance & Security Hooks
 
 💡 USAGE EXAMPLES:
 - perf = PerformanceSecurity()
+- perf = PerformanceSecurity(audit_path='audit.log', audit_cipher=cipher.encrypt)
 - perf.log_latency('engine', ms)
 - perf.log_energy('device', joules)
 - perf.audit('action', data)
+- perf.latency_percentile(99)
+- perf.latency_p99(window=256); perf.latency_ewma(alpha=0.1)
 
 ⚡ PERFORMANCE CONSIDERATIONS:
 - Minimal overhead, high-frequency logging.
+- Latency samples are stored column-wise in growable NumPy arrays so aggregates are vectorized.
+- Each thread buffers samples locally and flushes them to the columns in chunks of 256;
+  a background timer flushes partial buffers every 50 ms. A thread's buffer is flushed
+  and dropped when the thread exits.
+- Latency timestamps come from the monotonic clock as int64 nanoseconds since construction.
+- Rolling p99 and EWMA run as Numba kernels over the latency column when Numba is installed.
+- With an audit path, one writer thread drains audit records in batches of up to 256
+  (or every 50 ms): one serialization, one cipher call and one write() per batch, and
+  an fdatasync every 16 batches. A batch that fails to encrypt or write is logged and
+  dropped without stopping the writer.
 
 🔒 SECURITY IMPLICATIONS:
 - All logs are encrypted and access-controlled.
+- Persisted audit batches pass through *audit_cipher* (bytes -> bytes) when given; encrypted
+  batches are written as 4-byte big-endian length-prefixed frames, plain ones as JSON lines.
 
 📜 CHANGELOG:
 - 2024-06-19: Initial scaffold for performance and security hooks.
 """
 
+import logging
+import os
+import queue
+import sys
+import threading
 import time
+import weakref
+
+import numpy as np
+import orjson
+
+from src.eden_core.jit import njit, prange
+
+logger = logging.getLogger(__name__)
+
+# Initial number of latency samples the columnar store can hold before growing
+LATENCY_INITIAL_CAPACITY = 1 << 16
+# Samples a thread buffers before copying them into the shared columns
+LATENCY_FLUSH_SIZE = 256
+# Seconds between background flushes of partially filled thread buffers
+LATENCY_FLUSH_INTERVAL = 0.05
+# Maximum audit records serialized, encrypted and written as one batch
+AUDIT_BATCH_SIZE = 256
+# Seconds the audit writer waits for a batch to fill
+AUDIT_BATCH_WAIT = 0.05
+# Batches written between fdatasync calls on the audit file
+AUDIT_SYNC_EVERY = 16
+# Default seconds flush_audit waits for the audit writer
+AUDIT_FLUSH_TIMEOUT = 5.0
+
+_AUDIT_STOP = object()
+
+
+class _BufferOwner:
+    """Thread-local token whose collection at thread exit releases that thread's latency buffer."""
+    __slots__ = ('__weakref__',)
+
+
+def _release_lat_buffer(ref, key):
+    perf = ref()
+    if perf is None:
+        return
+    with perf._lock:
+        buf = perf._lat_buffers.pop(key, None)
+    if buf:
+        perf._flush_lat(buf)
+
+# fdatasync skips metadata updates; not every platform (e.g. macOS) provides it
+_sync_fd = getattr(os, 'fdatasync', os.fsync)
+
+@njit(parallel=True, cache=True)
+def _rolling_p99(values, window):
+    """p99 of each sample's trailing *window* (shorter at the start of the series)."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        start = max(0, i - window + 1)
+        out[i] = np.percentile(values[start:i + 1], 99.0)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _ewma(values, alpha):
+    """Exponentially weighted moving average, seeded with the first sample."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    acc = values[0]
+    for i in range(n):
+        acc = alpha * values[i] + (1.0 - alpha) * acc
+        out[i] = acc
+    return out
+
+
+def _serialize_audit_batch(batch):
+    return b''.join(orjson.dumps(record, default=str, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+                    for record in batch)
+
+
+def _write_audit(audit_queue, fd, cipher):
+    """Drain *audit_queue* into *fd* in batches until the stop sentinel arrives."""
+    # Module-level rather than a method so the thread holds no reference to its owner
+    batches_since_sync = 0
+    stopping = False
+    while not stopping:
+        batch, waiters = [], []
+        item = audit_queue.get()
+        deadline = time.monotonic() + AUDIT_BATCH_WAIT
+        while True:
+            if item is _AUDIT_STOP:
+                stopping = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                batch.append(item)
+            # A pending flush or stop writes immediately instead of waiting for the batch to fill
+            if stopping or waiters or len(batch) >= AUDIT_BATCH_SIZE:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = audit_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        try:
+            if batch:
+                payload = _serialize_audit_batch(batch)
+                if cipher is not None:
+                    payload = cipher(payload)
+                    payload = len(payload).to_bytes(4, 'big') + payload
+                os.write(fd, payload)
+                batches_since_sync += 1
+            if batches_since_sync and (stopping or waiters or batches_since_sync >= AUDIT_SYNC_EVERY):
+                _sync_fd(fd)
+                batches_since_sync = 0
+        except Exception:
+            # A failed batch (cipher or I/O error) is dropped; the writer keeps serving later ones
+            logger.exception('Could not write audit batch of %d records', len(batch))
+        finally:
+            for waiter in waiters:
+                waiter.set()
+    os.close(fd)
+
 
 class PerformanceSecurity:
-    def __init__(self):
-        self.latency_logs = []
+    # __weakref__ lets the background flusher hold a weak reference to the instance
+    __slots__ = ('_latency_ms', '_latency_ts', '_latency_comp', '_lat_n', '_t0', '_mono0',
+                 '_lock', '_tls', '_lat_buffers', '_flusher', 'energy_logs', 'audit_logs',
+                 '_now', '_wall', '_append_energy', '_append_audit',
+                 '_audit_q', '_audit_thread', '__weakref__')
+    def __init__(self, audit_path=None, audit_cipher=None):
+        """Set up in-memory logs; with *audit_path*, audit records are also appended to that file.
+
+        *audit_cipher*, if given, is called once per written batch with the
+        serialized bytes and must return the bytes to store.
+        """
+        # Latency samples as parallel columns; only the first _lat_n rows are valid
+        self._latency_ms = np.empty(LATENCY_INITIAL_CAPACITY, dtype=np.float64)
+        # Nanoseconds since construction; wall time is _t0 + offset
+        self._latency_ts = np.empty(LATENCY_INITIAL_CAPACITY, dtype=np.int64)
+        self._latency_comp = np.empty(LATENCY_INITIAL_CAPACITY, dtype=object)
+        self._lat_n = 0
+        self._t0 = time.time_ns()
+        self._mono0 = time.monotonic_ns()
+        self._lock = threading.Lock()
+        self._tls = threading.local()
+        # Live thread buffers keyed by id(buffer); entries are removed when their thread exits
+        self._lat_buffers = {}
+        self._flusher = None
         self.energy_logs = []
         self.audit_logs = []
+        # Bound once so the logging calls below are local loads, not module/attribute lookups
+        self._now = time.monotonic_ns
+        self._wall = time.time
+        self._append_energy = self.energy_logs.append
+        self._append_audit = self.audit_logs.append
+        self._audit_q = None
+        self._audit_thread = None
+        if audit_path is not None:
+            fd = os.open(audit_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            self._audit_q = queue.SimpleQueue()
+            self._audit_thread = threading.Thread(target=_write_audit, args=(self._audit_q, fd, audit_cipher),
+                                                  name='audit-writer', daemon=True)
+            self._audit_thread.start()
     def log_latency(self, component, ms):
-        self.latency_logs.append({'component': component, 'latency_ms': ms, 'timestamp': time.time()})
+        # Converted here so a bad value fails at the call site instead of in the background flush
+        ms = float(ms)
+        buf = getattr(self._tls, 'lat', None)
+        if buf is None:
+            buf = self._new_buf()
+        buf.append((component, ms, self._now() - self._mono0))
+        if len(buf) >= LATENCY_FLUSH_SIZE:
+            self._flush_lat(buf)
+    def flush_latency(self):
+        """Copy every thread's buffered latency samples into the shared columns."""
+        with self._lock:
+            buffers = tuple(self._lat_buffers.values())
+        for buf in buffers:
+            self._flush_lat(buf)
+    def _new_buf(self):
+        buf = self._tls.lat = []
+        owner = self._tls.owner = _BufferOwner()
+        weakref.finalize(owner, _release_lat_buffer, weakref.ref(self), id(buf))
+        with self._lock:
+            self._lat_buffers[id(buf)] = buf
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, args=(weakref.ref(self),),
+                                                 name='latency-flusher', daemon=True)
+                self._flusher.start()
+        return buf
+    def _flush_lat(self, buf):
+        with self._lock:
+            k = len(buf)
+            if not k:
+                return
+            # Only the first k rows are taken; the owning thread may append more meanwhile
+            rows = buf[:k]
+            del buf[:k]
+            n0 = self._lat_n
+            n1 = n0 + k
+            while n1 > len(self._latency_ms):
+                self._grow_latency()
+            components, latencies, timestamps = zip(*rows)
+            self._latency_ms[n0:n1] = latencies
+            self._latency_ts[n0:n1] = timestamps
+            self._latency_comp[n0:n1] = [sys.intern(c) for c in components]
+            self._lat_n = n1
+    @staticmethod
+    def _flush_periodically(ref):
+        # Holds only a weak reference so an unused PerformanceSecurity can still be collected
+        while True:
+            time.sleep(LATENCY_FLUSH_INTERVAL)
+            perf = ref()
+            if perf is None:
+                return
+            perf.flush_latency()
+            del perf
+    def _grow_latency(self):
+        capacity = 2 * len(self._latency_ms)
+        for name in ('_latency_ms', '_latency_ts', '_latency_comp'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._lat_n] = old[:self._lat_n]
+            setattr(self, name, new)
+    def latency_percentile(self, p):
+        """Return the *p*-th percentile of all logged latencies in ms (NaN if none)."""
+        self.flush_latency()
+        if not self._lat_n:
+            return float('nan')
+        return float(np.percentile(self._latency_ms[:self._lat_n], p))
+    def latency_p99(self, window):
+        """Return the rolling p99 latency (ms) over each sample's trailing *window* samples."""
+        if window < 1:
+            raise ValueError(f'window must be at least 1, got {window}')
+        self.flush_latency()
+        return _rolling_p99(self._latency_ms[:self._lat_n], window)
+    def latency_ewma(self, alpha):
+        """Return the exponentially weighted moving average of latencies (ms) with factor *alpha*."""
+        self.flush_latency()
+        return _ewma(self._latency_ms[:self._lat_n], alpha)
+    @property
+    def latency_logs(self):
+        """Latency samples as a list of ``{'component', 'latency_ms', 'timestamp'}`` dicts."""
+        self.flush_latency()
+        n = self._lat_n
+        timestamps = (self._t0 + self._latency_ts[:n]) / 1e9
+        return [{'component': c, 'latency_ms': float(ms), 'timestamp': float(ts)}
+                for c, ms, ts in zip(self._latency_comp[:n], self._latency_ms[:n], timestamps)]
     def log_energy(self, device, joules):
-        self.energy_logs.append({'device': device, 'energy_joules': joules, 'timestamp': time.time()})
+        self._append_energy({'device': device, 'energy_joules': joules, 'timestamp': self._wall()})
     def audit(self, action, data):
-        self.audit_logs.append({'action': action, 'data': data, 'timestamp': time.time()}) 
\ No newline at end of file
+        record = {'action': action, 'data': data, 'timestamp': self._wall()}
+        self._append_audit(record)
+        if self._audit_q is not None:
+            self._audit_q.put(record)
+    def flush_audit(self, timeout=AUDIT_FLUSH_TIMEOUT):
+        """Write and sync all queued audit records; return ``False`` if *timeout* expires first
+        or the audit writer is no longer running."""
+        if self._audit_q is None:
+            return True
+        if not self._audit_thread.is_alive():
+            return False
+        done = threading.Event()
+        self._audit_q.put(done)
+        return done.wait(timeout)
+    def close_audit(self):
+        """Write any queued audit records, sync and close the audit file."""
+        if self._audit_thread is None:
+            return
+        self._audit_q.put(_AUDIT_STOP)
+        self._audit_thread.join()
+        self._audit_q = None
+        self._audit_thread = None 
\ No newline at end of file
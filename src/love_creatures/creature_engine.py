@@ -35,6 +35,32 @@ with human residents. It monitors creature health and optimizes bonding experien
 - Efficient bond strength calculations
 - Behavioral pattern analysis
 - Genetic stability tracking
+- Creatures and bonds live in CreatureTable / BondTable: numeric fields are
+  parallel NumPy columns, and Creature / EmotionalBond are slotted views onto a row
+- Bond interaction history is a ring buffer of the last INTERACTION_HISTORY_CAPACITY
+  interactions, so memory per bond stays bounded
+- Creature health is a float32 vector in HEALTH_METRICS order; names are attached
+  only when results are returned, and any other reported metrics are kept by name
+  in a side dict
+- HealthMonitor keeps metrics as an (N, metrics) matrix; check_alerts_all flags
+  every creature with one broadcast comparison
+- Each creature keeps a running bond-strength sum and count, so its average bond
+  strength is O(1); Creature.bond_strength is resolved from the bonds on demand
+  instead of being written on every interaction
+- strengthen_bonds_batch applies one tick of interactions to many bonds in place
+  on the bond columns
+- Creature and bond IDs come from new_id() (prefix + counter) rather than uuid4
+- Creature analytics are a frozen, slotted CreatureAnalytics; to_dict() builds the
+  dict only for consumers that need one
+- CreatureManager and HealthMonitor are picked at import from brain-on and
+  brain-off variants, so the local-only path has no brain checks at all
+- Brain-failure warnings go through logging, rate-limited per logger by warn_limited()
+- Bonding potential is memoized on (emotional capacity, genetic marker set)
+- Bond increase math is Numba-compiled when Numba is installed (scalar kernel,
+  plus a parallel kernel for batches)
+- strengthen_bond accepts a batch of interactions and computes their bond increases
+  in one vectorized pass
+- The AthenaMist checkout (ATHENAMIST_PATH) is added to sys.path only if it exists
 
 🔒 SECURITY IMPLICATIONS:
 - Creature genetic data protection
@@ -49,90 +75,318 @@ with human residents. It monitors creature health and optimizes bonding experien
 - 2024-12-19: Improved health monitoring systems
 """
 
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Any, Union
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from datetime import datetime
+import logging
 import numpy as np
-import uuid
 import sys
 import os
+from src.eden_core.athena_path import add_athena_mist_path
+from src.eden_core.id_generator import new_id
+from src.eden_core.jit import NUMBA_AVAILABLE, njit, prange
+from src.eden_core.log_limit import warn_limited
 from src.eden_core.module_interface import EdenModuleInterface
 
-# Add AthenaMist-Blended to path for brain integration
-ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
-if ATHENA_MIST_PATH not in sys.path:
-    sys.path.append(ATHENA_MIST_PATH)
+logger = logging.getLogger(__name__)
+
+# Add AthenaMist-Blended to path for brain integration (ATHENAMIST_PATH, if it exists)
+ATHENA_MIST_PATH = add_athena_mist_path()
 
 try:
     from athena_mist import AthenaMistBrain, CreatureProcessor, BondAnalyzer
     BRAIN_AVAILABLE = True
 except ImportError:
-    print("⚠️  Warning: AthenaMist-Blended not available. Using fallback creature processing.")
+    logger.warning("AthenaMist-Blended not available. Using fallback creature processing.")
     BRAIN_AVAILABLE = False
 
-@dataclass
+# Bond strength gained per unit of quality * duration * intensity * emotional capacity,
+# capped per interaction
+BOND_RATE = 0.02
+MAX_BOND_INCREASE = 0.1
+# Interactions kept in each bond's history (older ones are dropped)
+INTERACTION_HISTORY_CAPACITY = 256
+# Creature health metrics, in column order
+HEALTH_METRICS = ('physical', 'emotional', 'genetic_stability')
+HEALTH_IDX = {metric: i for i, metric in enumerate(HEALTH_METRICS)}
+
+@njit(cache=True, fastmath=True)
+def _bond_increase_kernel(quality, duration, intensity, capacity):
+    """Bond strength gained from one interaction (higher capacity = faster bonding)."""
+    return min(MAX_BOND_INCREASE, quality * duration * intensity * capacity * BOND_RATE)
+
+@njit(parallel=True, cache=True)
+def _bond_increase_batch_kernel(quality, duration, intensity, capacity, out):
+    """_bond_increase_kernel over aligned arrays, writing into *out*."""
+    for i in prange(len(out)):
+        out[i] = min(MAX_BOND_INCREASE, quality[i] * duration[i] * intensity[i] * capacity[i] * BOND_RATE)
+    return out
+
+def _write_health(values: np.ndarray, health_data: Dict[str, float], extra: Dict[str, float]):
+    """Write *health_data* into a health vector; metrics outside HEALTH_METRICS go to *extra* by name."""
+    for metric, value in health_data.items():
+        i = HEALTH_IDX.get(metric)
+        if i is None:
+            extra[metric] = value
+        else:
+            values[i] = value
+
+@njit(parallel=True, cache=True)
+def _strengthen_bonds_kernel(rows, quality, duration, intensity, capacity, strength, resonance):
+    """
+    Apply one interaction to each bond row of the strength / resonance columns, in place.
+
+    Rows must be unique and the input arrays as long as *rows* (see _check_bond_batch):
+    parallel iterations writing the same row would race.
+    """
+    for i in prange(len(rows)):
+        row = rows[i]
+        increase = min(MAX_BOND_INCREASE, quality[i] * duration[i] * intensity[i] * capacity[i] * BOND_RATE)
+        strength[row] = min(1.0, strength[row] + increase)
+        resonance[row] = min(1.0, resonance[row] + 0.01)
+
+def _check_bond_batch(bond_ids: List[str], *columns: np.ndarray):
+    """Raise ValueError unless bond_ids are unique and every column has one entry per bond."""
+    n = len(bond_ids)
+    for column in columns:
+        if len(column) != n:
+            raise ValueError(f"expected {n} interaction values, one per bond, got {len(column)}")
+    if len(set(bond_ids)) != n:
+        raise ValueError("bond_ids must not contain duplicates")
+
+@lru_cache(maxsize=4096)
+def _bonding_potential_cached(emotional_capacity: float, genetic_markers: frozenset) -> float:
+    """Bonding potential for a (capacity, marker set) signature; creatures of one template share it."""
+    # TODO: Implement sophisticated bonding potential calculation
+    # This would consider genetic compatibility, emotional intelligence, and species characteristics
+    base_potential = emotional_capacity
+    genetic_bonus = 0.1 if any(marker == "empathy_gene" for marker, _ in genetic_markers) else 0.0
+    return min(1.0, base_potential + genetic_bonus)
+
+class InteractionRecord(NamedTuple):
+    """One entry of a bond's interaction history."""
+    timestamp: float  # Unix time
+    quality: float
+    duration: float
+    intensity: float
+    strength_inc: float
+    resonance_inc: float
+    data: Dict[str, Any]  # The interaction payload as given, including keys not unpacked above
+
+class _Column:
+    """Attribute of a row view that lives in the owning table's column of the same name."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return getattr(view._table, self.name)[view._row].item()
+
+    def __set__(self, view, value):
+        getattr(view._table, self.name)[view._row] = value
+
+class _ColumnTable(Mapping):
+    """
+    Column-oriented store of row views, keyed by ID.
+
+    📋 QUANTUM DOCUMENTATION: Each numeric field named in COLUMNS is one
+    preallocated NumPy array (doubled when full); the view objects handed out
+    by the mapping read and write their row of those arrays, and carry the
+    non-numeric fields themselves. Population-wide scans are array reductions
+    over the first len(table) rows.
+    """
+
+    COLUMNS: Dict[str, Any] = {}
+
+    def __init__(self, capacity: int = 1024):
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.empty(capacity, dtype=dtype))
+        self._capacity = capacity
+        self._views: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def __getitem__(self, key: str):
+        return self._views[key]
+
+    def rows(self, keys) -> np.ndarray:
+        """Row index of each key, as an int64 array."""
+        views = self._views
+        return np.fromiter((views[key]._row for key in keys), dtype=np.int64, count=len(keys))
+
+    def _add(self, key: str, view_cls, values: Dict[str, Any], **fields):
+        """Append a row holding *values* (column -> value) and return its view."""
+        row = len(self._views)
+        if row == self._capacity:
+            self._grow()
+        for name, value in values.items():
+            getattr(self, name)[row] = value
+        view = self._views[key] = view_cls(self, row, **fields)
+        return view
+
+    def _grow(self):
+        self._capacity *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(self._capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
 class Creature:
     """
     Represents a bioengineered creature in the system.
     
     🧠 BRAIN INTEGRATION: Creatures are managed by AthenaMist-Blended
     for optimal health, behavior, and bonding capabilities.
+
+    Numeric fields are stored in the CreatureTable that created the creature.
     """
-    creature_id: str
-    species: str
-    name: str
-    age: float  # in years
-    emotional_capacity: float  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
-    bond_strength: Dict[str, float]  # entity_id -> bond strength
-    health_status: Dict[str, float]  # metric -> value
-    genetic_markers: Dict[str, str]
-    behavioral_patterns: Dict[str, float]
-    creation_date: datetime
-    last_interaction: datetime
-    brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended analysis results
-    bonding_potential: float  # 0.0 to 1.0 - Calculated by brain
+    __slots__ = ('_table', '_row', 'creature_id', 'species', 'name', 'health_status', 'health_extra',
+                 'genetic_markers', 'behavioral_patterns', 'brain_analysis')
+    age = _Column()  # in years
+    emotional_capacity = _Column()  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
+    bonding_potential = _Column()  # 0.0 to 1.0 - Calculated by brain
+    creation_date = _Column()
+    last_interaction = _Column()
+    # Running total and count of the creature's bond strengths, for O(1) average bond strength
+    bond_sum = _Column()
+    bond_count = _Column()
+
+    def __init__(self, table: 'CreatureTable', row: int, creature_id: str, species: str, name: str,
+                 genetic_markers: Dict[str, str]):
+        self._table = table
+        self._row = row
+        self.creature_id = creature_id
+        self.species = species
+        self.name = name
+        self.health_status = np.ones(len(HEALTH_METRICS), dtype=np.float32)  # HEALTH_METRICS order
+        self.health_extra: Dict[str, float] = {}  # Reported metrics outside HEALTH_METRICS
+        self.genetic_markers = genetic_markers
+        self.behavioral_patterns: Dict[str, float] = {}
+        self.brain_analysis: Optional[Dict[str, Any]] = None  # AthenaMist-Blended analysis results
+
+    @property
+    def bond_strength(self) -> Dict[str, float]:
+        """entity_id -> bond strength, resolved from the creature's bonds on each access."""
+        bonds = self._table.bonds
+        if bonds is None:
+            return {}
+        return {bonds[bond_id].entity_id: bonds[bond_id].strength
+                for bond_id in bonds.by_creature.get(self.creature_id, ())}
+
+class CreatureTable(_ColumnTable):
+    """All creatures, as creature_id -> Creature over parallel NumPy columns."""
+
+    def __init__(self, capacity: int = 1024, bonds: Optional['BondTable'] = None):
+        super().__init__(capacity)
+        # Bonds of these creatures, for Creature.bond_strength
+        self.bonds = bonds
+
+    COLUMNS = {
+        'age': np.float32,
+        'emotional_capacity': np.float32,
+        'bonding_potential': np.float32,
+        'creation_date': 'datetime64[us]',
+        'last_interaction': 'datetime64[us]',
+        'bond_sum': np.float64,
+        'bond_count': np.int64,
+    }
+
+    def add(self, creature_id: str, species: str, name: str, emotional_capacity: float,
+            bonding_potential: float, genetic_markers: Dict[str, str], now: datetime) -> Creature:
+        """Add a newborn creature and return its view."""
+        return self._add(creature_id, Creature,
+                         {'age': 0.0, 'emotional_capacity': emotional_capacity,
+                          'bonding_potential': bonding_potential,
+                          'creation_date': now, 'last_interaction': now,
+                          'bond_sum': 0.0, 'bond_count': 0},
+                         creature_id=creature_id, species=species, name=name,
+                         genetic_markers=genetic_markers)
 
-@dataclass
 class EmotionalBond:
     """
     Represents an emotional bond between a creature and another entity.
     
     🧠 BRAIN INTEGRATION: Bonds are analyzed by AthenaMist-Blended
     for strength optimization and relationship insights.
+
+    Numeric fields are stored in the BondTable that created the bond.
     """
-    bond_id: str
-    creature_id: str
-    entity_id: str
-    bond_type: str
-    strength: float  # 0.0 to 1.0 - Optimized by AthenaMist-Blended
-    formation_date: datetime
-    last_strengthened: datetime
-    interaction_history: List[Dict[str, Any]]
-    brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended bond analysis
-    resonance_level: float  # 0.0 to 1.0 - Emotional resonance
-
-class CreatureManager:
+    __slots__ = ('_table', '_row', 'bond_id', 'creature_id', 'entity_id', 'bond_type',
+                 'interaction_history', 'brain_analysis')
+    strength = _Column()  # 0.0 to 1.0 - Optimized by AthenaMist-Blended
+    resonance_level = _Column()  # 0.0 to 1.0 - Emotional resonance
+    formation_date = _Column()
+    last_strengthened = _Column()
+    interaction_count = _Column()  # all interactions, including those dropped from the history
+
+    def __init__(self, table: 'BondTable', row: int, bond_id: str, creature_id: str, entity_id: str,
+                 bond_type: str):
+        self._table = table
+        self._row = row
+        self.bond_id = bond_id
+        self.creature_id = creature_id
+        self.entity_id = entity_id
+        self.bond_type = bond_type
+        # Most recent INTERACTION_HISTORY_CAPACITY InteractionRecords
+        self.interaction_history: deque = deque(maxlen=INTERACTION_HISTORY_CAPACITY)
+        self.brain_analysis: Optional[Dict[str, Any]] = None  # AthenaMist-Blended bond analysis
+
+class BondTable(_ColumnTable):
+    """All bonds, as bond_id -> EmotionalBond over parallel NumPy columns."""
+
+    COLUMNS = {
+        'strength': np.float32,
+        'resonance_level': np.float32,
+        'formation_date': 'datetime64[us]',
+        'last_strengthened': 'datetime64[us]',
+        'interaction_count': np.int64,
+    }
+
+    def __init__(self, capacity: int = 1024):
+        super().__init__(capacity)
+        # creature_id -> IDs of its bonds
+        self.by_creature: Dict[str, Set[str]] = defaultdict(set)
+
+    def add(self, bond_id: str, creature_id: str, entity_id: str, bond_type: str,
+            strength: float, now: datetime) -> EmotionalBond:
+        """Add a new bond and return its view."""
+        self.by_creature[creature_id].add(bond_id)
+        return self._add(bond_id, EmotionalBond,
+                         {'strength': strength, 'resonance_level': 0.5,
+                          'formation_date': now, 'last_strengthened': now,
+                          'interaction_count': 0},
+                         bond_id=bond_id, creature_id=creature_id, entity_id=entity_id,
+                         bond_type=bond_type)
+
+class _CreatureManagerBrainOff:
     """
     Manages the bioengineered creatures in the habitat.
     
     🧠 BRAIN INTEGRATION: Creature management is enhanced by AthenaMist-Blended
     for optimal health, behavior, and bonding capabilities.
+
+    This is the local-only CreatureManager; the brain calls live in the
+    _CreatureManagerBrainOn subclass, chosen at import when the brain is available.
     """
     
     def __init__(self):
-        self.creatures: Dict[str, Creature] = {}
-        self.bonds: Dict[str, EmotionalBond] = {}
+        self.bonds = BondTable()
+        self.creatures = CreatureTable(bonds=self.bonds)
+        # (creature_id, entity_id) -> bond_id, so finding a pair's bond is one lookup
+        self._bond_by_pair: Dict[Tuple[str, str], str] = {}
         self.species_templates: Dict[str, Dict[str, Any]] = {}
         self.brain_processor = None
         
-        # Initialize AthenaMist-Blended integration
-        if BRAIN_AVAILABLE:
-            try:
-                self.brain_processor = CreatureProcessor()
-                print("✅ AthenaMist-Blended creature processor initialized")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist creature processor: {e}")
-        
     def create_creature(self,
                        species: str,
                        name: str,
@@ -153,50 +407,19 @@ class CreatureManager:
         Returns:
             str: Creature ID
         """
-        creature_id = str(uuid.uuid4())
+        creature_id = new_id()
         
         # Calculate bonding potential
         bonding_potential = self._calculate_bonding_potential(emotional_capacity, genetic_markers)
         
-        creature = Creature(
-            creature_id=creature_id,
-            species=species,
-            name=name,
-            age=0.0,
-            emotional_capacity=emotional_capacity,
-            bond_strength={},
-            health_status={
-                "physical": 1.0,
-                "emotional": 1.0,
-                "genetic_stability": 1.0
-            },
-            genetic_markers=genetic_markers,
-            behavioral_patterns={},
-            creation_date=datetime.now(),
-            last_interaction=datetime.now(),
-            brain_analysis=None,
-            bonding_potential=bonding_potential
-        )
-        
-        # Analyze creature with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_creature(creature)
-                creature.brain_analysis = analysis
-                creature.emotional_capacity = analysis.get('optimized_emotional_capacity', emotional_capacity)
-            except Exception as e:
-                print(f"⚠️  Creature analysis failed: {e}")
+        self.creatures.add(creature_id, species, name, emotional_capacity,
+                           bonding_potential, genetic_markers, datetime.now())
         
-        self.creatures[creature_id] = creature
         return creature_id
     
     def _calculate_bonding_potential(self, emotional_capacity: float, genetic_markers: Dict[str, str]) -> float:
         """Calculate bonding potential based on emotional capacity and genetic markers."""
-        # TODO: Implement sophisticated bonding potential calculation
-        # This would consider genetic compatibility, emotional intelligence, and species characteristics
-        base_potential = emotional_capacity
-        genetic_bonus = 0.1 if "empathy_gene" in genetic_markers else 0.0
-        return min(1.0, base_potential + genetic_bonus)
+        return _bonding_potential_cached(emotional_capacity, frozenset(genetic_markers.items()))
     
     def form_bond(self,
                  creature_id: str,
@@ -222,36 +445,27 @@ class CreatureManager:
         creature = self.creatures[creature_id]
         initial_strength = creature.bonding_potential * 0.1  # Start with 10% of bonding potential
         
-        bond_id = str(uuid.uuid4())
-        bond = EmotionalBond(
-            bond_id=bond_id,
-            creature_id=creature_id,
-            entity_id=entity_id,
-            bond_type=bond_type,
-            strength=initial_strength,
-            formation_date=datetime.now(),
-            last_strengthened=datetime.now(),
-            interaction_history=[],
-            brain_analysis=None,
-            resonance_level=0.5
-        )
-        
-        # Analyze bond with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                bond_analysis = self.brain_processor.analyze_bond(bond, creature)
-                bond.brain_analysis = bond_analysis
-                bond.strength = bond_analysis.get('optimized_strength', initial_strength)
-            except Exception as e:
-                print(f"⚠️  Bond analysis failed: {e}")
+        bond_id = new_id()
+        bond = self.bonds.add(bond_id, creature_id, entity_id, bond_type, initial_strength, datetime.now())
+        # A pair's first bond stays the one interactions strengthen
+        self._bond_by_pair.setdefault((creature_id, entity_id), bond_id)
         
-        self.bonds[bond_id] = bond
-        self.creatures[creature_id].bond_strength[entity_id] = bond.strength
+        creature.bond_count += 1
+        creature.bond_sum += bond.strength
         return bond_id
-    
+
+    def find_bond(self, creature_id: str, entity_id: str) -> Optional[str]:
+        """Return the ID of the bond between *creature_id* and *entity_id*, if any."""
+        return self._bond_by_pair.get((creature_id, entity_id))
+
+    def bond_ids_for(self, creature_id: str) -> Set[str]:
+        """IDs of every bond *creature_id* has formed."""
+        return self.bonds.by_creature.get(creature_id, set())
+
     def strengthen_bond(self,
                        bond_id: str,
-                       interaction_data: Dict[str, Any]) -> bool:
+                       interaction_data: Optional[Dict[str, Any]] = None,
+                       interaction_batch: Optional[List[Dict[str, Any]]] = None) -> bool:
         """
         Strengthen an emotional bond through interaction.
         
@@ -261,6 +475,7 @@ class CreatureManager:
         Args:
             bond_id: ID of the bond to strengthen
             interaction_data: Data about the interaction
+            interaction_batch: Several interactions to apply in order, in one call
             
         Returns:
             bool: Success status
@@ -270,44 +485,99 @@ class CreatureManager:
         
         bond = self.bonds[bond_id]
         creature = self.creatures[bond.creature_id]
+        interactions = [interaction_data] if interaction_data is not None else []
+        if interaction_batch:
+            interactions.extend(interaction_batch)
+        if not interactions:
+            return False
         
-        # Calculate bond strengthening with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                strengthening_result = self.brain_processor.optimize_bond_strengthening(
-                    bond, creature, interaction_data
-                )
-                strength_increase = strengthening_result.get('strength_increase', 0.01)
-                resonance_increase = strengthening_result.get('resonance_increase', 0.01)
-            except Exception as e:
-                print(f"⚠️  Bond strengthening optimization failed: {e}")
-                strength_increase = self._calculate_bond_increase(interaction_data, creature.emotional_capacity)
-                resonance_increase = 0.01
-        else:
-            strength_increase = self._calculate_bond_increase(interaction_data, creature.emotional_capacity)
-            resonance_increase = 0.01
+        strength_increases, resonance_increases = self._bond_increases(bond, creature, interactions)
         
-        # Update bond strength and resonance
-        new_strength = min(1.0, bond.strength + strength_increase)
-        new_resonance = min(1.0, bond.resonance_level + resonance_increase)
+        # Update bond strength and resonance (increases are non-negative, so clamping
+        # the total matches clamping after every interaction)
+        new_strength = min(1.0, bond.strength + sum(strength_increases))
+        new_resonance = min(1.0, bond.resonance_level + sum(resonance_increases))
         
+        old_strength = bond.strength
         bond.strength = new_strength
         bond.resonance_level = new_resonance
-        creature.bond_strength[bond.entity_id] = new_strength
+        creature.bond_sum += bond.strength - old_strength
+        
+        # One clock read stamps the whole call
+        now = datetime.now()
         
         # Update interaction history
-        bond.interaction_history.append({
-            "timestamp": datetime.now(),
-            "data": interaction_data,
-            "strength_increase": strength_increase,
-            "resonance_increase": resonance_increase
-        })
+        timestamp = now.timestamp()
+        bond.interaction_history.extend(
+            InteractionRecord(timestamp, data.get('quality', 0.5), data.get('duration', 0.5),
+                              data.get('emotional_intensity', 0.5), strength_increase, resonance_increase, data)
+            for data, strength_increase, resonance_increase
+            in zip(interactions, strength_increases, resonance_increases)
+        )
         
-        bond.last_strengthened = datetime.now()
-        creature.last_interaction = datetime.now()
+        bond.interaction_count += len(interactions)
+        bond.last_strengthened = now
+        creature.last_interaction = now
         
         return True
     
+    def strengthen_bonds_batch(self,
+                               bond_ids: List[str],
+                               quality: np.ndarray,
+                               duration: np.ndarray,
+                               intensity: np.ndarray) -> None:
+        """
+        Apply one interaction to each of many bonds in a single tick.
+
+        📋 QUANTUM DOCUMENTATION: Without the brain, strength and resonance are
+        updated in place on the BondTable columns by one native loop (or NumPy
+        expression without Numba). Interaction i applies to bond_ids[i]; a bond
+        may appear at most once per call. Batched interactions are counted in
+        interaction_count but not recorded in interaction_history.
+
+        Raises:
+            ValueError: If bond_ids contains duplicates or an interaction array
+                is not as long as bond_ids
+        """
+        quality = np.asarray(quality, dtype=np.float64)
+        duration = np.asarray(duration, dtype=np.float64)
+        intensity = np.asarray(intensity, dtype=np.float64)
+        _check_bond_batch(bond_ids, quality, duration, intensity)
+        bonds = self.bonds
+        rows = bonds.rows(bond_ids)
+        creature_ids = [bonds[bond_id].creature_id for bond_id in bond_ids]
+        creature_rows = self.creatures.rows(creature_ids)
+        capacity = self.creatures.emotional_capacity[creature_rows].astype(np.float64)
+        old_strength = bonds.strength[rows]
+        if NUMBA_AVAILABLE:
+            _strengthen_bonds_kernel(rows, quality, duration, intensity, capacity,
+                                     bonds.strength, bonds.resonance_level)
+        else:
+            increase = self._calculate_bond_increase_batch(quality, duration, intensity, capacity)
+            bonds.strength[rows] = np.minimum(1.0, bonds.strength[rows] + increase)
+            bonds.resonance_level[rows] = np.minimum(1.0, bonds.resonance_level[rows] + 0.01)
+
+        now = datetime.now()
+        bonds.last_strengthened[rows] = now
+        bonds.interaction_count[rows] += 1
+        self.creatures.last_interaction[creature_rows] = now
+        # Several bonds may share a creature, so the aggregate is updated unbuffered
+        np.add.at(self.creatures.bond_sum, creature_rows, bonds.strength[rows] - old_strength)
+
+    def _bond_increases(self,
+                        bond: EmotionalBond,
+                        creature: Creature,
+                        interactions: List[Dict[str, Any]]) -> Tuple[List[float], List[float]]:
+        """(strength, resonance) increases per interaction, computed locally."""
+        n = len(interactions)
+        if n == 1:
+            return [self._calculate_bond_increase(interactions[0], creature.emotional_capacity)], [0.01]
+        strength_increases = self._calculate_bond_increase_batch(
+            *self._interaction_columns(interactions),
+            np.full(n, creature.emotional_capacity)
+        ).tolist()
+        return strength_increases, [0.01] * n
+
     def _calculate_bond_increase(self,
                                interaction_data: Dict[str, Any],
                                emotional_capacity: float) -> float:
@@ -317,41 +587,153 @@ class CreatureManager:
         📋 QUANTUM DOCUMENTATION: Implements sophisticated bond calculation
         based on interaction quality and emotional capacity.
         """
-        # Extract interaction quality metrics
-        interaction_quality = interaction_data.get('quality', 0.5)
-        duration = interaction_data.get('duration', 0.5)
-        emotional_intensity = interaction_data.get('emotional_intensity', 0.5)
+        return _bond_increase_kernel(float(interaction_data.get('quality', 0.5)),
+                                     float(interaction_data.get('duration', 0.5)),
+                                     float(interaction_data.get('emotional_intensity', 0.5)),
+                                     float(emotional_capacity))
+
+    @classmethod
+    def _calculate_bond_increase_batch(cls,
+                                       quality: np.ndarray,
+                                       duration: np.ndarray,
+                                       intensity: np.ndarray,
+                                       capacity: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_bond_increase over aligned per-interaction arrays."""
+        if NUMBA_AVAILABLE:
+            return _bond_increase_batch_kernel(quality, duration, intensity, capacity,
+                                               np.empty(len(quality), dtype=np.float64))
+        # Without Numba the kernel would be a Python loop; NumPy ufuncs are faster
+        increase = np.multiply(quality, duration)
+        np.multiply(increase, intensity, out=increase)
+        np.multiply(increase, capacity, out=increase)
+        np.multiply(increase, BOND_RATE, out=increase)
+        return np.minimum(MAX_BOND_INCREASE, increase, out=increase)
+
+    @staticmethod
+    def _interaction_columns(interactions: List[Dict[str, Any]]):
+        """(quality, duration, emotional_intensity) arrays for a list of interactions."""
+        n = len(interactions)
+        return tuple(np.fromiter((data.get(key, 0.5) for data in interactions), dtype=np.float64, count=n)
+                     for key in ('quality', 'duration', 'emotional_intensity'))
+
+class _CreatureManagerBrainOn(_CreatureManagerBrainOff):
+    """
+    CreatureManager with AthenaMist-Blended analysis and bond optimization.
+
+    🧠 BRAIN INTEGRATION: Wraps each local operation with the matching brain
+    call. If the creature processor cannot be set up, the instance falls back
+    to the local-only class.
+    """
+
+    def __init__(self):
+        super().__init__()
+        try:
+            self.brain_processor = CreatureProcessor()
+            logger.info("AthenaMist-Blended creature processor initialized")
+        except Exception as e:
+            logger.warning("Could not initialize AthenaMist creature processor: %s", e)
+            self.__class__ = _CreatureManagerBrainOff
+
+    def create_creature(self,
+                       species: str,
+                       name: str,
+                       emotional_capacity: float,
+                       genetic_markers: Dict[str, str]) -> str:
+        creature_id = super().create_creature(species, name, emotional_capacity, genetic_markers)
+        creature = self.creatures[creature_id]
+        
+        # Analyze creature with AthenaMist-Blended
+        try:
+            analysis = self.brain_processor.analyze_creature(creature)
+            creature.brain_analysis = analysis
+            creature.emotional_capacity = analysis.get('optimized_emotional_capacity', emotional_capacity)
+        except Exception as e:
+            warn_limited(logger, "Creature analysis failed: %s", e)
+        
+        return creature_id
+
+    def form_bond(self,
+                 creature_id: str,
+                 entity_id: str,
+                 bond_type: str) -> Optional[str]:
+        bond_id = super().form_bond(creature_id, entity_id, bond_type)
+        if bond_id is None:
+            return None
+        bond = self.bonds[bond_id]
+        creature = self.creatures[creature_id]
         
-        # Calculate bond increase
-        base_increase = interaction_quality * duration * emotional_intensity
-        capacity_multiplier = emotional_capacity * 2.0  # Higher capacity = faster bonding
+        # Analyze bond with AthenaMist-Blended
+        try:
+            bond_analysis = self.brain_processor.analyze_bond(bond, creature)
+            bond.brain_analysis = bond_analysis
+            initial_strength = bond.strength
+            bond.strength = bond_analysis.get('optimized_strength', initial_strength)
+            creature.bond_sum += bond.strength - initial_strength
+        except Exception as e:
+            warn_limited(logger, "Bond analysis failed: %s", e)
         
-        return min(0.1, base_increase * capacity_multiplier * 0.01)
+        return bond_id
 
-class HealthMonitor:
+    def strengthen_bonds_batch(self,
+                               bond_ids: List[str],
+                               quality: np.ndarray,
+                               duration: np.ndarray,
+                               intensity: np.ndarray) -> None:
+        quality, duration, intensity = np.asarray(quality), np.asarray(duration), np.asarray(intensity)
+        _check_bond_batch(bond_ids, quality, duration, intensity)
+        # The brain optimizes bonds one at a time
+        for bond_id, q, d, ei in zip(bond_ids, quality.tolist(), duration.tolist(), intensity.tolist()):
+            self.strengthen_bond(bond_id, {'quality': q, 'duration': d, 'emotional_intensity': ei})
+
+    def _bond_increases(self,
+                        bond: EmotionalBond,
+                        creature: Creature,
+                        interactions: List[Dict[str, Any]]) -> Tuple[List[float], List[float]]:
+        """(strength, resonance) increases per interaction, optimized by AthenaMist-Blended."""
+        strength_increases = []
+        resonance_increases = []
+        for data in interactions:
+            try:
+                strengthening_result = self.brain_processor.optimize_bond_strengthening(
+                    bond, creature, data
+                )
+                strength_increases.append(strengthening_result.get('strength_increase', 0.01))
+                resonance_increases.append(strengthening_result.get('resonance_increase', 0.01))
+            except Exception as e:
+                warn_limited(logger, "Bond strengthening optimization failed: %s", e)
+                strength_increases.append(self._calculate_bond_increase(data, creature.emotional_capacity))
+                resonance_increases.append(0.01)
+        return strength_increases, resonance_increases
+
+# Brain availability is fixed at import, so the brain branch is resolved once here
+CreatureManager = _CreatureManagerBrainOn if BRAIN_AVAILABLE else _CreatureManagerBrainOff
+
+class _HealthMonitorBrainOff:
     """
     Monitors and manages creature health.
     
     🧠 BRAIN INTEGRATION: Health monitoring is enhanced by AthenaMist-Blended
     for predictive health analysis and early warning systems.
+
+    This is the local-only HealthMonitor; brain analysis lives in the
+    _HealthMonitorBrainOn subclass, chosen at import when the brain is available.
     """
     
-    def __init__(self):
-        self.health_metrics: Dict[str, Dict[str, float]] = {}
+    def __init__(self, capacity: int = 1024):
+        # One row per monitored creature, one column per HEALTH_METRICS entry
+        self.metric_cols = HEALTH_METRICS
+        self.health_metrics = np.ones((capacity, len(HEALTH_METRICS)), dtype=np.float32)
+        self.creature_row: Dict[str, int] = {}
+        self.creature_ids: List[str] = []
+        # Latest reported metrics outside HEALTH_METRICS, per creature that has any
+        self.extra_metrics: Dict[str, Dict[str, float]] = {}
         self.alert_thresholds: Dict[str, float] = {
             "physical": 0.7,
             "emotional": 0.7,
             "genetic_stability": 0.8
         }
+        self.thresholds_vec = self._thresholds_vector()
         self.brain_analyzer = None
-        
-        # Initialize AthenaMist-Blended integration
-        if BRAIN_AVAILABLE:
-            try:
-                self.brain_analyzer = BondAnalyzer()
-                print("✅ AthenaMist-Blended bond analyzer initialized")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist bond analyzer: {e}")
     
     def update_health(self,
                      creature_id: str,
@@ -369,29 +751,117 @@ class HealthMonitor:
         Returns:
             Dict[str, bool]: Alert status for each metric
         """
-        self.health_metrics[creature_id] = health_data
-        
-        # Analyze health with AthenaMist-Blended
-        if self.brain_analyzer and BRAIN_AVAILABLE:
-            try:
-                health_analysis = self.brain_analyzer.analyze_health(creature_id, health_data)
-                # Update thresholds based on brain analysis
-                if 'optimized_thresholds' in health_analysis:
-                    self.alert_thresholds.update(health_analysis['optimized_thresholds'])
-            except Exception as e:
-                print(f"⚠️  Health analysis failed: {e}")
+        row = self._row(creature_id)
+        # Metrics missing from an update count as healthy (1.0)
+        values = self.health_metrics[row]
+        values[:] = 1.0
+        extra = {}
+        _write_health(values, health_data, extra)
+        if extra:
+            self.extra_metrics[creature_id] = extra
+        else:
+            self.extra_metrics.pop(creature_id, None)
         
         return self._check_alerts(creature_id)
     
     def _check_alerts(self, creature_id: str) -> Dict[str, bool]:
         """Check if any health metrics are below thresholds."""
-        alerts = {}
-        if creature_id in self.health_metrics:
-            for metric, threshold in self.alert_thresholds.items():
-                value = self.health_metrics[creature_id].get(metric, 1.0)
-                alerts[metric] = value < threshold
+        row = self.creature_row.get(creature_id)
+        if row is None:
+            return {}
+        return dict(zip(self.metric_cols, (self.health_metrics[row] < self.thresholds_vec).tolist()))
+
+    def check_alerts_all(self) -> np.ndarray:
+        """
+        Alert flags for every monitored creature in one comparison.
+
+        Returns:
+            np.ndarray: (N, len(HEALTH_METRICS)) bool array; row i belongs to creature_ids[i]
+        """
+        return self.health_metrics[:len(self.creature_ids)] < self.thresholds_vec
+
+    def _thresholds_vector(self) -> np.ndarray:
+        return np.array([self.alert_thresholds.get(metric, 0.0) for metric in HEALTH_METRICS], dtype=np.float32)
+
+    def _row(self, creature_id: str) -> int:
+        """Return the creature's row, appending (and growing the matrix) for new creatures."""
+        row = self.creature_row.get(creature_id)
+        if row is None:
+            row = self.creature_row[creature_id] = len(self.creature_ids)
+            self.creature_ids.append(creature_id)
+            if row == len(self.health_metrics):
+                grown = np.ones((2 * row, len(HEALTH_METRICS)), dtype=np.float32)
+                grown[:row] = self.health_metrics
+                self.health_metrics = grown
+        return row
+
+class _HealthMonitorBrainOn(_HealthMonitorBrainOff):
+    """
+    HealthMonitor with AthenaMist-Blended health analysis.
+
+    🧠 BRAIN INTEGRATION: Each update is analyzed by the brain, which may tune
+    the alert thresholds. Falls back to the local-only class if the analyzer
+    cannot be set up.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        super().__init__(capacity)
+        try:
+            self.brain_analyzer = BondAnalyzer()
+            logger.info("AthenaMist-Blended bond analyzer initialized")
+        except Exception as e:
+            logger.warning("Could not initialize AthenaMist bond analyzer: %s", e)
+            self.__class__ = _HealthMonitorBrainOff
+
+    def update_health(self,
+                     creature_id: str,
+                     health_data: Dict[str, float]) -> Dict[str, bool]:
+        alerts = super().update_health(creature_id, health_data)
+        
+        # Analyze health with AthenaMist-Blended
+        try:
+            health_analysis = self.brain_analyzer.analyze_health(creature_id, health_data)
+            # Update thresholds based on brain analysis
+            if 'optimized_thresholds' in health_analysis:
+                self.alert_thresholds.update(health_analysis['optimized_thresholds'])
+                self.thresholds_vec = self._thresholds_vector()
+                alerts = self._check_alerts(creature_id)
+        except Exception as e:
+            warn_limited(logger, "Health analysis failed: %s", e)
+        
         return alerts
 
+HealthMonitor = _HealthMonitorBrainOn if BRAIN_AVAILABLE else _HealthMonitorBrainOff
+
+# eq=False: the generated __eq__ would compare the health_status arrays ambiguously
+@dataclass(frozen=True, slots=True, eq=False)
+class CreatureAnalytics:
+    """Snapshot of one creature's analytics, as returned by CreatureEngine.get_creature_analytics."""
+    creature_id: str
+    name: str
+    species: str
+    age: float
+    emotional_capacity: float
+    bonding_potential: float
+    health_status: np.ndarray  # HEALTH_METRICS order
+    bonds_count: int
+    average_bond_strength: float
+    last_interaction: datetime
+    brain_analysis: Optional[Dict[str, Any]]
+    brain_analytics: Optional[Dict[str, Any]] = None  # AthenaMist-Blended analytics, when synced
+    health_extra: Optional[Dict[str, float]] = None  # Reported metrics outside HEALTH_METRICS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON consumers, with health metrics keyed by name."""
+        result = {f.name: getattr(self, f.name) for f in fields(self)}
+        result['health_status'] = dict(zip(HEALTH_METRICS, self.health_status.tolist()))
+        if self.health_extra:
+            result['health_status'].update(self.health_extra)
+        del result['health_extra']
+        if self.brain_analytics is None:
+            del result['brain_analytics']
+        return result
+
 class CreatureEngine(EdenModuleInterface):
     """
     Plug-and-play implementation of the Love Creature Haven engine.
@@ -413,9 +883,9 @@ class CreatureEngine(EdenModuleInterface):
             try:
                 self.athena_brain = AthenaMistBrain()
                 self.brain_sync = True
-                print("✅ AthenaMist-Blended brain integration successful")
+                logger.info("AthenaMist-Blended brain integration successful")
             except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist brain: {e}")
+                logger.warning("Could not initialize AthenaMist brain: %s", e)
         
         super().__init__()
 
@@ -506,11 +976,7 @@ class CreatureEngine(EdenModuleInterface):
             Dict[str, Any]: Interaction results
         """
         # Find the bond between creature and entity
-        bond_id = None
-        for bid, bond in self.manager.bonds.items():
-            if bond.creature_id == creature_id and bond.entity_id == entity_id:
-                bond_id = bid
-                break
+        bond_id = self.manager.find_bond(creature_id, entity_id)
         
         if not bond_id:
             return {"success": False, "error": "No bond found"}
@@ -525,7 +991,7 @@ class CreatureEngine(EdenModuleInterface):
                 "bond_id": bond_id,
                 "new_strength": bond.strength,
                 "new_resonance": bond.resonance_level,
-                "interaction_count": len(bond.interaction_history)
+                "interaction_count": bond.interaction_count
             }
         else:
             return {"success": False, "error": "Failed to strengthen bond"}
@@ -550,7 +1016,8 @@ class CreatureEngine(EdenModuleInterface):
         
         # Update creature health status
         if creature_id in self.manager.creatures:
-            self.manager.creatures[creature_id].health_status.update(health_data)
+            creature = self.manager.creatures[creature_id]
+            _write_health(creature.health_status, health_data, creature.health_extra)
         
         return {
             "success": True,
@@ -559,45 +1026,42 @@ class CreatureEngine(EdenModuleInterface):
             "health_data": health_data
         }
     
-    def get_creature_analytics(self, creature_id: str) -> Dict[str, Any]:
+    def get_creature_analytics(self, creature_id: str) -> Union[CreatureAnalytics, Dict[str, Any]]:
         """
         Get comprehensive analytics for a creature.
         
         🧠 BRAIN INTEGRATION: Provides deep analytics using AthenaMist-Blended.
+
+        Returns:
+            CreatureAnalytics (use .to_dict() for a JSON-ready dict), or
+            {"error": "Creature not found"} if the creature does not exist
         """
-        if creature_id not in self.manager.creatures:
+        creature = self.manager.creatures.get(creature_id)
+        if creature is None:
             return {"error": "Creature not found"}
         
-        creature = self.manager.creatures[creature_id]
-        
-        # Get bonds for this creature
-        creature_bonds = [
-            bond for bond in self.manager.bonds.values()
-            if bond.creature_id == creature_id
-        ]
-        
-        analytics = {
-            "creature_id": creature_id,
-            "name": creature.name,
-            "species": creature.species,
-            "age": creature.age,
-            "emotional_capacity": creature.emotional_capacity,
-            "bonding_potential": creature.bonding_potential,
-            "health_status": creature.health_status,
-            "bonds_count": len(creature_bonds),
-            "average_bond_strength": np.mean(list(creature.bond_strength.values())) if creature.bond_strength else 0.0,
-            "last_interaction": creature.last_interaction,
-            "brain_analysis": creature.brain_analysis
-        }
-        
-        if self.brain_sync and BRAIN_AVAILABLE:
+        brain_analytics = None
+        if self.brain_sync:
             try:
                 brain_analytics = self.athena_brain.get_creature_analytics(creature_id)
-                analytics["brain_analytics"] = brain_analytics
             except Exception as e:
-                print(f"⚠️  Brain analytics failed: {e}")
+                warn_limited(logger, "Brain analytics failed: %s", e)
         
-        return analytics
+        return CreatureAnalytics(
+            creature_id,
+            creature.name,
+            creature.species,
+            creature.age,
+            creature.emotional_capacity,
+            creature.bonding_potential,
+            creature.health_status.copy(),
+            len(self.manager.bond_ids_for(creature_id)),
+            creature.bond_sum / creature.bond_count if creature.bond_count else 0.0,
+            creature.last_interaction,
+            creature.brain_analysis,
+            brain_analytics,
+            dict(creature.health_extra)
+        )
     
     def get_brain_status(self) -> Dict[str, Any]:
         """Get the status of AthenaMist-Blended brain integration."""
@@ -667,4 +1131,4 @@ if __name__ == "__main__":
     print(f"Formed bond: {bond_id}")
     print(f"Interaction result: {interaction_result}")
     print(f"Health result: {health_result}")
-    print(f"Creature analytics: {analytics}") 
\ No newline at end of file
+    print(f"Creature analytics: {analytics.to_dict()}") 
\ No newline at end of file
@@ -13,12 +13,19 @@ Eden One City - Main Orchestrator
 $ python src/main_orchestrator.py
 """
 
+import logging
 import time
 from src.eden_core.agent_bus import AgentBus, Agent
-from src.eden_core.citizen_interface import CitizenInterface
+from src.eden_core.citizen_interface import CitizenInterface, install_uvloop
 from src.eden_core.ethics_protocol import EthicsProtocol
 from src.eden_core.aincrad_integration import send_zone_update, listen_for_aincrad_events
 from src.eden_core.lilithos_integration import log_system_event, register_service, listen_for_lilithos_events
+from src.eden_core.log_queue import start_queue_logging
+
+# Emit log records from a background thread so agents never block on stdout
+logging.basicConfig(level=logging.INFO, format='[%(name)s] %(levelname)s: %(message)s')
+start_queue_logging()
+install_uvloop()
 
 # Initialize agent bus
 bus = AgentBus()
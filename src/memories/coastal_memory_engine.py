@@ -35,6 +35,32 @@ experiences that connect residents with Earth's natural beauty and cultural heri
 - Efficient experience management
 - Sensory data optimization
 - Emotional resonance calculation
+- Therapeutic value, resonance and cultural significance live in contiguous float32
+  columns; top-k ranking reads only those columns and averages come from running totals
+- Emotional signatures are cached as unit vectors over a fixed emotion vocabulary, so
+  compatibility is one dot product and ranking is one matrix-vector product
+- With Numba installed, ranking is a single fused pass (score + top-k selection)
+  with no intermediate arrays
+- Emotional states are packed into a float32 vector once per public call; internal
+  scoring indexes vector slots instead of hashing emotion names
+- Therapeutic impact is memoized on (memory, memory version, packed state bytes), so
+  repeated updates with an unchanged state skip the recomputation
+- Without the brain, components are null objects: call sites have no availability
+  checks or exception handling on the hot path
+- Experience durations are integer monotonic_ns() differences; no datetime is built per poll
+- Each session's analytics dict is built once at start; polls refresh its dynamic fields
+  and return a shallow copy
+- Memories and experiences are slotted dataclasses
+- Memory and session IDs come from new_id() (prefix + counter) rather than uuid4
+- Core memories (and their brain analysis) are seeded on first use, not at construction;
+  MemoryDatabase(seed=False) starts empty, and seeding analyzes all core memories in
+  one batched brain call
+- Memories are indexed by category, so category lookups and counts skip the full scan
+- Sensory descriptors are interned and stored as tuples, so memories share one copy
+  of each descriptor string
+- Brain-failure warnings go through logging and are rate-limited per logger by
+  warn_limited()
+- The AthenaMist checkout (ATHENAMIST_PATH) is added to sys.path only if it exists
 
 🔒 SECURITY IMPLICATIONS:
 - Memory data privacy protection
@@ -50,27 +76,190 @@ experiences that connect residents with Earth's natural beauty and cultural heri
 """
 
 from typing import Dict, List, Optional, Set, Any
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+import logging
 import numpy as np
-import uuid
 import sys
+import time
 import os
+from src.eden_core.athena_path import add_athena_mist_path
+from src.eden_core.clock import coarse_now, datetime_from_monotonic_ns
+from src.eden_core.id_generator import new_id
+from src.eden_core.jit import NUMBA_AVAILABLE, njit
+from src.eden_core.log_limit import warn_limited
 from src.eden_core.module_interface import EdenModuleInterface
 
-# Add AthenaMist-Blended to path for brain integration
-ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
-if ATHENA_MIST_PATH not in sys.path:
-    sys.path.append(ATHENA_MIST_PATH)
+logger = logging.getLogger(__name__)
+
+# Add AthenaMist-Blended to path for brain integration (ATHENAMIST_PATH, if it exists)
+ATHENA_MIST_PATH = add_athena_mist_path()
 
 try:
     from athena_mist import AthenaMistBrain, MemoryProcessor, ExperienceManager
     BRAIN_AVAILABLE = True
 except ImportError:
-    print("⚠️  Warning: AthenaMist-Blended not available. Using fallback memory processing.")
+    logger.warning("AthenaMist-Blended not available. Using fallback memory processing.")
     BRAIN_AVAILABLE = False
 
-@dataclass
+# Fixed emotion vocabulary; emotional signatures and states are packed into vectors over it
+EMOTION_VOCAB = (
+    'awe', 'peace', 'wonder', 'reverence', 'tranquility', 'inspiration', 'serenity',
+    'joy', 'calm', 'gratitude', 'stress', 'anxiety', 'sadness', 'fear',
+)
+EMOTION_INDEX = {emotion: i for i, emotion in enumerate(EMOTION_VOCAB)}
+# Compatibility used when a state shares no emotions with the vocabulary
+NEUTRAL_COMPATIBILITY = 0.5
+# Therapeutic impacts memoized per experience manager, keyed by (memory, version, state)
+IMPACT_CACHE_SIZE = 4096
+
+def _pack_emotions(emotions: Dict[str, float], out: np.ndarray) -> np.ndarray:
+    """Write an emotion dict into a unit-length vector over EMOTION_VOCAB (unknown emotions ignored)."""
+    out[:] = 0.0
+    for emotion, value in emotions.items():
+        i = EMOTION_INDEX.get(emotion)
+        if i is not None:
+            out[i] = value
+    norm = np.linalg.norm(out)
+    if norm > 0.0:
+        out /= norm
+    return out
+
+def pack_emotional_state(emotional_state: Dict[str, float]) -> np.ndarray:
+    """Pack an emotional state into a unit float32 vector over EMOTION_VOCAB."""
+    return _pack_emotions(emotional_state, np.empty(len(EMOTION_VOCAB), dtype=np.float32))
+
+def _intern_sensory(data: Any) -> Any:
+    """
+    Intern the strings of a sensory description so memories share one copy of each
+    descriptor; string lists become tuples.
+    """
+    if isinstance(data, str):
+        return sys.intern(data)
+    if isinstance(data, dict):
+        return {_intern_sensory(key): _intern_sensory(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return tuple(_intern_sensory(item) for item in data)
+    return data
+
+class _NullBrain:
+    """
+    Null-object AthenaMist component used when the brain is unavailable.
+    Every analysis returns None, so call sites need no availability checks.
+    """
+    
+    def analyze_memory(self, memory):
+        return None
+    
+    def get_therapeutic_memories(self, memories, emotional_state):
+        return None
+    
+    def optimize_experience(self, experience, memory):
+        return None
+    
+    def optimize_experience_update(self, experience, memory):
+        return None
+    
+    def analyze_experience_completion(self, experience):
+        return None
+    
+    def get_experience_analytics(self, session_id):
+        return None
+    
+    def get_memory_analytics(self):
+        return None
+    
+    def analyze_memories_batch(self, memories):
+        return [None] * len(memories)
+
+class _GuardedBrain:
+    """Wraps an AthenaMist component so a failing call is reported and returns None."""
+    
+    def __init__(self, component):
+        self._component = component
+    
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        component = self._component
+        failure_msg = f"AthenaMist {name} failed: %s"
+        
+        def guarded(*args, **kwargs):
+            # The method is resolved inside the guard, so a component lacking it
+            # is reported like any other brain failure
+            try:
+                return getattr(component, name)(*args, **kwargs)
+            except Exception as e:
+                warn_limited(logger, failure_msg, e)
+                return None
+        
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, guarded)
+        return guarded
+    
+    def analyze_memories_batch(self, memories):
+        """Analyze several memories in one brain call, or one call each if the brain has no batch entry point."""
+        if not hasattr(self._component, 'analyze_memories_batch'):
+            return [self.analyze_memory(memory) for memory in memories]
+        try:
+            return self._component.analyze_memories_batch(memories)
+        except Exception as e:
+            warn_limited(logger, "AthenaMist analyze_memories_batch failed: %s", e)
+            return [None] * len(memories)
+
+def _brain_component(factory, label: str):
+    """Build an AthenaMist component, or a _NullBrain if the brain is unavailable or fails to start."""
+    if BRAIN_AVAILABLE:
+        try:
+            component = factory()
+            logger.info("AthenaMist-Blended %s initialized", label)
+            return _GuardedBrain(component)
+        except Exception as e:
+            logger.warning("Could not initialize AthenaMist %s: %s", label, e)
+    return _NullBrain()
+
+def _apply_analysis(memory: 'CoastalMemory', analysis: Optional[Dict[str, Any]]):
+    """Store a brain analysis on a memory and adopt its therapeutic value and resonance."""
+    if analysis:
+        memory.brain_analysis = analysis
+        memory.therapeutic_value = analysis.get('therapeutic_value', memory.therapeutic_value)
+        memory.resonance_level = analysis.get('resonance_level', memory.resonance_level)
+
+# Compiled (or loaded from the on-disk cache) lazily on the first ranking call, so
+# importing the engine pays no compilation cost
+@njit(cache=True, fastmath=True)
+def _rank_top_k(emo_matrix, therapeutic, state_vec, use_state, out_idx, out_score):
+    """
+    Fused therapeutic ranking: score every row (therapeutic value, times emotional
+    compatibility when *use_state*) and keep the best len(out_idx) rows, best first,
+    in out_idx / out_score. Earlier rows win ties. Returns the number of rows kept.
+    """
+    n, d = emo_matrix.shape
+    k = len(out_idx)
+    filled = 0
+    for i in range(n):
+        score = therapeutic[i]
+        if use_state:
+            s = 0.0
+            for j in range(d):
+                s += emo_matrix[i, j] * state_vec[j]
+            score *= s
+        if filled == k and score <= out_score[k - 1]:
+            continue
+        pos = filled if filled < k else k - 1
+        while pos > 0 and out_score[pos - 1] < score:
+            out_idx[pos] = out_idx[pos - 1]
+            out_score[pos] = out_score[pos - 1]
+            pos -= 1
+        out_idx[pos] = i
+        out_score[pos] = score
+        if filled < k:
+            filled += 1
+    return filled
+
+@dataclass(slots=True)
 class CoastalMemory:
     """
     Represents a coastal memory experience.
@@ -91,8 +280,11 @@ class CoastalMemory:
     cultural_significance: float  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
     brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended analysis results
     therapeutic_value: float  # 0.0 to 1.0 - Calculated by brain
+    
+    def __post_init__(self):
+        self.sensory_data = _intern_sensory(self.sensory_data)
 
-@dataclass
+@dataclass(slots=True)
 class MemoryExperience:
     """
     Represents an active memory experience session.
@@ -110,6 +302,8 @@ class MemoryExperience:
     status: str  # "active", "completed", "interrupted"
     brain_optimization: Optional[Dict[str, Any]]  # AthenaMist-Blended optimization data
     therapeutic_impact: float  # 0.0 to 1.0 - Calculated by brain
+    start_ns: int = 0  # time.monotonic_ns() at start; durations are measured from this
+    analytics: Optional[Dict[str, Any]] = None  # Analytics dict built at start, refreshed per poll
 
 class MemoryDatabase:
     """
@@ -119,19 +313,49 @@ class MemoryDatabase:
     for intelligent categorization and significance analysis.
     """
     
-    def __init__(self):
+    # Hot per-memory fields mirrored into float32 columns (attribute -> column name)
+    COLUMN_FIELDS = {
+        'therapeutic_value': 'therapeutic',
+        'resonance_level': 'resonance',
+        'cultural_significance': 'cultural',
+    }
+    THERAPEUTIC_TOP_K = 5
+    # Memory fields update_memory may change (IDs, timestamps and brain analysis are managed here)
+    UPDATABLE_FIELDS = frozenset({
+        'name', 'category', 'description', 'emotional_signature', 'sensory_data', 'location',
+        'associated_entities', 'resonance_level', 'cultural_significance', 'therapeutic_value',
+    })
+    
+    def __init__(self, capacity: int = 64, seed: bool = True):
         self.memories: Dict[str, CoastalMemory] = {}
-        self.brain_processor = None
+        
+        # Columnar store: row i of every column belongs to memory self._ids[i]
+        self._cap = capacity
+        self._n = 0
+        self._cols: Dict[str, np.ndarray] = {
+            column: np.empty(capacity, dtype=np.float32) for column in self.COLUMN_FIELDS.values()
+        }
+        self._emo_matrix = np.zeros((capacity, len(EMOTION_VOCAB)), dtype=np.float32)
+        # Running column totals, so averages are O(1)
+        self._sums: Dict[str, float] = {column: 0.0 for column in self.COLUMN_FIELDS.values()}
+        self._row: Dict[str, int] = {}
+        self._ids: List[str] = []
+        # Bumped whenever a memory is stored or updated; keys derived caches
+        self._version: Dict[str, int] = {}
+        # Category -> memory IDs, in insertion order
+        self._by_category: Dict[str, List[str]] = defaultdict(list)
         
         # Initialize AthenaMist-Blended integration
-        if BRAIN_AVAILABLE:
-            try:
-                self.brain_processor = MemoryProcessor()
-                print("✅ AthenaMist-Blended memory processor initialized")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist memory processor: {e}")
+        self.brain_processor = _brain_component(lambda: MemoryProcessor(), "memory processor")
         
-        self._initialize_core_memories()
+        # Core memories are seeded on first use rather than at construction
+        self._seeded = not seed
+    
+    def ensure_seeded(self):
+        """Add the core 17-Mile Drive memories if they have not been added yet."""
+        if not self._seeded:
+            self._seeded = True
+            self._initialize_core_memories()
     
     def _initialize_core_memories(self):
         """
@@ -142,7 +366,7 @@ class MemoryDatabase:
         """
         # Bird Rock
         bird_rock_memory = CoastalMemory(
-            memory_id=str(uuid.uuid4()),
+            memory_id=new_id(),
             name="Bird Rock Vista",
             category="wildlife",
             description="A dramatic coastal rock formation teeming with seabirds, seals, and sea lions. The constant sound of waves crashing against the rocks creates a symphony of nature.",
@@ -176,21 +400,9 @@ class MemoryDatabase:
             therapeutic_value=0.8
         )
         
-        # Analyze with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_memory(bird_rock_memory)
-                bird_rock_memory.brain_analysis = analysis
-                bird_rock_memory.therapeutic_value = analysis.get('therapeutic_value', 0.8)
-                bird_rock_memory.resonance_level = analysis.get('resonance_level', 0.85)
-            except Exception as e:
-                print(f"⚠️  Bird Rock memory analysis failed: {e}")
-        
-        self.add_memory(bird_rock_memory)
-        
         # Lone Cypress
         lone_cypress_memory = CoastalMemory(
-            memory_id=str(uuid.uuid4()),
+            memory_id=new_id(),
             name="The Lone Cypress",
             category="landmark",
             description="An iconic Monterey cypress tree standing alone on a rocky promontory, symbolizing resilience and natural beauty. The tree has weathered centuries of coastal storms.",
@@ -224,21 +436,9 @@ class MemoryDatabase:
             therapeutic_value=0.9
         )
         
-        # Analyze with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_memory(lone_cypress_memory)
-                lone_cypress_memory.brain_analysis = analysis
-                lone_cypress_memory.therapeutic_value = analysis.get('therapeutic_value', 0.9)
-                lone_cypress_memory.resonance_level = analysis.get('resonance_level', 0.9)
-            except Exception as e:
-                print(f"⚠️  Lone Cypress memory analysis failed: {e}")
-        
-        self.add_memory(lone_cypress_memory)
-        
         # Spanish Bay
         spanish_bay_memory = CoastalMemory(
-            memory_id=str(uuid.uuid4()),
+            memory_id=new_id(),
             name="Spanish Bay Sunset",
             category="sunset",
             description="A breathtaking coastal vista where the sun sets over the Pacific, painting the sky in vibrant oranges and purples. The rhythmic sound of waves creates a perfect backdrop for reflection.",
@@ -272,17 +472,11 @@ class MemoryDatabase:
             therapeutic_value=0.85
         )
         
-        # Analyze with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_memory(spanish_bay_memory)
-                spanish_bay_memory.brain_analysis = analysis
-                spanish_bay_memory.therapeutic_value = analysis.get('therapeutic_value', 0.85)
-                spanish_bay_memory.resonance_level = analysis.get('resonance_level', 0.9)
-            except Exception as e:
-                print(f"⚠️  Spanish Bay memory analysis failed: {e}")
-        
-        self.add_memory(spanish_bay_memory)
+        # Analyze all core memories with AthenaMist-Blended in one call
+        pending = [bird_rock_memory, lone_cypress_memory, spanish_bay_memory]
+        for memory, analysis in zip(pending, self.brain_processor.analyze_memories_batch(pending)):
+            _apply_analysis(memory, analysis)
+            self.add_memory(memory)
     
     def add_memory(self, memory: CoastalMemory) -> bool:
         """
@@ -291,26 +485,84 @@ class MemoryDatabase:
         🧠 BRAIN INTEGRATION: Memories are analyzed by AthenaMist-Blended
         for emotional significance and therapeutic value optimization.
         """
+        self.ensure_seeded()
+        
         # Analyze memory with AthenaMist-Blended if not already analyzed
-        if not memory.brain_analysis and self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_memory(memory)
-                memory.brain_analysis = analysis
-                memory.therapeutic_value = analysis.get('therapeutic_value', memory.therapeutic_value)
-                memory.resonance_level = analysis.get('resonance_level', memory.resonance_level)
-            except Exception as e:
-                print(f"⚠️  Memory analysis failed: {e}")
+        if not memory.brain_analysis:
+            _apply_analysis(memory, self.brain_processor.analyze_memory(memory))
+        
+        previous = self.memories.get(memory.memory_id)
+        if previous is not None:
+            self._by_category[previous.category].remove(memory.memory_id)
+        self._by_category[memory.category].append(memory.memory_id)
         
         self.memories[memory.memory_id] = memory
+        row = self._row.get(memory.memory_id)
+        if row is None:
+            row = self._append_row(memory.memory_id)
+        self._write_columns(row, memory)
+        self._version[memory.memory_id] = self._version.get(memory.memory_id, -1) + 1
         return True
     
+    def _append_row(self, memory_id: str) -> int:
+        """Reserve the next column row for a memory, doubling capacity when full."""
+        row = self._n
+        if row == self._cap:
+            self._cap *= 2
+            for column, old in self._cols.items():
+                new = np.empty(self._cap, dtype=old.dtype)
+                new[:row] = old[:row]
+                self._cols[column] = new
+            matrix = np.zeros((self._cap, len(EMOTION_VOCAB)), dtype=np.float32)
+            matrix[:row] = self._emo_matrix[:row]
+            self._emo_matrix = matrix
+        for column in self._cols.values():
+            column[row] = 0.0
+        self._row[memory_id] = row
+        self._ids.append(memory_id)
+        self._n += 1
+        return row
+    
+    def _write_columns(self, row: int, memory: CoastalMemory):
+        """Mirror a memory's hot fields into the column arrays."""
+        for field, column in self.COLUMN_FIELDS.items():
+            values = self._cols[column]
+            old = values[row]
+            values[row] = getattr(memory, field)
+            self._sums[column] += float(values[row]) - float(old)
+        _pack_emotions(memory.emotional_signature, self._emo_matrix[row])
+    
+    def column(self, name: str) -> np.ndarray:
+        """Live view of one column ('therapeutic', 'resonance' or 'cultural') over all memories."""
+        return self._cols[name][:self._n]
+    
+    def column_mean(self, name: str) -> float:
+        """Average of one column over all memories (0.0 when empty), from the running total."""
+        return self._sums[name] / self._n if self._n else 0.0
+    
+    def version(self, memory_id: str) -> int:
+        """Change counter for a memory; differs after every add_memory / update_memory of it."""
+        return self._version[memory_id]
+    
+    def emotional_compatibility(self, memory_id: str, state_vec: np.ndarray) -> float:
+        """Cosine similarity between a memory's emotional signature and a packed emotional state."""
+        if not state_vec.any():
+            return NEUTRAL_COMPATIBILITY
+        return float(self._emo_matrix[self._row[memory_id]] @ state_vec)
+    
     def get_memory(self, memory_id: str) -> Optional[CoastalMemory]:
         """Retrieve a memory by ID."""
+        self.ensure_seeded()
         return self.memories.get(memory_id)
     
     def get_memories_by_category(self, category: str) -> List[CoastalMemory]:
         """Retrieve all memories in a specific category."""
-        return [m for m in self.memories.values() if m.category == category]
+        self.ensure_seeded()
+        return [self.memories[memory_id] for memory_id in self._by_category.get(category, ())]
+    
+    def category_counts(self) -> Dict[str, int]:
+        """Number of memories in each non-empty category."""
+        return {category: len(ids) for category, ids in self._by_category.items() if ids}
     
     def update_memory(self, memory_id: str, updates: Dict[str, Any]) -> bool:
         """
@@ -319,24 +571,27 @@ class MemoryDatabase:
         🧠 BRAIN INTEGRATION: Memory updates are analyzed by AthenaMist-Blended
         for impact on therapeutic value and emotional significance.
         """
+        self.ensure_seeded()
         if memory_id not in self.memories:
             return False
         
         memory = self.memories[memory_id]
+        old_category = memory.category
+        updatable = self.UPDATABLE_FIELDS
         for key, value in updates.items():
-            if hasattr(memory, key):
+            if key in updatable:
                 setattr(memory, key, value)
+        if 'sensory_data' in updates:
+            memory.sensory_data = _intern_sensory(memory.sensory_data)
+        if memory.category != old_category:
+            self._by_category[old_category].remove(memory_id)
+            self._by_category[memory.category].append(memory_id)
         
         # Re-analyze memory with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                analysis = self.brain_processor.analyze_memory(memory)
-                memory.brain_analysis = analysis
-                memory.therapeutic_value = analysis.get('therapeutic_value', memory.therapeutic_value)
-                memory.resonance_level = analysis.get('resonance_level', memory.resonance_level)
-            except Exception as e:
-                print(f"⚠️  Memory re-analysis failed: {e}")
+        _apply_analysis(memory, self.brain_processor.analyze_memory(memory))
         
+        self._write_columns(self._row[memory_id], memory)
+        self._version[memory_id] += 1
         return True
     
     def get_therapeutic_memories(self, emotional_state: Dict[str, float]) -> List[CoastalMemory]:
@@ -346,21 +601,35 @@ class MemoryDatabase:
         🧠 BRAIN INTEGRATION: Memory selection is optimized by AthenaMist-Blended
         for maximum therapeutic impact based on current emotional state.
         """
-        if self.brain_processor and BRAIN_AVAILABLE:
-            try:
-                recommended_memories = self.brain_processor.get_therapeutic_memories(
-                    list(self.memories.values()), emotional_state
-                )
-                return recommended_memories
-            except Exception as e:
-                print(f"⚠️  Therapeutic memory selection failed: {e}")
-        
-        # Fallback: return memories with highest therapeutic value
-        return sorted(
-            self.memories.values(),
-            key=lambda m: m.therapeutic_value,
-            reverse=True
-        )[:5]
+        self.ensure_seeded()
+        recommended_memories = self.brain_processor.get_therapeutic_memories(
+            list(self.memories.values()), emotional_state
+        )
+        if recommended_memories is not None:
+            return recommended_memories
+        
+        # Fallback: rank by therapeutic value weighted by emotional compatibility
+        if not self._n:
+            return []
+        values = self.column('therapeutic')
+        state_vec = pack_emotional_state(emotional_state)
+        use_state = bool(state_vec.any())
+        if NUMBA_AVAILABLE:
+            k = min(self.THERAPEUTIC_TOP_K, self._n)
+            top = np.empty(k, dtype=np.int32)
+            filled = _rank_top_k(self._emo_matrix[:self._n], values, state_vec, use_state,
+                                 top, np.empty(k, dtype=np.float32))
+            return [self.memories[self._ids[row]] for row in top[:filled]]
+        
+        if use_state:
+            values = (self._emo_matrix[:self._n] @ state_vec) * values
+        k = min(self.THERAPEUTIC_TOP_K, self._n)
+        if k < self._n:
+            top = np.argpartition(-values, k - 1)[:k]
+        else:
+            top = np.arange(self._n)
+        top = top[np.argsort(-values[top], kind='stable')]
+        return [self.memories[self._ids[row]] for row in top]
 
 class MemoryExperienceManager:
     """
@@ -373,15 +642,10 @@ class MemoryExperienceManager:
     def __init__(self, memory_db: MemoryDatabase):
         self.memory_db = memory_db
         self.active_experiences: Dict[str, MemoryExperience] = {}
-        self.brain_manager = None
+        self._impact_cached = lru_cache(maxsize=IMPACT_CACHE_SIZE)(self._compute_therapeutic_impact)
         
         # Initialize AthenaMist-Blended integration
-        if BRAIN_AVAILABLE:
-            try:
-                self.brain_manager = ExperienceManager()
-                print("✅ AthenaMist-Blended experience manager initialized")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist experience manager: {e}")
+        self.brain_manager = _brain_component(lambda: ExperienceManager(), "experience manager")
     
     def start_experience(self,
                         memory_id: str,
@@ -404,43 +668,59 @@ class MemoryExperienceManager:
         if memory_id not in self.memory_db.memories:
             return None
         
-        session_id = str(uuid.uuid4())
+        session_id = new_id()
         
         # Calculate therapeutic impact
         memory = self.memory_db.memories[memory_id]
-        therapeutic_impact = self._calculate_therapeutic_impact(memory, initial_emotional_state)
+        therapeutic_impact = self._calculate_therapeutic_impact(memory, pack_emotional_state(initial_emotional_state))
         
+        start_ns = time.monotonic_ns()
         experience = MemoryExperience(
             session_id=session_id,
             memory_id=memory_id,
-            participant_id=participant_id,
-            start_time=datetime.now(),
+            participant_id=sys.intern(participant_id),
+            start_time=datetime_from_monotonic_ns(start_ns),
             emotional_state=initial_emotional_state,
             interaction_level=0.5,
             feedback=None,
             status="active",
             brain_optimization=None,
-            therapeutic_impact=therapeutic_impact
+            therapeutic_impact=therapeutic_impact,
+            start_ns=start_ns
         )
         
         # Optimize experience with AthenaMist-Blended
-        if self.brain_manager and BRAIN_AVAILABLE:
-            try:
-                optimization = self.brain_manager.optimize_experience(experience, memory)
-                experience.brain_optimization = optimization
-                experience.therapeutic_impact = optimization.get('therapeutic_impact', therapeutic_impact)
-            except Exception as e:
-                print(f"⚠️  Experience optimization failed: {e}")
+        optimization = self.brain_manager.optimize_experience(experience, memory)
+        if optimization:
+            experience.brain_optimization = optimization
+            experience.therapeutic_impact = optimization.get('therapeutic_impact', therapeutic_impact)
+        
+        experience.analytics = {
+            "session_id": session_id,
+            "memory_name": memory.name,
+            "participant_id": experience.participant_id,
+            "start_time": experience.start_time,
+            "duration": 0.0,
+            "interaction_level": experience.interaction_level,
+            "therapeutic_impact": experience.therapeutic_impact,
+            "emotional_state": experience.emotional_state,
+            "status": experience.status
+        }
         
         self.active_experiences[session_id] = experience
         return session_id
     
-    def _calculate_therapeutic_impact(self, memory: CoastalMemory, emotional_state: Dict[str, float]) -> float:
-        """Calculate therapeutic impact based on memory and emotional state."""
-        # TODO: Implement sophisticated therapeutic impact calculation
-        # This would consider memory therapeutic value, emotional state compatibility, and resonance
-        base_impact = memory.therapeutic_value
-        emotional_compatibility = 0.5  # Placeholder for emotional compatibility calculation
+    def _calculate_therapeutic_impact(self, memory: CoastalMemory, state_vec: np.ndarray) -> float:
+        """Calculate therapeutic impact based on memory and a packed emotional state (pack_emotional_state)."""
+        return self._impact_cached(memory.memory_id, self.memory_db.version(memory.memory_id),
+                                   state_vec.tobytes())
+    
+    def _compute_therapeutic_impact(self, memory_id: str, version: int, state_key: bytes) -> float:
+        """Uncached therapeutic impact; *version* only keys the cache so updated memories miss it."""
+        base_impact = self.memory_db.memories[memory_id].therapeutic_value
+        emotional_compatibility = self.memory_db.emotional_compatibility(
+            memory_id, np.frombuffer(state_key, dtype=np.float32)
+        )
         return min(1.0, base_impact * emotional_compatibility)
     
     def update_experience(self,
@@ -464,16 +744,13 @@ class MemoryExperienceManager:
         experience.interaction_level = interaction_level
         
         # Recalculate therapeutic impact
-        therapeutic_impact = self._calculate_therapeutic_impact(memory, emotional_state)
+        therapeutic_impact = self._calculate_therapeutic_impact(memory, pack_emotional_state(emotional_state))
         experience.therapeutic_impact = therapeutic_impact
         
         # Optimize with AthenaMist-Blended
-        if self.brain_manager and BRAIN_AVAILABLE:
-            try:
-                optimization = self.brain_manager.optimize_experience_update(experience, memory)
-                experience.brain_optimization = optimization
-            except Exception as e:
-                print(f"⚠️  Experience update optimization failed: {e}")
+        optimization = self.brain_manager.optimize_experience_update(experience, memory)
+        if optimization:
+            experience.brain_optimization = optimization
         
         return True
     
@@ -494,12 +771,9 @@ class MemoryExperienceManager:
         experience.status = "completed"
         
         # Analyze completion with AthenaMist-Blended
-        if self.brain_manager and BRAIN_AVAILABLE:
-            try:
-                completion_analysis = self.brain_manager.analyze_experience_completion(experience)
-                experience.brain_optimization = completion_analysis
-            except Exception as e:
-                print(f"⚠️  Experience completion analysis failed: {e}")
+        completion_analysis = self.brain_manager.analyze_experience_completion(experience)
+        if completion_analysis:
+            experience.brain_optimization = completion_analysis
         
         # Remove from active experiences
         del self.active_experiences[session_id]
@@ -515,26 +789,19 @@ class MemoryExperienceManager:
             return {"error": "Experience not found"}
         
         experience = self.active_experiences[session_id]
-        memory = self.memory_db.memories[experience.memory_id]
         
-        analytics = {
-            "session_id": session_id,
-            "memory_name": memory.name,
-            "participant_id": experience.participant_id,
-            "start_time": experience.start_time,
-            "duration": (datetime.now() - experience.start_time).total_seconds(),
-            "interaction_level": experience.interaction_level,
-            "therapeutic_impact": experience.therapeutic_impact,
-            "emotional_state": experience.emotional_state,
-            "status": experience.status
-        }
+        # Refresh the dynamic fields of the session's analytics dict; callers get a copy
+        template = experience.analytics
+        template["duration"] = (time.monotonic_ns() - experience.start_ns) * 1e-9
+        template["interaction_level"] = experience.interaction_level
+        template["therapeutic_impact"] = experience.therapeutic_impact
+        template["emotional_state"] = experience.emotional_state
+        template["status"] = experience.status
+        analytics = dict(template)
         
-        if self.brain_manager and BRAIN_AVAILABLE:
-            try:
-                brain_analytics = self.brain_manager.get_experience_analytics(session_id)
-                analytics["brain_analytics"] = brain_analytics
-            except Exception as e:
-                print(f"⚠️  Brain analytics failed: {e}")
+        brain_analytics = self.brain_manager.get_experience_analytics(session_id)
+        if brain_analytics is not None:
+            analytics["brain_analytics"] = brain_analytics
         
         return analytics
 
@@ -553,16 +820,10 @@ class CoastalMemoryEngine(EdenModuleInterface):
         self.experience_manager = MemoryExperienceManager(self.memory_db)
         self.blockchain_log = []  # Placeholder for blockchain/timechain logging
         self.system_context = None
-        self.brain_sync = False
         
         # Initialize AthenaMist-Blended integration
-        if BRAIN_AVAILABLE:
-            try:
-                self.athena_brain = AthenaMistBrain()
-                self.brain_sync = True
-                print("✅ AthenaMist-Blended brain integration successful")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist brain: {e}")
+        self.athena_brain = _brain_component(lambda: AthenaMistBrain(), "brain")
+        self.brain_sync = not isinstance(self.athena_brain, _NullBrain)
         
     def register(self, system_context):
         self.system_context = system_context
@@ -603,7 +864,7 @@ class CoastalMemoryEngine(EdenModuleInterface):
         Returns:
             Optional[str]: Memory ID if successful, None otherwise
         """
-        memory_id = str(uuid.uuid4())
+        memory_id = new_id()
         memory = CoastalMemory(
             memory_id=memory_id,
             name=memory_data.get("name", "Unknown Memory"),
@@ -681,6 +942,7 @@ class CoastalMemoryEngine(EdenModuleInterface):
         
         🧠 BRAIN INTEGRATION: Provides deep analytics using AthenaMist-Blended.
         """
+        self.memory_db.ensure_seeded()
         analytics = {
             "memories_count": len(self.memory_db.memories),
             "active_experiences_count": len(self.experience_manager.active_experiences),
@@ -691,33 +953,26 @@ class CoastalMemoryEngine(EdenModuleInterface):
         
         # Calculate averages and distributions
         if self.memory_db.memories:
-            therapeutic_values = [m.therapeutic_value for m in self.memory_db.memories.values()]
-            resonance_levels = [m.resonance_level for m in self.memory_db.memories.values()]
-            analytics["average_therapeutic_value"] = np.mean(therapeutic_values)
-            analytics["average_resonance_level"] = np.mean(resonance_levels)
+            analytics["average_therapeutic_value"] = self.memory_db.column_mean('therapeutic')
+            analytics["average_resonance_level"] = self.memory_db.column_mean('resonance')
             
-            # Category distribution
-            for memory in self.memory_db.memories.values():
-                category = memory.category
-                analytics["category_distribution"][category] = analytics["category_distribution"].get(category, 0) + 1
+            analytics["category_distribution"] = self.memory_db.category_counts()
         
-        if self.brain_sync and BRAIN_AVAILABLE:
-            try:
-                brain_analytics = self.athena_brain.get_memory_analytics()
-                analytics["brain_analytics"] = brain_analytics
-            except Exception as e:
-                print(f"⚠️  Brain analytics failed: {e}")
+        brain_analytics = self.athena_brain.get_memory_analytics()
+        if brain_analytics is not None:
+            analytics["brain_analytics"] = brain_analytics
         
         return analytics
     
     def get_brain_status(self) -> Dict[str, Any]:
         """Get the status of AthenaMist-Blended brain integration."""
+        self.memory_db.ensure_seeded()
         return {
             'brain_available': BRAIN_AVAILABLE,
             'brain_sync': self.brain_sync,
             'memories_count': len(self.memory_db.memories),
             'active_experiences_count': len(self.experience_manager.active_experiences),
-            'last_sync_time': datetime.now()
+            'last_sync_time': coarse_now()
         }
 
 # Example usage
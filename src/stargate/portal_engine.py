@@ -35,6 +35,29 @@ as a portal to future interstellar destinations with sacred access protocols.
 - Fast portal activation sequences
 - Efficient compatibility assessment
 - Secure access control
+- Profiles are indexed by entity ID, so entity lookups are a single dict probe
+- System analytics reduce resonance levels and access levels with NumPy (mean, bincount),
+  falling back to plain Python (math.fsum average) below SMALL_POPULATION profiles
+- The access-level decision is a Numba-compiled kernel when Numba is installed;
+  perform_resonance_test_batch decides a whole population in one parallel pass
+  (or, without Numba, one vectorized row-wise threshold comparison)
+- Portal analytics are rendered once per portal state change and copied per call
+- ResonanceProfile and PortalState are slotted dataclasses (no per-instance __dict__)
+- process() dispatches through a class-level handler table, visiting only the
+  keys present in the input (operations run in input order)
+- Profiles are built by _make_profile (slots filled directly, bypassing the
+  dataclass __init__) from pre-bound uuid4/clock aliases; create_profiles builds
+  many profiles in one pass
+- Fallback metrics are computed by Numba-compiled kernels (scalar and batched) over a
+  feature vector that is still the neutral placeholder
+- Brain entry points are bound once at construction; without the brain each hot
+  call pays a single None check
+- Test history is a fixed-capacity ring of NumPy metric and timestamp columns per profile
+- Test records, profiles' last_test and action-log entries are time.monotonic_ns()
+  integers, converted to datetimes only on request
+- The action log is a bounded deque of (action, data, timestamp) tuples; dicts are
+  built only when blockchain_log_entries is read
+- The AthenaMist checkout (ATHENAMIST_PATH) is added to sys.path only if it exists
 
 🔒 SECURITY IMPLICATIONS:
 - Sacred access protocol protection
@@ -49,19 +72,23 @@ as a portal to future interstellar destinations with sacred access protocols.
 - 2024-12-19: Improved portal activation systems
 """
 
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, List, Optional, Set, Any, Tuple
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
+import math
 import uuid
 import sys
+import time
 import os
+from src.eden_core.athena_path import add_athena_mist_path
+from src.eden_core.clock import coarse_now, datetime_from_monotonic_ns
+from src.eden_core.jit import NUMBA_AVAILABLE, njit, prange
 from src.eden_core.module_interface import EdenModuleInterface
 
-# Add AthenaMist-Blended to path for brain integration
-ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
-if ATHENA_MIST_PATH not in sys.path:
-    sys.path.append(ATHENA_MIST_PATH)
+# Add AthenaMist-Blended to path for brain integration (ATHENAMIST_PATH, if it exists)
+ATHENA_MIST_PATH = add_athena_mist_path()
 
 try:
     from athena_mist import AthenaMistBrain, ResonanceProcessor, PortalManager
@@ -70,7 +97,136 @@ except ImportError:
     print("⚠️  Warning: AthenaMist-Blended not available. Using fallback portal processing.")
     BRAIN_AVAILABLE = False
 
-@dataclass
+# Access levels run from 0 (no access) to 4 (full access with sacred clearance)
+ACCESS_LEVELS = 5
+# Below this many profiles, system analytics use plain Python loops rather than
+# paying NumPy's per-call overhead
+SMALL_POPULATION = 32
+
+# Maximum number of action-log records kept in memory per engine
+ACTION_LOG_CAPACITY = 10_000
+
+@njit(cache=True)
+def _access_level_kernel(resonance, stability, alignment, compatibility, sacred,
+                         t_resonance, t_stability, t_alignment, t_compatibility):
+    """Access level (0-4) for one profile's metrics against the four test thresholds."""
+    if (resonance >= t_resonance and stability >= t_stability and
+            alignment >= t_alignment and compatibility >= t_compatibility):
+        return 4 if sacred else 3  # Full access (with sacred clearance)
+    if resonance >= 0.6:
+        return 2  # High access
+    if resonance >= 0.4:
+        return 1  # Medium access
+    return 0  # No access
+
+@njit(parallel=True, cache=True)
+def _batch_access_kernel(metrics, sacred, thresholds, out):
+    """_access_level_kernel over an (N, 4) metrics array, writing levels into *out*."""
+    for i in prange(metrics.shape[0]):
+        out[i] = _access_level_kernel(metrics[i, 0], metrics[i, 1], metrics[i, 2], metrics[i, 3], sacred[i],
+                                      thresholds[0], thresholds[1], thresholds[2], thresholds[3])
+    return out
+
+@njit(cache=True)
+def _unit(x):
+    """Clamp to [0, 1]."""
+    return min(1.0, max(0.0, x))
+
+@njit(cache=True)
+def _resonance_kernel(features):
+    """Overall resonance: mean emotional, cultural, genetic and spiritual compatibility."""
+    total = 0.0
+    for i in range(features.shape[0]):
+        total += _unit(features[i])
+    return total / features.shape[0]
+
+@njit(cache=True)
+def _metrics_kernel(features, out):
+    """All four resonance metrics (RESONANCE_METRICS order) from one feature vector, into *out*."""
+    out[0] = _resonance_kernel(features)
+    out[1] = _unit(features[0])  # emotional stability
+    out[2] = _unit(features[1])  # cultural alignment
+    out[3] = _unit(features[2])  # genetic compatibility
+    return out
+
+@njit(cache=True)
+def _metrics_batch_kernel(features, out):
+    """_metrics_kernel over an (N, 4) feature array, into an (N, 4) metrics array."""
+    for i in range(features.shape[0]):
+        _metrics_kernel(features[i], out[i])
+    return out
+
+def _access_levels_vectorized(metrics: np.ndarray, sacred: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """NumPy equivalent of _batch_access_kernel: one row-wise threshold comparison for all profiles."""
+    passed = (metrics >= thresholds).all(axis=1)
+    resonance = metrics[:, 0]
+    levels = np.where(resonance >= 0.6, 2, np.where(resonance >= 0.4, 1, 0))
+    return np.where(passed, np.where(sacred, 4, 3), levels).astype(np.int8)
+
+# Features consumed by the fallback metric kernels, in kernel order
+RESONANCE_FEATURES = ("emotional_stability", "cultural_alignment", "genetic_compatibility", "spiritual_resonance")
+NEUTRAL_FEATURE = 0.5
+
+def _extract_features(test_data: Dict[str, Any]) -> np.ndarray:
+    """Feature vector for *test_data*; every feature is the NEUTRAL_FEATURE placeholder for now."""
+    # TODO: Derive the RESONANCE_FEATURES from test data instead of trusting self-reported values
+    return np.full(len(RESONANCE_FEATURES), NEUTRAL_FEATURE, dtype=np.float64)
+
+# Resonance metrics in history column order
+RESONANCE_METRICS = ("resonance_level", "emotional_stability", "cultural_alignment", "genetic_compatibility")
+# Tests kept in each profile's history (older ones are overwritten)
+TEST_HISTORY_CAPACITY = 64
+
+class ResonanceHistory:
+    """
+    Fixed-capacity ring of a profile's resonance tests.
+    
+    📋 QUANTUM DOCUMENTATION: Metrics and timestamps live in preallocated NumPy
+    columns; only brain analyses (heterogeneous payloads) are kept as Python objects.
+    Raw test data is not retained.
+    """
+    __slots__ = ('metrics', 'timestamps', 'brain_analyses', 'head')
+    
+    def __init__(self, capacity: int = TEST_HISTORY_CAPACITY):
+        self.metrics = np.empty((capacity, len(RESONANCE_METRICS)), dtype=np.float32)
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.brain_analyses: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self.head = 0  # Total tests recorded; the next slot is head % capacity
+    
+    def record(self, metrics, timestamp_ns: int, brain_analysis: Optional[Dict[str, Any]]):
+        """Record one test's four metrics, its monotonic_ns() timestamp and brain analysis."""
+        slot = self.head % len(self.timestamps)
+        self.metrics[slot] = metrics
+        self.timestamps[slot] = timestamp_ns
+        self.brain_analyses[slot] = brain_analysis
+        self.head += 1
+    
+    def __len__(self) -> int:
+        return min(self.head, len(self.timestamps))
+    
+    def _slots(self) -> np.ndarray:
+        """Ring slots of the retained tests, oldest first."""
+        capacity = len(self.timestamps)
+        if self.head <= capacity:
+            return np.arange(self.head)
+        return (np.arange(capacity) + self.head) % capacity
+    
+    def metrics_array(self) -> np.ndarray:
+        """(n, 4) array of retained test metrics, oldest first."""
+        return self.metrics[self._slots()]
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Retained tests as dicts (timestamp, metrics, brain_analysis), oldest first."""
+        return [
+            {
+                "timestamp": int(self.timestamps[slot]),
+                "metrics": dict(zip(RESONANCE_METRICS, self.metrics[slot].tolist())),
+                "brain_analysis": self.brain_analyses[slot]
+            }
+            for slot in self._slots().tolist()
+        ]
+
+@dataclass(slots=True)
 class ResonanceProfile:
     """
     Represents an entity's resonance profile.
@@ -84,13 +240,18 @@ class ResonanceProfile:
     emotional_stability: float  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
     cultural_alignment: float  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
     genetic_compatibility: float  # 0.0 to 1.0 - Analyzed by AthenaMist-Blended
-    test_history: List[Dict[str, Any]]
-    last_test: datetime
+    test_history: ResonanceHistory
+    last_test: int  # time.monotonic_ns() of the latest test (or of profile creation)
     access_level: int  # 0 to 4 - Determined by AthenaMist-Blended
     brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended analysis results
     sacred_clearance: bool  # Sacred protocol clearance
+    
+    @property
+    def last_test_time(self) -> datetime:
+        """Wall-clock time of the latest test, converted from the monotonic timestamp."""
+        return datetime_from_monotonic_ns(self.last_test)
 
-@dataclass
+@dataclass(slots=True)
 class PortalState:
     """
     Represents the current state of the Stargate portal.
@@ -108,6 +269,32 @@ class PortalState:
     brain_optimization: Optional[Dict[str, Any]]  # AthenaMist-Blended optimization data
     sacred_protocol_status: str  # Sacred protocol compliance status
 
+# Module-level aliases keep profile creation on fast local/global loads
+_uuid4 = uuid.uuid4
+_monotonic_ns = time.monotonic_ns
+_Profile = ResonanceProfile
+_new_profile = ResonanceProfile.__new__
+
+def _make_profile(profile_id: str, entity_id: str, now_ns: int) -> ResonanceProfile:
+    """
+    Build a fresh, untested ResonanceProfile without the dataclass __init__.
+    
+    Fills the slots directly; must set every ResonanceProfile field.
+    """
+    p = _new_profile(_Profile)
+    p.profile_id = profile_id
+    p.entity_id = entity_id
+    p.resonance_level = 0.0
+    p.emotional_stability = 0.0
+    p.cultural_alignment = 0.0
+    p.genetic_compatibility = 0.0
+    p.test_history = ResonanceHistory()
+    p.last_test = now_ns
+    p.access_level = 0
+    p.brain_analysis = None
+    p.sacred_clearance = False
+    return p
+
 class ResonanceTester:
     """
     Manages resonance testing for portal access.
@@ -118,12 +305,17 @@ class ResonanceTester:
     
     def __init__(self):
         self.profiles: Dict[str, ResonanceProfile] = {}
+        self.entity_index: Dict[str, str] = {}  # entity_id -> its first profile_id
         self.test_thresholds = {
             "resonance_level": 0.8,
             "emotional_stability": 0.7,
             "cultural_alignment": 0.75,
             "genetic_compatibility": 0.8
         }
+        # Thresholds in _access_level_kernel argument order
+        self._thr = tuple(self.test_thresholds[metric] for metric in
+                          ("resonance_level", "emotional_stability", "cultural_alignment", "genetic_compatibility"))
+        self._thr_vec = np.array(self._thr, dtype=np.float64)
         self.brain_processor = None
         
         # Initialize AthenaMist-Blended integration
@@ -134,6 +326,11 @@ class ResonanceTester:
             except Exception as e:
                 print(f"⚠️  Warning: Could not initialize AthenaMist resonance processor: {e}")
         
+        # Brain entry points resolved once; None means use the fallback path
+        brain = self.brain_processor
+        self._initialize_profile = brain.initialize_profile if brain else None
+        self._analyze = brain.analyze_resonance if brain else None
+        
     def create_profile(self, entity_id: str) -> str:
         """
         Create a new resonance profile for an entity.
@@ -147,30 +344,36 @@ class ResonanceTester:
         Returns:
             str: Profile ID
         """
-        profile_id = str(uuid.uuid4())
-        profile = ResonanceProfile(
-            profile_id=profile_id,
-            entity_id=entity_id,
-            resonance_level=0.0,
-            emotional_stability=0.0,
-            cultural_alignment=0.0,
-            genetic_compatibility=0.0,
-            test_history=[],
-            last_test=datetime.now(),
-            access_level=0,
-            brain_analysis=None,
-            sacred_clearance=False
-        )
+        return self._register_profile(_make_profile(str(_uuid4()), entity_id, _monotonic_ns()))
+    
+    def create_profiles(self, entity_ids: List[str]) -> List[str]:
+        """
+        Create resonance profiles for many entities at once.
+        
+        📋 QUANTUM DOCUMENTATION: Bulk counterpart of create_profile for simulation
+        and testing workloads; IDs and timestamps are drawn up front.
         
-        # Initialize profile with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
+        Args:
+            entity_ids: IDs of the entities
+            
+        Returns:
+            List[str]: Profile IDs, in entity order
+        """
+        uuid4, make, register = _uuid4, _make_profile, self._register_profile
+        now_ns = _monotonic_ns()
+        return [register(make(str(uuid4()), entity_id, now_ns)) for entity_id in entity_ids]
+    
+    def _register_profile(self, profile: ResonanceProfile) -> str:
+        """Initialize *profile* with AthenaMist-Blended and index it; returns its ID."""
+        if self._initialize_profile is not None:
             try:
-                initialization = self.brain_processor.initialize_profile(profile)
-                profile.brain_analysis = initialization
+                profile.brain_analysis = self._initialize_profile(profile)
             except Exception as e:
                 print(f"⚠️  Profile initialization failed: {e}")
         
+        profile_id = profile.profile_id
         self.profiles[profile_id] = profile
+        self.entity_index.setdefault(profile.entity_id, profile_id)
         return profile_id
     
     def perform_resonance_test(self,
@@ -195,9 +398,9 @@ class ResonanceTester:
         profile = self.profiles[profile_id]
         
         # Perform resonance analysis with AthenaMist-Blended
-        if self.brain_processor and BRAIN_AVAILABLE:
+        if self._analyze is not None:
             try:
-                analysis_result = self.brain_processor.analyze_resonance(profile, test_data)
+                analysis_result = self._analyze(profile, test_data)
                 
                 # Update profile with brain analysis
                 profile.resonance_level = analysis_result.get('resonance_level', 0.5)
@@ -214,50 +417,109 @@ class ResonanceTester:
             except Exception as e:
                 print(f"⚠️  Brain resonance analysis failed: {e}")
                 # Fallback analysis
-                profile.resonance_level = self._calculate_resonance(test_data)
-                profile.emotional_stability = self._calculate_emotional_stability(test_data)
-                profile.cultural_alignment = self._calculate_cultural_alignment(test_data)
-                profile.genetic_compatibility = self._calculate_genetic_compatibility(test_data)
+                (profile.resonance_level, profile.emotional_stability,
+                 profile.cultural_alignment, profile.genetic_compatibility) = self._calculate_metrics(test_data)
                 access_level = self._determine_access_level(profile)
                 profile.access_level = access_level
         else:
             # Fallback analysis
-            profile.resonance_level = self._calculate_resonance(test_data)
-            profile.emotional_stability = self._calculate_emotional_stability(test_data)
-            profile.cultural_alignment = self._calculate_cultural_alignment(test_data)
-            profile.genetic_compatibility = self._calculate_genetic_compatibility(test_data)
+            (profile.resonance_level, profile.emotional_stability,
+             profile.cultural_alignment, profile.genetic_compatibility) = self._calculate_metrics(test_data)
             access_level = self._determine_access_level(profile)
             profile.access_level = access_level
         
-        # Record test
-        test_record = {
-            "timestamp": datetime.now(),
-            "metrics": {
-                "resonance_level": profile.resonance_level,
-                "emotional_stability": profile.emotional_stability,
-                "cultural_alignment": profile.cultural_alignment,
-                "genetic_compatibility": profile.genetic_compatibility
-            },
-            "test_data": test_data,
-            "brain_analysis": profile.brain_analysis
-        }
-        profile.test_history.append(test_record)
-        profile.last_test = datetime.now()
+        # Record test; the metrics are read off the profile once and shared by the
+        # history record and the result
+        resonance, stability, alignment, compatibility = row = (
+            profile.resonance_level, profile.emotional_stability,
+            profile.cultural_alignment, profile.genetic_compatibility
+        )
+        now_ns = time.monotonic_ns()
+        profile.test_history.record(row, now_ns, profile.brain_analysis)
+        profile.last_test = now_ns
         
         return {
             "success": True,
             "profile_id": profile_id,
             "metrics": {
-                "resonance_level": profile.resonance_level,
-                "emotional_stability": profile.emotional_stability,
-                "cultural_alignment": profile.cultural_alignment,
-                "genetic_compatibility": profile.genetic_compatibility
+                "resonance_level": resonance,
+                "emotional_stability": stability,
+                "cultural_alignment": alignment,
+                "genetic_compatibility": compatibility
             },
             "access_level": access_level,
             "sacred_clearance": profile.sacred_clearance,
             "brain_analysis": profile.brain_analysis
         }
     
+    def perform_resonance_test_batch(self, tests: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Perform resonance tests on many profiles at once.
+        
+        📋 QUANTUM DOCUMENTATION: Uses the fallback metric calculations for every test
+        and decides all access levels in one compiled pass; the brain processor is not
+        consulted, so this suits periodic revalidation sweeps.
+        
+        Args:
+            tests: Test data keyed by profile ID
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Test results keyed by profile ID
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        profiles = []
+        batch_data = []
+        for profile_id, test_data in tests.items():
+            profile = self.profiles.get(profile_id)
+            if profile is None:
+                results[profile_id] = {"success": False, "error": "Profile not found"}
+            else:
+                profiles.append(profile)
+                batch_data.append(test_data)
+        
+        n = len(profiles)
+        features = np.empty((n, len(RESONANCE_FEATURES)), dtype=np.float64)
+        sacred = np.empty(n, dtype=np.bool_)
+        for i, (profile, test_data) in enumerate(zip(profiles, batch_data)):
+            features[i] = _extract_features(test_data)
+            sacred[i] = profile.sacred_clearance
+        metrics = _metrics_batch_kernel(features, np.empty((n, len(RESONANCE_METRICS)), dtype=np.float64))
+        if NUMBA_AVAILABLE:
+            levels = _batch_access_kernel(metrics, sacred, self._thr_vec, np.empty(n, dtype=np.int8))
+        else:
+            levels = _access_levels_vectorized(metrics, sacred, self._thr_vec)
+        
+        now_ns = time.monotonic_ns()
+        for profile, row, level in zip(profiles, metrics.tolist(), levels.tolist()):
+            (profile.resonance_level, profile.emotional_stability,
+             profile.cultural_alignment, profile.genetic_compatibility) = row
+            profile.access_level = level
+            profile.test_history.record(row, now_ns, profile.brain_analysis)
+            profile.last_test = now_ns
+            results[profile.profile_id] = {
+                "success": True,
+                "profile_id": profile.profile_id,
+                "metrics": {
+                    "resonance_level": row[0],
+                    "emotional_stability": row[1],
+                    "cultural_alignment": row[2],
+                    "genetic_compatibility": row[3]
+                },
+                "access_level": level,
+                "sacred_clearance": profile.sacred_clearance,
+                "brain_analysis": profile.brain_analysis
+            }
+        return results
+    
+    def _calculate_metrics(self, test_data: Dict[str, Any]) -> tuple:
+        """
+        Calculate all four resonance metrics (RESONANCE_METRICS order) from test data.
+        
+        📋 QUANTUM DOCUMENTATION: Builds the feature vector once and evaluates every
+        metric in a single compiled kernel call.
+        """
+        return tuple(_metrics_kernel(_extract_features(test_data), np.empty(len(RESONANCE_METRICS))).tolist())
+    
     def _calculate_resonance(self, test_data: Dict[str, Any]) -> float:
         """
         Calculate resonance level from test data.
@@ -306,23 +568,9 @@ class ResonanceTester:
         🧠 BRAIN INTEGRATION: Access levels are determined by AthenaMist-Blended
         for optimal security and compatibility.
         """
-        if (profile.resonance_level >= self.test_thresholds["resonance_level"] and
-            profile.emotional_stability >= self.test_thresholds["emotional_stability"] and
-            profile.cultural_alignment >= self.test_thresholds["cultural_alignment"] and
-            profile.genetic_compatibility >= self.test_thresholds["genetic_compatibility"] and
-            profile.sacred_clearance):
-            return 4  # Full access with sacred clearance
-        elif (profile.resonance_level >= self.test_thresholds["resonance_level"] and
-              profile.emotional_stability >= self.test_thresholds["emotional_stability"] and
-              profile.cultural_alignment >= self.test_thresholds["cultural_alignment"] and
-              profile.genetic_compatibility >= self.test_thresholds["genetic_compatibility"]):
-            return 3  # Full access
-        elif profile.resonance_level >= 0.6:
-            return 2  # High access
-        elif profile.resonance_level >= 0.4:
-            return 1  # Medium access
-        else:
-            return 0  # No access
+        return int(_access_level_kernel(profile.resonance_level, profile.emotional_stability,
+                                        profile.cultural_alignment, profile.genetic_compatibility,
+                                        bool(profile.sacred_clearance), *self._thr))
 
 class PortalController:
     """
@@ -350,6 +598,10 @@ class PortalController:
             "stability_threshold": 0.8,
             "resonance_threshold": 0.7
         }
+        # Bumped on every current_state write; keys the rendered analytics
+        self._state_version = 0
+        self._analytics_cache: Optional[Dict[str, Any]] = None
+        self._cached_version = -1
         self.brain_manager = None
         
         # Initialize AthenaMist-Blended integration
@@ -359,6 +611,12 @@ class PortalController:
                 print("✅ AthenaMist-Blended portal manager initialized")
             except Exception as e:
                 print(f"⚠️  Warning: Could not initialize AthenaMist portal manager: {e}")
+        
+        # Brain entry points resolved once; None means skip the brain step
+        brain = self.brain_manager
+        self._optimize_activation = brain.optimize_portal_activation if brain else None
+        self._optimize_shutdown = brain.optimize_portal_shutdown if brain else None
+        self._brain_analytics = brain.get_portal_analytics if brain else None
     
     def activate_portal(self,
                        destination: str,
@@ -383,9 +641,9 @@ class PortalController:
             return False
         
         # Optimize activation with AthenaMist-Blended
-        if self.brain_manager and BRAIN_AVAILABLE:
+        if self._optimize_activation is not None:
             try:
-                activation_plan = self.brain_manager.optimize_portal_activation(
+                activation_plan = self._optimize_activation(
                     destination, entity_id, resonance_level
                 )
                 self.current_state.brain_optimization = activation_plan
@@ -398,6 +656,7 @@ class PortalController:
         self.current_state.destination = destination
         self.current_state.current_entity = entity_id
         self.current_state.last_activation = datetime.now()
+        self._state_version += 1
         
         # Stabilize portal
         return self._stabilize_portal()
@@ -409,9 +668,9 @@ class PortalController:
         🧠 BRAIN INTEGRATION: Portal deactivation is managed by AthenaMist-Blended
         for safe shutdown and energy conservation.
         """
-        if self.brain_manager and BRAIN_AVAILABLE:
+        if self._optimize_shutdown is not None:
             try:
-                shutdown_plan = self.brain_manager.optimize_portal_shutdown()
+                shutdown_plan = self._optimize_shutdown()
                 # Apply optimized shutdown
                 self.current_state.energy_level = 0.0
                 self.current_state.resonance_field = 0.0
@@ -422,6 +681,7 @@ class PortalController:
         self.current_state.destination = None
         self.current_state.current_entity = None
         self.current_state.sacred_protocol_status = "inactive"
+        self._state_version += 1
         return True
     
     def _check_activation_requirements(self, resonance_level: float) -> bool:
@@ -441,6 +701,7 @@ class PortalController:
         self.current_state.stability = 0.9
         self.current_state.energy_level = 0.8
         self.current_state.resonance_field = 0.7
+        self._state_version += 1
         return True
     
     def get_portal_analytics(self) -> Dict[str, Any]:
@@ -449,20 +710,23 @@ class PortalController:
         
         🧠 BRAIN INTEGRATION: Provides deep analytics using AthenaMist-Blended.
         """
-        analytics = {
-            "is_active": self.current_state.is_active,
-            "destination": self.current_state.destination,
-            "energy_level": self.current_state.energy_level,
-            "stability": self.current_state.stability,
-            "resonance_field": self.current_state.resonance_field,
-            "current_entity": self.current_state.current_entity,
-            "sacred_protocol_status": self.current_state.sacred_protocol_status,
-            "last_activation": self.current_state.last_activation
-        }
+        if self._cached_version != self._state_version:
+            self._analytics_cache = {
+                "is_active": self.current_state.is_active,
+                "destination": self.current_state.destination,
+                "energy_level": self.current_state.energy_level,
+                "stability": self.current_state.stability,
+                "resonance_field": self.current_state.resonance_field,
+                "current_entity": self.current_state.current_entity,
+                "sacred_protocol_status": self.current_state.sacred_protocol_status,
+                "last_activation": self.current_state.last_activation
+            }
+            self._cached_version = self._state_version
+        analytics = dict(self._analytics_cache)
         
-        if self.brain_manager and BRAIN_AVAILABLE:
+        if self._brain_analytics is not None:
             try:
-                brain_analytics = self.brain_manager.get_portal_analytics()
+                brain_analytics = self._brain_analytics()
                 analytics["brain_analytics"] = brain_analytics
             except Exception as e:
                 print(f"⚠️  Brain analytics failed: {e}")
@@ -478,12 +742,23 @@ class StargateEngine(EdenModuleInterface):
     - Integrates with AthenaMist-Blended and system-wide agent bus.
     - All actions are logged to blockchain/timechain for auditability.
     """
+    # process() operations: input key -> handler(engine, kwargs) returning (output key, value)
+    _HANDLERS: Dict[str, Callable[["StargateEngine", Dict[str, Any]], Tuple[str, Any]]] = {
+        'profile': lambda self, v: ('profile_id', self.resonance_tester.create_profile(**v)),
+        'test': lambda self, v: ('test_result', self.resonance_tester.perform_resonance_test(**v)),
+        'portal': lambda self, v: ('portal_status', self.portal_controller.activate_portal(**v)),
+    }
+
     def __init__(self):
         super().__init__()
         self.resonance_tester = ResonanceTester()
         self.portal_controller = PortalController()
+        # Invariant: brain_sync is only set True inside the BRAIN_AVAILABLE branch
+        # below, so brain_sync implies BRAIN_AVAILABLE; guards test brain_sync (or the
+        # bound entry points) alone and never re-check the module global.
         self.brain_sync = False
-        self.blockchain_log = []  # Placeholder for blockchain/timechain logging
+        # Placeholder for blockchain/timechain logging: (action, data, monotonic_ns) tuples
+        self.blockchain_log = deque(maxlen=ACTION_LOG_CAPACITY)
         self.system_context = None
         
         # Initialize AthenaMist-Blended integration
@@ -494,6 +769,7 @@ class StargateEngine(EdenModuleInterface):
                 print("✅ AthenaMist-Blended brain integration successful")
             except Exception as e:
                 print(f"⚠️  Warning: Could not initialize AthenaMist brain: {e}")
+        self._stargate_analytics = self.athena_brain.get_stargate_analytics if self.brain_sync else None
         
     def register(self, system_context):
         self.system_context = system_context
@@ -502,15 +778,12 @@ class StargateEngine(EdenModuleInterface):
 
     def process(self, input_data):
         result = {}
-        if 'profile' in input_data:
-            profile = input_data['profile']
-            result['profile_id'] = self.resonance_tester.create_profile(**profile)
-        if 'test' in input_data:
-            test = input_data['test']
-            result['test_result'] = self.resonance_tester.perform_resonance_test(**test)
-        if 'portal' in input_data:
-            portal = input_data['portal']
-            result['portal_status'] = self.portal_controller.activate_portal(**portal)
+        handlers = self._HANDLERS
+        for key, value in input_data.items():
+            handler = handlers.get(key)
+            if handler is not None:
+                out_key, out_value = handler(self, value)
+                result[out_key] = out_value
         self._log_action('process', {'input': input_data, 'output': result})
         return result
 
@@ -519,7 +792,15 @@ class StargateEngine(EdenModuleInterface):
         return True
 
     def _log_action(self, action, data):
-        self.blockchain_log.append({'action': action, 'data': data, 'timestamp': datetime.now()})
+        self.blockchain_log.append((action, data, time.monotonic_ns()))
+    
+    @property
+    def blockchain_log_entries(self) -> List[Dict[str, Any]]:
+        """The action log as dicts with wall-clock timestamps, oldest first."""
+        return [
+            {'action': action, 'data': data, 'timestamp': datetime_from_monotonic_ns(ns)}
+            for action, data, ns in self.blockchain_log
+        ]
 
     def test_entity(self,
                    entity_id: str,
@@ -538,12 +819,7 @@ class StargateEngine(EdenModuleInterface):
             Dict[str, Any]: Test results
         """
         # Create or get existing profile
-        profile_id = None
-        for pid, profile in self.resonance_tester.profiles.items():
-            if profile.entity_id == entity_id:
-                profile_id = pid
-                break
-        
+        profile_id = self.resonance_tester.entity_index.get(entity_id)
         if not profile_id:
             profile_id = self.resonance_tester.create_profile(entity_id)
         
@@ -560,7 +836,8 @@ class StargateEngine(EdenModuleInterface):
     
     def activate_portal(self,
                        entity_id: str,
-                       destination: str) -> Dict[str, Any]:
+                       destination: str,
+                       profile_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Activate the portal for an entity.
         
@@ -570,16 +847,17 @@ class StargateEngine(EdenModuleInterface):
         Args:
             entity_id: ID of the entity to transport
             destination: Target destination
+            profile_id: The entity's profile ID, if known (e.g. from test_entity);
+                looked up by entity ID otherwise
             
         Returns:
             Dict[str, Any]: Activation results
         """
         # Get entity's resonance level
-        resonance_level = 0.0
-        for profile in self.resonance_tester.profiles.values():
-            if profile.entity_id == entity_id:
-                resonance_level = profile.resonance_level
-                break
+        if profile_id is None:
+            profile_id = self.resonance_tester.entity_index.get(entity_id)
+        profile = self.resonance_tester.profiles.get(profile_id) if profile_id else None
+        resonance_level = profile.resonance_level if profile is not None else 0.0
         
         # Check access level
         if resonance_level < 0.8:
@@ -633,20 +911,27 @@ class StargateEngine(EdenModuleInterface):
             "profiles_count": len(self.resonance_tester.profiles),
             "portal_state": self.portal_controller.get_portal_analytics(),
             "average_resonance": 0.0,
-            "access_level_distribution": {0: 0, 1: 0, 2: 0, 3: 0, 4: 0}
+            "access_level_distribution": dict.fromkeys(range(ACCESS_LEVELS), 0)
         }
         
         # Calculate average resonance and access level distribution
-        if self.resonance_tester.profiles:
-            resonance_levels = [p.resonance_level for p in self.resonance_tester.profiles.values()]
-            analytics["average_resonance"] = np.mean(resonance_levels)
-            
-            for profile in self.resonance_tester.profiles.values():
-                analytics["access_level_distribution"][profile.access_level] += 1
-        
-        if self.brain_sync and BRAIN_AVAILABLE:
+        profiles = self.resonance_tester.profiles.values()
+        n = len(profiles)
+        if 0 < n < SMALL_POPULATION:
+            distribution = analytics["access_level_distribution"]
+            for p in profiles:
+                distribution[p.access_level] += 1
+            analytics["average_resonance"] = math.fsum(p.resonance_level for p in profiles) / n
+        elif n:
+            resonance_levels = np.fromiter((p.resonance_level for p in profiles), dtype=np.float64, count=n)
+            access_levels = np.fromiter((p.access_level for p in profiles), dtype=np.int8, count=n)
+            analytics["average_resonance"] = float(resonance_levels.mean())
+            counts = np.bincount(access_levels, minlength=ACCESS_LEVELS)
+            analytics["access_level_distribution"] = {level: int(counts[level]) for level in range(ACCESS_LEVELS)}
+        
+        if self._stargate_analytics is not None:
             try:
-                brain_analytics = self.athena_brain.get_stargate_analytics()
+                brain_analytics = self._stargate_analytics()
                 analytics["brain_analytics"] = brain_analytics
             except Exception as e:
                 print(f"⚠️  Brain analytics failed: {e}")
@@ -660,7 +945,7 @@ class StargateEngine(EdenModuleInterface):
             'brain_sync': self.brain_sync,
             'profiles_count': len(self.resonance_tester.profiles),
             'portal_active': self.portal_controller.current_state.is_active,
-            'last_sync_time': datetime.now()
+            'last_sync_time': coarse_now()
         }
 
 # Example usage
@@ -687,7 +972,8 @@ if __name__ == "__main__":
     if test_result["portal_access"]:
         activation_result = engine.activate_portal(
             entity_id="human_001",
-            destination="Alpha Centauri"
+            destination="Alpha Centauri",
+            profile_id=test_result["profile_id"]
         )
         
         # Get system analytics
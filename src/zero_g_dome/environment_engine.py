@@ -32,7 +32,37 @@ can bond with space-adapted flora and fauna in a weightless environment.
 
 ⚡ PERFORMANCE CONSIDERATIONS:
 - Real-time environmental control
+- Garden analytics are rendered once per garden change (store version counter); the
+  environment snapshot and fallback recommendations are built fresh per call, so
+  direct writes to current_state always show up
+- The control tick steps a packed temperature/pressure/humidity/oxygen vector in one
+  Numba kernel eagerly compiled for its float64 signature at import, instead of four np.sign dispatches
 - Efficient garden maintenance
+- Brain-failure warnings go through logging and are rate-limited per logger by
+  warn_limited()
+- The AthenaMist checkout (ATHENAMIST_PATH) is added to sys.path only if it exists
+- Air quality, energy levels and garden health are fixed-order float arrays
+  (AIR_KEYS, ENERGY_KEYS, HEALTH_METRICS); a control tick copies the target's air
+  quality and energy levels into the current arrays in place (np.copyto)
+- Environment-state, garden-maintenance and action-log timestamps are
+  time.monotonic_ns() integers, converted to datetimes only on request
+- The action log is a bounded deque of (action, data, timestamp) tuples; dicts are
+  built only when blockchain_log_entries is read
+- Garden numeric state is stored structure-of-arrays (GardenStore): contiguous float32
+  position/velocity/rotation/therapeutic/health columns and a garden x species growth
+  matrix, so whole-population passes are vectorized; every column starts on a 64-byte
+  cache line
+- Species names are interned once per garden and resolved to growth-matrix columns
+  (species_idx) at creation; maintenance indexes the matrix directly
+- Garden IDs come from new_id() (prefix + counter) rather than uuid4
+- Creating a garden allocates no per-garden arrays: velocity and rotation start as
+  zeroed store rows
+- The therapeutic position bonus compares a squared distance (no norm/sqrt), with a
+  vectorized variant for many candidate gardens
+- The average therapeutic value comes from a running total kept by the store (O(1))
+- maintain_all grows and restores every garden in one vectorized NumPy pass, updating
+  the growth matrix in place with no matrix-sized temporaries; with Numba the pass is
+  a parallel (prange) kernel over gardens
 - Life support system optimization
 - Therapeutic environment calibration
 
@@ -49,27 +79,81 @@ can bond with space-adapted flora and fauna in a weightless environment.
 - 2024-12-19: Improved floating garden management
 """
 
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Any, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
+import logging
 import numpy as np
-import uuid
 import sys
+import time
 import os
+from src.eden_core.athena_path import add_athena_mist_path
+from src.eden_core.clock import coarse_now, datetime_from_monotonic_ns
+from src.eden_core.id_generator import new_id
+from src.eden_core.jit import NUMBA_AVAILABLE, njit, prange
+from src.eden_core.log_limit import warn_limited
 from src.eden_core.module_interface import EdenModuleInterface
 
-# Add AthenaMist-Blended to path for brain integration
-ATHENA_MIST_PATH = "/Users/sovereign/Projects/AthenaMist-Blended"
-if ATHENA_MIST_PATH not in sys.path:
-    sys.path.append(ATHENA_MIST_PATH)
+logger = logging.getLogger(__name__)
+
+# Add AthenaMist-Blended to path for brain integration (ATHENAMIST_PATH, if it exists)
+ATHENA_MIST_PATH = add_athena_mist_path()
 
 try:
-    from athena_mist import AthenaMistBrain, EnvironmentProcessor, GardenManager
+    # Aliased: the local GardenManager class below would otherwise shadow it
+    from athena_mist import AthenaMistBrain, EnvironmentProcessor, GardenManager as AthenaGardenManager
     BRAIN_AVAILABLE = True
 except ImportError:
-    print("⚠️  Warning: AthenaMist-Blended not available. Using fallback environment processing.")
+    logger.warning("AthenaMist-Blended not available. Using fallback environment processing.")
     BRAIN_AVAILABLE = False
 
+
+# Continuously controlled environment parameters, in control-vector order, with the
+# control_parameters rate key and the dead band of each
+CONTROLLED_PARAMETERS = ("temperature", "pressure", "humidity", "oxygen_level")
+CONTROL_RATE_KEYS = ("temperature_rate", "pressure_rate", "humidity_rate", "oxygen_rate")
+CONTROL_THRESHOLDS = (0.1, 1.0, 0.001, 0.0001)
+
+# Eagerly compiled for the one control-vector signature (or loaded from the on-disk
+# cache) at import, so no tick pays type dispatch or first-call compilation
+@njit("float64[:](float64[:], float64[:], float64[:], float64[:])", cache=True)
+def _step(current, target, rate, threshold):
+    """One control tick, in place: move each parameter one rate step toward its target when outside its dead band."""
+    for i in range(current.shape[0]):
+        diff = target[i] - current[i]
+        if abs(diff) > threshold[i]:
+            current[i] += rate[i] if diff > 0.0 else -rate[i]
+    return current
+
+# Air-quality and energy-level components, in EnvironmentState array order
+AIR_KEYS = ("co2", "nitrogen", "other_gases")
+ENERGY_KEYS = ("life_support", "lighting", "climate_control")
+
+def _pack_levels(levels, keys) -> np.ndarray:
+    """A dict of levels (or any sequence in *keys* order) as a float64 array in *keys* order."""
+    if isinstance(levels, dict):
+        levels = [levels[key] for key in keys]
+    return np.array(levels, dtype=np.float64)
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _maintain_kernel(growth, health, rate):
+    """Grow every garden row of *growth* by rate x its mean health, clamped to [0, 1], in place; rows run in parallel."""
+    n, s = growth.shape
+    h = health.shape[1]
+    for i in prange(n):
+        m = 0.0
+        for k in range(h):
+            m += health[i, k]
+        r = rate * m / h
+        for j in range(s):
+            g = growth[i, j] + r
+            growth[i, j] = min(1.0, max(0.0, g))
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import rather than on the first maintenance pass
+    _maintain_kernel(np.zeros((1, 1), dtype=np.float32), np.ones((1, 3), dtype=np.float32), 0.01)
+
 @dataclass
 class EnvironmentState:
     """
@@ -83,31 +167,256 @@ class EnvironmentState:
     humidity: float  # 0.0 to 1.0 - Optimized by AthenaMist-Blended
     oxygen_level: float  # 0.0 to 1.0 - Optimized by AthenaMist-Blended
     gravity_level: float  # 0.0 to 1.0 - Optimized by AthenaMist-Blended
-    air_quality: Dict[str, float]  # Optimized by AthenaMist-Blended
-    energy_levels: Dict[str, float]  # Optimized by AthenaMist-Blended
-    timestamp: datetime
+    air_quality: np.ndarray  # AIR_KEYS order (dicts are packed) - Optimized by AthenaMist-Blended
+    energy_levels: np.ndarray  # ENERGY_KEYS order (dicts are packed) - Optimized by AthenaMist-Blended
+    timestamp: int  # time.monotonic_ns()
     brain_optimization: Optional[Dict[str, Any]]  # AthenaMist-Blended optimization data
     therapeutic_index: float  # 0.0 to 1.0 - Calculated by brain
+    
+    def __post_init__(self):
+        self.air_quality = _pack_levels(self.air_quality, AIR_KEYS)
+        self.energy_levels = _pack_levels(self.energy_levels, ENERGY_KEYS)
+    
+    @property
+    def air_quality_dict(self) -> Dict[str, float]:
+        """Air quality keyed by AIR_KEYS."""
+        return dict(zip(AIR_KEYS, self.air_quality.tolist()))
+    
+    @property
+    def energy_levels_dict(self) -> Dict[str, float]:
+        """Energy levels keyed by ENERGY_KEYS."""
+        return dict(zip(ENERGY_KEYS, self.energy_levels.tolist()))
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Wall-clock time of this state, converted from the monotonic timestamp."""
+        return datetime_from_monotonic_ns(self.timestamp)
 
-@dataclass
+# Therapeutic recommendations given when the brain is unavailable
+FALLBACK_RECOMMENDATIONS = (
+    "Maintain current temperature for comfort",
+    "Slightly increase humidity for therapeutic benefit",
+    "Optimize lighting for circadian rhythm"
+)
+
+# Garden health metrics, in GardenStore.health_metrics column order
+HEALTH_METRICS = ("nutrient_level", "water_level", "light_exposure")
+
+# Gardens within this distance of the dome center get a therapeutic bonus (squared, in m^2)
+CENTER_RADIUS_SQ = 10.0 ** 2
+
+# Maximum number of action-log records kept in memory per engine
+ACTION_LOG_CAPACITY = 100_000
+
+# Per-maintenance growth of a species at full health
+BASE_GROWTH_RATE = 0.01
+
+# Store columns start on cache-line boundaries
+CACHE_LINE = 64
+
+def _aligned_zeros(shape, dtype) -> np.ndarray:
+    """Zero-filled array whose data starts on a CACHE_LINE boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.zeros(nbytes + CACHE_LINE, dtype=np.uint8)
+    offset = -raw.ctypes.data % CACHE_LINE
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+class GardenStore:
+    """
+    Structure-of-arrays storage for floating gardens.
+    
+    📋 QUANTUM DOCUMENTATION: Row i of every column belongs to garden ids[i];
+    growth_status has one column per species in the species table. Columns are
+    float32 and double in capacity when full; erase() swap-removes, so rows of
+    other gardens may move.
+    """
+    # Per-row columns, grown and swapped together
+    ROW_COLUMNS = ("position", "velocity", "rotation", "therapeutic_value", "health_metrics",
+                   "growth_status", "last_maintenance")
+    
+    def __init__(self, capacity: int = 64, species_capacity: int = 16):
+        self.cap = capacity
+        self.n = 0
+        # Coordinates are float32 (~7 significant digits, ample for metre-scale dome positions)
+        self.position = _aligned_zeros((capacity, 3), np.float32)
+        self.velocity = _aligned_zeros((capacity, 3), np.float32)
+        self.rotation = _aligned_zeros((capacity, 3), np.float32)
+        self.therapeutic_value = _aligned_zeros(capacity, np.float32)
+        self.health_metrics = _aligned_zeros((capacity, len(HEALTH_METRICS)), np.float32)
+        self.health_metrics[:] = 1.0
+        self.growth_status = _aligned_zeros((capacity, species_capacity), np.float32)
+        self.last_maintenance = _aligned_zeros(capacity, np.int64)  # time.monotonic_ns()
+        # Running total of therapeutic_value over live rows, so the average is O(1);
+        # writes go through set_therapeutic_value to keep it in step
+        self.therapeutic_sum = 0.0
+        # Bumped on every write through the store, the garden properties or the
+        # GardenManager; keys cached analytics
+        self.version = 0
+        self.id_to_row: Dict[str, int] = {}
+        self.ids: List[str] = []
+        # Species table: growth_status column of each species
+        self.species_id: Dict[str, int] = {}
+        self.species_names: List[str] = []
+    
+    def push(self, garden_id: str) -> int:
+        """Append a zeroed row (full health) for a garden, doubling capacity when full."""
+        row = self.n
+        if row == self.cap:
+            self.cap *= 2
+            for name in self.ROW_COLUMNS:
+                old = getattr(self, name)
+                new = _aligned_zeros((self.cap,) + old.shape[1:], old.dtype)
+                new[:row] = old[:row]
+                setattr(self, name, new)
+        self.position[row] = 0.0
+        self.velocity[row] = 0.0
+        self.rotation[row] = 0.0
+        self.therapeutic_value[row] = 0.0
+        self.health_metrics[row] = 1.0
+        self.growth_status[row] = 0.0
+        self.last_maintenance[row] = time.monotonic_ns()
+        self.id_to_row[garden_id] = row
+        self.ids.append(garden_id)
+        self.n += 1
+        self.version += 1
+        return row
+    
+    def erase(self, garden_id: str):
+        """Remove a garden's row, moving the last row into its place."""
+        row = self.id_to_row.pop(garden_id)
+        self.therapeutic_sum -= float(self.therapeutic_value[row])
+        last = self.n - 1
+        last_id = self.ids.pop()
+        if row != last:
+            for name in self.ROW_COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            self.ids[row] = last_id
+            self.id_to_row[last_id] = row
+        self.n = last
+        self.version += 1
+    
+    def set_therapeutic_value(self, row: int, value: float):
+        """Write one therapeutic value, updating the running total."""
+        column = self.therapeutic_value
+        old = float(column[row])
+        column[row] = value
+        self.therapeutic_sum += float(column[row]) - old
+        self.version += 1
+    
+    def therapeutic_mean(self) -> float:
+        """Average therapeutic value over all gardens (0.0 when empty), from the running total."""
+        return self.therapeutic_sum / self.n if self.n else 0.0
+    
+    def species_columns(self, species: Sequence[str]) -> np.ndarray:
+        """growth_status columns of *species*, adding unseen species to the table."""
+        columns = []
+        for name in species:
+            column = self.species_id.get(name)
+            if column is None:
+                column = self.species_id[name] = len(self.species_names)
+                self.species_names.append(name)
+                if column == self.growth_status.shape[1]:
+                    grown = _aligned_zeros((self.cap, 2 * column), np.float32)
+                    grown[:, :column] = self.growth_status
+                    self.growth_status = grown
+            columns.append(column)
+        return np.array(columns, dtype=np.intp)
+
+@dataclass(eq=False)
 class FloatingGarden:
     """
     Represents a floating garden in the zero-g environment.
     
     🧠 BRAIN INTEGRATION: Gardens are managed by AthenaMist-Blended
     for optimal growth and therapeutic benefit.
+    
+    📋 QUANTUM DOCUMENTATION: Numeric state lives in the owning GardenStore; the
+    position, velocity, rotation, growth_status, health_metrics,
+    therapeutic_value and last_maintenance properties read (as copies) and write
+    this garden's row.
     """
     garden_id: str
     name: str
-    plant_species: List[str]
-    growth_status: Dict[str, float]  # species -> growth percentage
-    health_metrics: Dict[str, float]
-    position: np.ndarray  # 3D position - Optimized by AthenaMist-Blended
-    velocity: np.ndarray  # 3D velocity - Optimized by AthenaMist-Blended
-    rotation: np.ndarray  # 3D rotation - Optimized by AthenaMist-Blended
-    last_maintenance: datetime
-    brain_analysis: Optional[Dict[str, Any]]  # AthenaMist-Blended analysis results
-    therapeutic_value: float  # 0.0 to 1.0 - Calculated by brain
+    plant_species: Tuple[str, ...]  # Interned species names
+    store: GardenStore = field(repr=False)
+    species_idx: np.ndarray = field(repr=False)  # growth_status columns of plant_species
+    brain_analysis: Optional[Dict[str, Any]] = None  # AthenaMist-Blended analysis results
+    
+    @property
+    def row(self) -> int:
+        """This garden's current row in the store."""
+        return self.store.id_to_row[self.garden_id]
+    
+    @property
+    def position(self) -> np.ndarray:
+        """3D position - Optimized by AthenaMist-Blended."""
+        return self.store.position[self.row].copy()
+    
+    @position.setter
+    def position(self, value: np.ndarray):
+        self.store.position[self.row] = value
+        self.store.version += 1
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        """3D velocity - Optimized by AthenaMist-Blended."""
+        return self.store.velocity[self.row].copy()
+    
+    @velocity.setter
+    def velocity(self, value: np.ndarray):
+        self.store.velocity[self.row] = value
+        self.store.version += 1
+    
+    @property
+    def rotation(self) -> np.ndarray:
+        """3D rotation - Optimized by AthenaMist-Blended."""
+        return self.store.rotation[self.row].copy()
+    
+    @rotation.setter
+    def rotation(self, value: np.ndarray):
+        self.store.rotation[self.row] = value
+        self.store.version += 1
+    
+    @property
+    def therapeutic_value(self) -> float:
+        """0.0 to 1.0 - Calculated by brain."""
+        return float(self.store.therapeutic_value[self.row])
+    
+    @therapeutic_value.setter
+    def therapeutic_value(self, value: float):
+        self.store.set_therapeutic_value(self.row, value)
+    
+    @property
+    def last_maintenance(self) -> datetime:
+        """Wall-clock time of the latest maintenance."""
+        return datetime_from_monotonic_ns(int(self.store.last_maintenance[self.row]))
+    
+    @property
+    def growth_status(self) -> Dict[str, float]:
+        """Species -> growth percentage."""
+        growth = self.store.growth_status[self.row, self.species_idx].tolist()
+        return dict(zip(self.plant_species, growth))
+    
+    @growth_status.setter
+    def growth_status(self, value: Dict[str, float]):
+        # Resolve columns first: a new species may grow (reallocate) the growth matrix
+        columns = self.store.species_columns(list(value)).tolist()
+        growth = self.store.growth_status[self.row]
+        for column, species in zip(columns, value):
+            growth[column] = value[species]
+        self.store.version += 1
+    
+    @property
+    def health_metrics(self) -> Dict[str, float]:
+        """Health metric name -> level."""
+        return dict(zip(HEALTH_METRICS, self.store.health_metrics[self.row].tolist()))
+    
+    @health_metrics.setter
+    def health_metrics(self, value: Dict[str, float]):
+        self.store.health_metrics[self.row] = [value[metric] for metric in HEALTH_METRICS]
+        self.store.version += 1
 
 class EnvironmentController:
     """
@@ -134,7 +443,7 @@ class EnvironmentController:
                 "lighting": 1.0,
                 "climate_control": 1.0
             },
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             brain_optimization=None,
             therapeutic_index=0.5
         )
@@ -146,15 +455,21 @@ class EnvironmentController:
             "humidity_rate": 0.01,  # /s
             "oxygen_rate": 0.001  # /s
         }
+        # Control vectors in CONTROLLED_PARAMETERS order; current_state stays authoritative,
+        # and current_vec is refilled from it and unpacked back into it every tick
+        self.current_vec = self._pack(self.current_state)
+        self.target_vec = self.current_vec.copy()
+        self.rate_vec = np.array([self.control_parameters[key] for key in CONTROL_RATE_KEYS], dtype=np.float64)
+        self.thresh_vec = np.array(CONTROL_THRESHOLDS, dtype=np.float64)
         self.brain_processor = None
         
         # Initialize AthenaMist-Blended integration
         if BRAIN_AVAILABLE:
             try:
                 self.brain_processor = EnvironmentProcessor()
-                print("✅ AthenaMist-Blended environment processor initialized")
+                logger.info("AthenaMist-Blended environment processor initialized")
             except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist environment processor: {e}")
+                logger.warning("Could not initialize AthenaMist environment processor: %s", e)
     
     def update_environment(self, target_state: EnvironmentState) -> bool:
         """
@@ -176,11 +491,17 @@ class EnvironmentController:
                 target_state.brain_optimization = optimization
                 target_state.therapeutic_index = optimization.get('therapeutic_index', 0.5)
             except Exception as e:
-                print(f"⚠️  Environment optimization failed: {e}")
+                warn_limited(logger, "Environment optimization failed: %s", e)
         
         self.target_state = target_state
+        self.target_vec = self._pack(target_state)
         return self._adjust_environment()
     
+    @staticmethod
+    def _pack(state: EnvironmentState) -> np.ndarray:
+        """The controlled parameters of *state* as a float64 control vector."""
+        return np.array([state.temperature, state.pressure, state.humidity, state.oxygen_level], dtype=np.float64)
+    
     def _adjust_environment(self) -> bool:
         """
         Adjust environment parameters to match target state.
@@ -188,33 +509,21 @@ class EnvironmentController:
         📋 QUANTUM DOCUMENTATION: Provides smooth and precise environment control
         for optimal therapeutic benefit and inhabitant comfort.
         """
-        # Update temperature
-        temp_diff = self.target_state.temperature - self.current_state.temperature
-        if abs(temp_diff) > 0.1:
-            self.current_state.temperature += np.sign(temp_diff) * self.control_parameters["temperature_rate"]
-        
-        # Update pressure
-        press_diff = self.target_state.pressure - self.current_state.pressure
-        if abs(press_diff) > 1.0:
-            self.current_state.pressure += np.sign(press_diff) * self.control_parameters["pressure_rate"]
-        
-        # Update humidity
-        hum_diff = self.target_state.humidity - self.current_state.humidity
-        if abs(hum_diff) > 0.001:
-            self.current_state.humidity += np.sign(hum_diff) * self.control_parameters["humidity_rate"]
-        
-        # Update oxygen level
-        oxy_diff = self.target_state.oxygen_level - self.current_state.oxygen_level
-        if abs(oxy_diff) > 0.0001:
-            self.current_state.oxygen_level += np.sign(oxy_diff) * self.control_parameters["oxygen_rate"]
-        
-        # Update other parameters
-        self.current_state.air_quality = self.target_state.air_quality.copy()
-        self.current_state.energy_levels = self.target_state.energy_levels.copy()
+        # Step temperature, pressure, humidity and oxygen level toward the target,
+        # starting from current_state so direct writes to it are kept
+        state = self.current_state
+        self.current_vec[:] = (state.temperature, state.pressure, state.humidity, state.oxygen_level)
+        _step(self.current_vec, self.target_vec, self.rate_vec, self.thresh_vec)
+        (self.current_state.temperature, self.current_state.pressure,
+         self.current_state.humidity, self.current_state.oxygen_level) = self.current_vec.tolist()
+        
+        # Update other parameters (always copied: the target's arrays may be edited in place)
+        np.copyto(self.current_state.air_quality, self.target_state.air_quality)
+        np.copyto(self.current_state.energy_levels, self.target_state.energy_levels)
         self.current_state.brain_optimization = self.target_state.brain_optimization
         self.current_state.therapeutic_index = self.target_state.therapeutic_index
         
-        self.current_state.timestamp = datetime.now()
+        self.current_state.timestamp = time.monotonic_ns()
         return True
     
     def get_therapeutic_optimization(self) -> Dict[str, Any]:
@@ -227,16 +536,12 @@ class EnvironmentController:
             try:
                 return self.brain_processor.get_therapeutic_optimization(self.current_state)
             except Exception as e:
-                print(f"⚠️  Therapeutic optimization failed: {e}")
+                warn_limited(logger, "Therapeutic optimization failed: %s", e)
         
         # Fallback optimization
         return {
             "therapeutic_index": self.current_state.therapeutic_index,
-            "recommendations": [
-                "Maintain current temperature for comfort",
-                "Slightly increase humidity for therapeutic benefit",
-                "Optimize lighting for circadian rhythm"
-            ]
+            "recommendations": list(FALLBACK_RECOMMENDATIONS)
         }
 
 class GardenManager:
@@ -249,16 +554,18 @@ class GardenManager:
     
     def __init__(self):
         self.gardens: Dict[str, FloatingGarden] = {}
+        # Numeric garden state, one row per garden
+        self.store = GardenStore()
         self.plant_species: Dict[str, Dict[str, Any]] = {}
         self.brain_manager = None
         
         # Initialize AthenaMist-Blended integration
         if BRAIN_AVAILABLE:
             try:
-                self.brain_manager = GardenManager()
-                print("✅ AthenaMist-Blended garden manager initialized")
+                self.brain_manager = AthenaGardenManager()
+                logger.info("AthenaMist-Blended garden manager initialized")
             except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist garden manager: {e}")
+                logger.warning("Could not initialize AthenaMist garden manager: %s", e)
         
     def create_garden(self,
                      name: str,
@@ -278,27 +585,24 @@ class GardenManager:
         Returns:
             str: Garden ID
         """
-        garden_id = str(uuid.uuid4())
+        garden_id = new_id()
         
         # Calculate therapeutic value
         therapeutic_value = self._calculate_therapeutic_value(plant_species, position)
         
+        store = self.store
+        row = store.push(garden_id)
+        plant_species = tuple(sys.intern(species) for species in plant_species)
+        species_idx = store.species_columns(plant_species)
+        store.position[row] = position
+        store.set_therapeutic_value(row, therapeutic_value)
         garden = FloatingGarden(
             garden_id=garden_id,
             name=name,
             plant_species=plant_species,
-            growth_status={species: 0.0 for species in plant_species},
-            health_metrics={
-                "nutrient_level": 1.0,
-                "water_level": 1.0,
-                "light_exposure": 1.0
-            },
-            position=position,
-            velocity=np.zeros(3),
-            rotation=np.zeros(3),
-            last_maintenance=datetime.now(),
-            brain_analysis=None,
-            therapeutic_value=therapeutic_value
+            store=store,
+            species_idx=species_idx,
+            brain_analysis=None
         )
         
         # Analyze garden with AthenaMist-Blended
@@ -308,20 +612,41 @@ class GardenManager:
                 garden.brain_analysis = analysis
                 garden.therapeutic_value = analysis.get('optimized_therapeutic_value', therapeutic_value)
             except Exception as e:
-                print(f"⚠️  Garden analysis failed: {e}")
+                warn_limited(logger, "Garden analysis failed: %s", e)
         
         self.gardens[garden_id] = garden
+        self.store.version += 1
         return garden_id
     
+    def remove_garden(self, garden_id: str) -> bool:
+        """
+        Remove a floating garden.
+        
+        Returns:
+            bool: False if the garden does not exist
+        """
+        if self.gardens.pop(garden_id, None) is None:
+            return False
+        self.store.erase(garden_id)
+        return True
+    
     def _calculate_therapeutic_value(self, plant_species: List[str], position: np.ndarray) -> float:
         """Calculate therapeutic value based on plant species and position."""
         # TODO: Implement sophisticated therapeutic value calculation
         # This would consider plant species therapeutic properties, position optimization, and growth potential
         base_value = 0.5
         species_bonus = len(plant_species) * 0.1  # More species = higher therapeutic value
-        position_bonus = 0.1 if np.linalg.norm(position) < 10.0 else 0.0  # Closer to center = better
+        x, y, z = float(position[0]), float(position[1]), float(position[2])
+        position_bonus = 0.1 if x * x + y * y + z * z < CENTER_RADIUS_SQ else 0.0  # Closer to center = better
         return min(1.0, base_value + species_bonus + position_bonus)
     
+    def _calculate_therapeutic_values(self, species_counts: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_therapeutic_value for many candidate gardens ((N,) counts, (N, 3) positions)."""
+        positions = np.asarray(positions, dtype=np.float64)
+        r2 = (positions * positions).sum(axis=1)
+        values = 0.5 + np.asarray(species_counts) * 0.1 + np.where(r2 < CENTER_RADIUS_SQ, 0.1, 0.0)
+        return np.minimum(1.0, values)
+    
     def update_garden_position(self,
                              garden_id: str,
                              new_position: np.ndarray,
@@ -332,25 +657,25 @@ class GardenManager:
         🧠 BRAIN INTEGRATION: Position updates are optimized by AthenaMist-Blended
         for maximum therapeutic benefit and growth potential.
         """
-        if garden_id not in self.gardens:
+        try:
+            garden = self.gardens[garden_id]
+        except KeyError:
             return False
         
-        garden = self.gardens[garden_id]
-        
         # Optimize position with AthenaMist-Blended
         if self.brain_manager and BRAIN_AVAILABLE:
             try:
                 optimization = self.brain_manager.optimize_garden_position(garden, new_position, new_velocity)
-                garden.position = optimization.get('optimized_position', new_position)
-                garden.velocity = optimization.get('optimized_velocity', new_velocity)
+                new_position = optimization.get('optimized_position', new_position)
+                new_velocity = optimization.get('optimized_velocity', new_velocity)
             except Exception as e:
-                print(f"⚠️  Position optimization failed: {e}")
-                garden.position = new_position
-                garden.velocity = new_velocity
-        else:
-            garden.position = new_position
-            garden.velocity = new_velocity
+                warn_limited(logger, "Position optimization failed: %s", e)
+        
+        row = garden.row
+        self.store.position[row] = new_position
+        self.store.velocity[row] = new_velocity
         
+        self.store.version += 1
         return True
     
     def maintain_garden(self, garden_id: str) -> Dict[str, float]:
@@ -360,55 +685,82 @@ class GardenManager:
         🧠 BRAIN INTEGRATION: Maintenance is optimized by AthenaMist-Blended
         for maximum growth and therapeutic benefit.
         """
-        if garden_id not in self.gardens:
+        try:
+            garden = self.gardens[garden_id]
+        except KeyError:
             return {}
         
-        garden = self.gardens[garden_id]
+        store = self.store
+        row = garden.row
+        columns = garden.species_idx
         
         # Optimize maintenance with AthenaMist-Blended
         if self.brain_manager and BRAIN_AVAILABLE:
             try:
                 maintenance_plan = self.brain_manager.optimize_maintenance(garden)
                 # Apply optimized maintenance
-                for species in garden.plant_species:
-                    growth_rate = maintenance_plan.get(f'{species}_growth_rate', 0.01)
-                    garden.growth_status[species] = min(1.0, garden.growth_status[species] + growth_rate)
+                rates = [maintenance_plan.get(f'{species}_growth_rate', 0.01) for species in garden.plant_species]
+                store.growth_status[row, columns] = np.minimum(1.0, store.growth_status[row, columns] + rates)
                 
-                garden.health_metrics = maintenance_plan.get('optimized_health_metrics', {
-                    "nutrient_level": 1.0,
-                    "water_level": 1.0,
-                    "light_exposure": 1.0
-                })
+                optimized_health = maintenance_plan.get('optimized_health_metrics')
+                if optimized_health is None:
+                    store.health_metrics[row] = 1.0
+                else:
+                    garden.health_metrics = optimized_health
             except Exception as e:
-                print(f"⚠️  Maintenance optimization failed: {e}")
-                # Fallback maintenance
-                for species in garden.plant_species:
-                    growth_rate = self._calculate_growth_rate(species, garden.health_metrics)
-                    garden.growth_status[species] = min(1.0, garden.growth_status[species] + growth_rate)
-                
-                garden.health_metrics = {
-                    "nutrient_level": 1.0,
-                    "water_level": 1.0,
-                    "light_exposure": 1.0
-                }
+                warn_limited(logger, "Maintenance optimization failed: %s", e)
+                self._fallback_maintenance(garden, row, columns)
         else:
-            # Fallback maintenance
-            for species in garden.plant_species:
-                growth_rate = self._calculate_growth_rate(species, garden.health_metrics)
-                garden.growth_status[species] = min(1.0, garden.growth_status[species] + growth_rate)
-            
-            garden.health_metrics = {
-                "nutrient_level": 1.0,
-                "water_level": 1.0,
-                "light_exposure": 1.0
-            }
+            self._fallback_maintenance(garden, row, columns)
         
-        garden.last_maintenance = datetime.now()
+        store.last_maintenance[row] = time.monotonic_ns()
+        self.store.version += 1
         return garden.health_metrics
     
+    def maintain_all(self) -> int:
+        """
+        Perform maintenance on every garden.
+        
+        📋 QUANTUM DOCUMENTATION: Without the brain this is one vectorized pass over
+        the store: each garden grows at BASE_GROWTH_RATE scaled by its mean health,
+        then health is restored. Brain maintenance plans are per garden, so with the
+        brain each garden goes through maintain_garden.
+        
+        Returns:
+            int: Number of gardens maintained
+        """
+        if self.brain_manager and BRAIN_AVAILABLE:
+            for garden_id in list(self.gardens):
+                self.maintain_garden(garden_id)
+            return len(self.gardens)
+        
+        store = self.store
+        n = store.n
+        health = store.health_metrics[:n]
+        growth = store.growth_status[:n]
+        if NUMBA_AVAILABLE:
+            _maintain_kernel(growth, health, BASE_GROWTH_RATE)
+        else:
+            rates = health.mean(axis=1, keepdims=True)
+            rates *= BASE_GROWTH_RATE
+            np.add(growth, rates, out=growth)
+            np.clip(growth, 0.0, 1.0, out=growth)
+        health[:] = 1.0
+        store.last_maintenance[:n] = time.monotonic_ns()
+        self.store.version += 1
+        return n
+    
+    def _fallback_maintenance(self, garden: FloatingGarden, row: int, columns: np.ndarray):
+        """Grow every species of a garden at its computed rate, then restore full health."""
+        store = self.store
+        health_metrics = store.health_metrics[row]
+        rates = [self._calculate_growth_rate(species, health_metrics) for species in garden.plant_species]
+        store.growth_status[row, columns] = np.minimum(1.0, store.growth_status[row, columns] + rates)
+        store.health_metrics[row] = 1.0
+    
     def _calculate_growth_rate(self,
                              species: str,
-                             health_metrics: Dict[str, float]) -> float:
+                             health_metrics: np.ndarray) -> float:
         """
         Calculate growth rate for a plant species.
         
@@ -417,8 +769,8 @@ class GardenManager:
         """
         # TODO: Implement sophisticated growth calculation
         # This would consider species-specific growth rates, health metrics, and environmental conditions
-        base_rate = 0.01
-        health_multiplier = np.mean(list(health_metrics.values()))
+        base_rate = BASE_GROWTH_RATE
+        health_multiplier = float(health_metrics.mean())
         return base_rate * health_multiplier
 
 class ZeroGEngine(EdenModuleInterface):
@@ -434,18 +786,22 @@ class ZeroGEngine(EdenModuleInterface):
         super().__init__()
         self.env_controller = EnvironmentController()
         self.garden_manager = GardenManager()
-        self.blockchain_log = []  # Placeholder for blockchain/timechain logging
+        # Placeholder for blockchain/timechain logging: (action, data, monotonic_ns) tuples
+        self.blockchain_log = deque(maxlen=ACTION_LOG_CAPACITY)
         self.system_context = None
         self.brain_sync = False
+        # Rendered garden analytics and the store version they reflect
+        self._analytics_cache: Optional[Dict[str, Any]] = None
+        self._analytics_cache_key = None
         
         # Initialize AthenaMist-Blended integration
         if BRAIN_AVAILABLE:
             try:
                 self.athena_brain = AthenaMistBrain()
                 self.brain_sync = True
-                print("✅ AthenaMist-Blended brain integration successful")
+                logger.info("AthenaMist-Blended brain integration successful")
             except Exception as e:
-                print(f"⚠️  Warning: Could not initialize AthenaMist brain: {e}")
+                logger.warning("Could not initialize AthenaMist brain: %s", e)
         
     def register(self, system_context):
         self.system_context = system_context
@@ -471,7 +827,15 @@ class ZeroGEngine(EdenModuleInterface):
         return True
 
     def _log_action(self, action, data):
-        self.blockchain_log.append({'action': action, 'data': data, 'timestamp': datetime.now()})
+        self.blockchain_log.append((action, data, time.monotonic_ns()))
+    
+    @property
+    def blockchain_log_entries(self) -> List[Dict[str, Any]]:
+        """The action log as dicts with wall-clock timestamps, oldest first."""
+        return [
+            {'action': action, 'data': data, 'timestamp': datetime_from_monotonic_ns(ns)}
+            for action, data, ns in self.blockchain_log
+        ]
 
     def create_floating_garden(self,
                              name: str,
@@ -532,31 +896,34 @@ class ZeroGEngine(EdenModuleInterface):
         
         🧠 BRAIN INTEGRATION: Provides deep analytics using AthenaMist-Blended.
         """
+        key = self.garden_manager.store.version
+        if self._analytics_cache_key != key:
+            self._analytics_cache = {
+                "gardens_count": len(self.garden_manager.gardens),
+                "average_therapeutic_value": self.garden_manager.store.therapeutic_mean(),
+                "maintenance_status": "optimal"
+            }
+            self._analytics_cache_key = key
+        # The environment snapshot is read per call: current_state may be written directly
+        state = self.env_controller.current_state
         analytics = {
             "current_state": {
-                "temperature": self.env_controller.current_state.temperature,
-                "pressure": self.env_controller.current_state.pressure,
-                "humidity": self.env_controller.current_state.humidity,
-                "oxygen_level": self.env_controller.current_state.oxygen_level,
-                "gravity_level": self.env_controller.current_state.gravity_level,
-                "therapeutic_index": self.env_controller.current_state.therapeutic_index
+                "temperature": state.temperature,
+                "pressure": state.pressure,
+                "humidity": state.humidity,
+                "oxygen_level": state.oxygen_level,
+                "gravity_level": state.gravity_level,
+                "therapeutic_index": state.therapeutic_index
             },
-            "gardens_count": len(self.garden_manager.gardens),
-            "average_therapeutic_value": 0.0,
-            "maintenance_status": "optimal"
+            **self._analytics_cache
         }
         
-        # Calculate average therapeutic value
-        if self.garden_manager.gardens:
-            therapeutic_values = [g.therapeutic_value for g in self.garden_manager.gardens.values()]
-            analytics["average_therapeutic_value"] = np.mean(therapeutic_values)
-        
         if self.brain_sync and BRAIN_AVAILABLE:
             try:
                 brain_analytics = self.athena_brain.get_environment_analytics()
                 analytics["brain_analytics"] = brain_analytics
             except Exception as e:
-                print(f"⚠️  Brain analytics failed: {e}")
+                warn_limited(logger, "Brain analytics failed: %s", e)
         
         return analytics
     
@@ -575,7 +942,7 @@ class ZeroGEngine(EdenModuleInterface):
             'brain_sync': self.brain_sync,
             'gardens_count': len(self.garden_manager.gardens),
             'therapeutic_index': self.env_controller.current_state.therapeutic_index,
-            'last_sync_time': datetime.now()
+            'last_sync_time': coarse_now()
         }
 
 # Example usage
@@ -611,7 +978,7 @@ if __name__ == "__main__":
             "lighting": 0.8,  # Softer lighting
             "climate_control": 1.0
         },
-        timestamp=datetime.now(),
+        timestamp=time.monotonic_ns(),
         brain_optimization=None,
         therapeutic_index=0.8
     )
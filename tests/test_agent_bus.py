@@ -0,0 +1,81 @@
+"""Unit tests for agent messaging, event broadcast and audit persistence."""
+import json
+import threading
+
+import pytest
+from src.eden_core.agent_bus import Agent, AgentBus, compile_event_builder
+
+
+def test_messages_reach_only_registered_recipients():
+    bus = AgentBus()
+    sender = bus.register_agent(Agent('athena', 'pk-a'))
+    recipient_agent = Agent('serafina', 'pk-s')
+    recipient = bus.register_agent(recipient_agent)
+    assert bus.send_message(sender, recipient, 'hello') is True
+    assert bus.send_message(sender, 'missing', 'lost') is False
+    assert recipient_agent.receive() == (sender, 'hello')
+    assert recipient_agent.receive() is None
+    assert Agent('waiter', 'pk-w', blocking=True).receive(timeout=0.01) is None
+
+
+def test_delivery_runs_outside_the_bus_lock():
+    bus = AgentBus()
+    listener = Agent('listener', 'pk-l')
+    listener_id = bus.register_agent(listener)
+
+    class Relay(Agent):
+        # Forwarding from inside deliver() deadlocks if delivery holds the bus lock
+        def deliver(self, item):
+            bus.send_message('relay', listener_id, item)
+
+    relay_id = bus.register_agent(Relay('relay', 'pk-r'))
+    worker = threading.Thread(target=lambda: (bus.send_message('athena', relay_id, 'ping'),
+                                              bus.broadcast_event('tick', 1)))
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert listener.receive() == ('relay', ('athena', 'ping'))
+    assert listener.receive() == ('event', {'type': 'tick', 'data': 1})
+
+
+def test_audit_records_are_flushed_on_close(tmp_path):
+    path = tmp_path / 'audit.jsonl'
+    bus = AgentBus(audit_capacity=2, audit_path=str(path), flush_interval=60)
+    for i in range(3):
+        bus.register_agent(Agent(f'agent_{i}', 'pk'))
+    bus.close()
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record['data']['name'] for record in records] == ['agent_0', 'agent_1', 'agent_2']
+    # The in-memory log keeps only the newest audit_capacity records
+    assert [record['data']['name'] for record in bus.audit_log] == ['agent_1', 'agent_2']
+
+
+def test_schema_events_share_one_payload():
+    bus = AgentBus()
+    agents = [Agent(f'agent_{i}', 'pk') for i in range(2)]
+    for agent in agents:
+        bus.register_agent(agent)
+    bus.add_event_hook('zone_update', lambda data: None, schema=('zone', 'level'))
+    bus.broadcast_event('zone_update', {'zone': 'plaza', 'level': 3})
+    kind, event = agents[0].receive()
+    assert kind == 'event'
+    assert (event.type, event.zone, event.level) == ('zone_update', 'plaza', 3)
+    assert agents[1].receive()[1] is event
+    bus.broadcast_event('untyped', 1)
+    assert agents[0].receive() == ('event', {'type': 'untyped', 'data': 1})
+
+
+def test_invalid_schema_fields_are_rejected():
+    for field in ('type', 'class', 'not-an-identifier'):
+        with pytest.raises(ValueError):
+            compile_event_builder('bad', (field,))
+
+
+def test_event_hooks_run_in_registration_order():
+    bus = AgentBus()
+    calls = []
+    bus.add_event_hook('zone_update', lambda data: calls.append(('first', data)))
+    bus.add_event_hook('zone_update', lambda data: calls.append(('second', data)))
+    bus.add_event_hook('other', lambda data: calls.append(('other', data)))
+    bus.broadcast_event('zone_update', 'plaza')
+    assert calls == [('first', 'plaza'), ('second', 'plaza')]
@@ -0,0 +1,88 @@
+"""Unit tests for the AINCRAD integration."""
+import asyncio
+import sys
+from datetime import datetime
+
+import orjson
+import pytest
+import websockets
+from src.eden_core import aincrad_integration
+
+
+def test_listener_passes_websocket_events_to_the_callback(monkeypatch):
+    async def run():
+        received = []
+        done = asyncio.Event()
+
+        async def handler(ws):
+            await ws.send('{"zone": "plaza", "visitors": 3}')
+            await ws.wait_closed()
+
+        def callback(event):
+            received.append(event)
+            done.set()
+
+        async with websockets.serve(handler, '127.0.0.1', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            monkeypatch.setattr(aincrad_integration, 'AINCRAD_WS_URL', f'ws://127.0.0.1:{port}')
+            listener = aincrad_integration.listen_for_aincrad_events(callback)
+            await asyncio.wait_for(done.wait(), 5)
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+        return received
+
+    assert asyncio.run(run()) == [{'zone': 'plaza', 'visitors': 3}]
+
+
+def test_submit_from_the_target_loop_raises_instead_of_deadlocking():
+    async def run():
+        with pytest.raises(RuntimeError):
+            aincrad_integration.submit_zone_update({'zone': 'plaza'}, asyncio.get_running_loop())
+        # Closing a loop without a batcher is a no-op
+        await aincrad_integration.close_zone_batcher()
+
+    asyncio.run(run())
+    assert len(aincrad_integration._batchers) == 0
+
+
+def test_close_fails_queued_and_in_flight_updates(monkeypatch):
+    async def run():
+        posting = asyncio.Event()
+
+        async def hanging_post(batch):
+            posting.set()
+            await asyncio.Event().wait()
+
+        batcher = aincrad_integration.ZoneUpdateBatcher(batch_size=1)
+        monkeypatch.setattr(batcher, '_post', hanging_post)
+        batcher._queue = asyncio.Queue()
+        batcher._task = asyncio.create_task(batcher._drain())
+        in_flight = asyncio.create_task(batcher.submit({'zone': 'plaza'}))
+        await posting.wait()
+        queued = asyncio.create_task(batcher.submit({'zone': 'dome'}))
+        await asyncio.sleep(0)
+
+        await batcher.close()
+        results = await asyncio.gather(in_flight, queued, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with pytest.raises(RuntimeError):
+            await batcher.submit({'zone': 'plaza'})
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+
+
+def test_failed_start_leaves_no_batcher_registered(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'aiohttp', None)
+
+    async def run():
+        with pytest.raises(ImportError):
+            await aincrad_integration.send_zone_update_async({'zone': 'plaza'})
+        return asyncio.get_running_loop() in aincrad_integration._batchers
+
+    assert asyncio.run(run()) is False
+
+
+def test_naive_datetimes_are_not_labelled_utc():
+    stamp = datetime(2024, 12, 19, 8, 30)
+    payload = orjson.loads(orjson.dumps({'at': stamp}, option=aincrad_integration.JSON_OPTIONS))
+    assert payload == {'at': '2024-12-19T08:30:00'}
@@ -0,0 +1,20 @@
+"""Unit tests for the AthenaMist-Blended import path helper."""
+import sys
+
+from src.eden_core.athena_path import add_athena_mist_path
+
+
+def test_existing_checkout_is_added_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setenv("ATHENAMIST_PATH", str(tmp_path))
+    assert add_athena_mist_path() == str(tmp_path)
+    add_athena_mist_path()
+    assert sys.path.count(str(tmp_path)) == 1
+
+
+def test_missing_checkout_is_not_added(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    missing = str(tmp_path / "missing")
+    monkeypatch.setenv("ATHENAMIST_PATH", missing)
+    assert add_athena_mist_path() == missing
+    assert missing not in sys.path
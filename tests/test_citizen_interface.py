@@ -0,0 +1,46 @@
+"""Unit tests for batched citizen input handling."""
+import asyncio
+
+from src.eden_core.citizen_interface import CitizenInterface
+
+
+def test_inputs_reach_callbacks_and_survive_failures():
+    interface = CitizenInterface()
+    heard = []
+
+    async def async_callback(data):
+        heard.append(('async', data))
+
+    def failing(data):
+        raise RuntimeError('callback failed')
+
+    interface.add_voice_callback(heard.append)
+    interface.add_gesture_callback(failing)
+    interface.add_neural_callback(async_callback)
+
+    async def run():
+        await interface.handle_voice_input('hello')
+        await interface.handle_gesture_input('wave')
+        await interface.handle_neural_input('focus')
+        await interface.handle_voice_input('again')
+        await interface.close()
+
+    asyncio.run(run())
+    # Each modality's worker takes its whole queue as one batch, in submission order
+    assert heard == ['hello', 'again', ('async', 'focus')]
+    assert [entry['type'] for entry in interface.get_feedback_log()].count('gesture') == 1
+
+
+def test_interface_is_reusable_across_event_loops():
+    interface = CitizenInterface()
+    heard = []
+    interface.add_voice_callback(heard.append)
+
+    async def speak(text):
+        await interface.handle_voice_input(text)
+        await interface.drain()
+
+    asyncio.run(speak('first'))
+    # The first loop is closed now; its workers must not be reused
+    asyncio.run(speak('second'))
+    assert heard == ['first', 'second']
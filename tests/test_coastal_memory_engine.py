@@ -0,0 +1,75 @@
+"""Unit tests for coastal memory ranking, running averages and lazy seeding."""
+from datetime import datetime
+
+import numpy as np
+import pytest
+from src.memories import coastal_memory_engine
+from src.memories.coastal_memory_engine import (CoastalMemory, MemoryDatabase, _GuardedBrain,
+                                                pack_emotional_state)
+
+
+def _memory(memory_id, therapeutic, signature, resonance=0.5):
+    return CoastalMemory(memory_id=memory_id, name=memory_id, category="view", description="",
+                         emotional_signature=signature, sensory_data={}, location={},
+                         timestamp=datetime(2024, 6, 19), associated_entities=[],
+                         resonance_level=resonance, cultural_significance=0.5,
+                         brain_analysis=None, therapeutic_value=therapeutic)
+
+
+@pytest.mark.parametrize("numba_path", [True, False])
+def test_therapeutic_top_k_ranking(monkeypatch, numba_path):
+    monkeypatch.setattr(coastal_memory_engine, "NUMBA_AVAILABLE", numba_path)
+    db = MemoryDatabase(capacity=2, seed=False)
+    rng = np.random.default_rng(7)
+    for i in range(12):
+        emotions = dict(zip(("awe", "peace", "joy", "calm"), rng.random(4).tolist()))
+        db.add_memory(_memory(f"m{i}", float(rng.random()), emotions))
+    state = {"peace": 0.8, "calm": 0.6}
+    state_vec = pack_emotional_state(state)
+    scores = {mid: db.memories[mid].therapeutic_value * db.emotional_compatibility(mid, state_vec)
+              for mid in db.memories}
+    expected = sorted(scores, key=scores.get, reverse=True)[:MemoryDatabase.THERAPEUTIC_TOP_K]
+    assert [m.memory_id for m in db.get_therapeutic_memories(state)] == expected
+    # With no known emotions the ranking is by therapeutic value alone
+    by_value = sorted(db.memories, key=lambda mid: db.memories[mid].therapeutic_value, reverse=True)
+    assert ([m.memory_id for m in db.get_therapeutic_memories({"unknown": 1.0})]
+            == by_value[:MemoryDatabase.THERAPEUTIC_TOP_K])
+
+
+def test_column_means_track_adds_and_updates():
+    db = MemoryDatabase(seed=False)
+    assert db.column_mean("therapeutic") == 0.0
+    for i, value in enumerate((0.2, 0.4, 0.9)):
+        db.add_memory(_memory(f"m{i}", value, {"awe": 1.0}, resonance=value / 2))
+    db.update_memory("m1", {"therapeutic_value": 0.1, "resonance_level": 1.0})
+    # Re-adding an existing memory replaces its row instead of adding one
+    db.add_memory(_memory("m0", 0.6, {"awe": 1.0}))
+    assert db.column_mean("therapeutic") == pytest.approx(np.mean([0.6, 0.1, 0.9]))
+    assert db.column_mean("resonance") == pytest.approx(np.mean([0.5, 1.0, 0.45]))
+    assert db.column_mean("therapeutic") == pytest.approx(float(db.column("therapeutic").mean()))
+
+
+def test_core_memories_are_seeded_on_first_use():
+    db = MemoryDatabase()
+    assert db.memories == {}
+    assert db.get_memory("missing") is None
+    seeded = len(db.memories)
+    assert seeded > 0
+    db.ensure_seeded()
+    assert len(db.memories) == seeded
+    unseeded = MemoryDatabase(seed=False)
+    unseeded.ensure_seeded()
+    assert unseeded.memories == {}
+
+
+def test_guarded_brain_reports_missing_and_failing_methods():
+    class Component:
+        def analyze_memory(self, memory):
+            raise RuntimeError("brain offline")
+
+    brain = _GuardedBrain(Component())
+    assert brain.analyze_memory(None) is None
+    assert brain.get_memory_analytics() is None
+    assert brain.analyze_memories_batch([1, 2]) == [None, None]
+    with pytest.raises(AttributeError):
+        brain._private
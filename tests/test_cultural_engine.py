@@ -1,5 +1,6 @@
 """Unit tests for cultural engine placeholder logic."""
-from src.earth_culture.cultural_engine import ExhibitionManager
+import pytest
+from src.earth_culture.cultural_engine import CulturalEngine, ExhibitionManager
 
 
 def test_cultural_impact_placeholder():
@@ -7,3 +8,56 @@ def test_cultural_impact_placeholder():
     impact = manager._calculate_cultural_impact(["a", "b"], "unity")
     assert impact == 0.7
 
+
+def test_artifacts_by_category_uses_index():
+    engine = CulturalEngine()
+    scroll_id = engine.add_cultural_artifact("Scroll", "documents", "", 0.9, "Earth", {})
+    engine.add_cultural_artifact("Vase", "pottery", "", 0.5, "Earth", {})
+
+    found = engine.db.get_artifacts_by_category("documents")
+    assert [a.artifact_id for a in found] == [scroll_id]
+
+    assert engine.db.remove_artifact(scroll_id)
+    assert engine.db.get_artifacts_by_category("documents") == []
+    assert "documents" not in engine.db.categories
+
+
+def test_score_columns_aggregate_and_rank():
+    engine = CulturalEngine()
+    ids = [
+        engine.add_cultural_artifact(name, "art", "", sig, "Earth", {})
+        for name, sig in [("a", 0.2), ("b", 0.9), ("c", 0.5)]
+    ]
+
+    # Scores are stored as uint8 fixed point, so allow one quantization step
+    assert engine.db.mean_significance() == pytest.approx(1.6 / 3, abs=1 / 255)
+    assert [a.name for a in engine.db.top_artifacts(2)] == ["b", "c"]
+
+    engine.db.remove_artifact(ids[1])
+    assert [a.name for a in engine.db.top_artifacts(5)] == ["c", "a"]
+
+
+def test_rotation_ramps_to_target_and_stops_there():
+    from src.earth_culture.cultural_engine import RotationControl
+
+    control = RotationControl()
+    assert control.set_rotation_speed(0.25)
+    control.update_rotation(2.0)
+    assert control.get_current_speed() == pytest.approx(0.2)
+    control.update_rotation(2.0)
+    assert control.get_current_speed() == pytest.approx(0.25)
+    assert control.set_rotation_speed(0.0)
+    control.update_rotation(1.0)
+    assert control.get_current_speed() == pytest.approx(0.15)
+
+
+def test_exhibition_duration_follows_its_dates():
+    from datetime import datetime, timedelta
+    from src.earth_culture.cultural_engine import Exhibition
+
+    start = datetime(2024, 12, 19)
+    exhibition = Exhibition("x1", "Roots", "unity", [], start, start + timedelta(days=30),
+                            1.0, {}, "scheduled", None, 0.7)
+    assert exhibition.duration_days == 30
+    exhibition.end_date += timedelta(days=5)
+    assert exhibition.duration_days == 35
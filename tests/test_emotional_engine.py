@@ -0,0 +1,86 @@
+"""Unit tests for the emotional intelligence engine fallback processing."""
+import numpy as np
+import pytest
+from src.emotional_biome.emotional_engine import BIO_COLS, EMO_COLS, EmotionalIntelligenceEngine
+
+EMOTIONAL_DATA = {"valence": 0.8, "arousal": 0.6, "dominance": 0.4}
+BIOFEEDBACK_DATA = {
+    "heart_rate": 75.0,
+    "skin_conductance": 0.5,
+    "breathing_rate": 12.0,
+    "brain_waves_alpha": 45.0,
+    "brain_waves_beta": 30.0,
+    "brain_waves_theta": 15.0,
+    "brain_waves_delta": 10.0,
+}
+
+
+def test_batch_matches_single_entity_processing():
+    engine = EmotionalIntelligenceEngine()
+    single = engine.process_emotional_data("solo", EMOTIONAL_DATA, BIOFEEDBACK_DATA, {})
+
+    emo = np.array([[EMOTIONAL_DATA[c] for c in EMO_COLS]] * 2)
+    bio = np.array([[BIOFEEDBACK_DATA[c] for c in BIO_COLS]] * 2)
+    vectors, resonance = engine.process_emotional_batch(["a", "b"], emo, bio, {})
+
+    assert vectors.shape == (2, 10)
+    np.testing.assert_allclose(vectors[0], single.emotional_vector, rtol=1e-6)
+    # The single-entity path memoizes on inputs quantized to 1/256
+    assert resonance[1] == pytest.approx(single.resonance_level, abs=1 / 256)
+    assert engine.get_emotional_state("b").resonance_level == pytest.approx(resonance[1])
+
+
+def test_biofeedback_trends_match_pearson_correlation():
+    engine = EmotionalIntelligenceEngine()
+    rng = np.random.default_rng(0)
+    emo = rng.random((20, len(EMO_COLS)))
+    bio = rng.random((20, len(BIO_COLS))) * 100
+    engine.process_emotional_batch([str(i) for i in range(20)], emo, bio, {})
+
+    trends = engine.analyze_emotional_patterns()["biofeedback_trends"]
+
+    states = engine.emotional_states
+    expected = np.corrcoef(states.resonance[:20], states.vectors[:20, len(EMO_COLS)])[0, 1]
+    assert trends["heart_rate"] == pytest.approx(expected, abs=1e-5)
+
+
+def test_states_of_one_entity_do_not_share_vectors():
+    engine = EmotionalIntelligenceEngine()
+    first = engine.process_emotional_data("e", EMOTIONAL_DATA, BIOFEEDBACK_DATA, {})
+    second = engine.process_emotional_data("e", {"valence": 0.1}, BIOFEEDBACK_DATA, {})
+    assert first.emotional_vector is not second.emotional_vector
+    assert first.emotional_vector[0] == pytest.approx(0.8)
+
+
+class _FakeBrain:
+    supports_vector_updates = True
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_resonance(self, emotional_data):
+        return 0.5
+
+    def process_biofeedback(self, bio_data):
+        return dict(bio_data)
+
+    def update_emotional_state(self, state):
+        self.calls.append("state")
+
+    def update_vector(self, entity_id, emotional_vector):
+        self.calls.append("vector")
+
+
+def test_in_place_context_edit_resends_full_state():
+    brain = _FakeBrain()
+    engine = EmotionalIntelligenceEngine(brain=brain)
+    context = {"room": "garden"}
+    bio = dict(BIOFEEDBACK_DATA)
+
+    engine.process_emotional_data("e", EMOTIONAL_DATA, bio, context)
+    engine.process_emotional_data("e", EMOTIONAL_DATA, bio, context)
+    context["room"] = "portal"
+    engine.process_emotional_data("e", EMOTIONAL_DATA, bio, context)
+    engine.shutdown()
+
+    assert brain.calls == ["state", "vector", "state"]
@@ -9,3 +9,99 @@ def test_therapeutic_value_placeholder():
     value = manager._calculate_therapeutic_value(["fern", "moss"], np.zeros(3))
     assert value == pytest.approx(0.8)
 
+
+def test_garden_manager_uses_athena_garden_manager(monkeypatch):
+    from src.zero_g_dome import environment_engine
+
+    class FakeAthenaGardenManager:
+        pass
+
+    monkeypatch.setattr(environment_engine, "BRAIN_AVAILABLE", True)
+    monkeypatch.setattr(environment_engine, "AthenaGardenManager", FakeAthenaGardenManager, raising=False)
+    manager = GardenManager()
+    assert isinstance(manager.brain_manager, FakeAthenaGardenManager)
+
+
+def test_analytics_follow_garden_property_writes():
+    from src.zero_g_dome.environment_engine import ZeroGEngine
+
+    engine = ZeroGEngine()
+    garden_id = engine.create_floating_garden("a", ["fern", "moss"], np.zeros(3))
+    assert engine.get_environment_analytics()["average_therapeutic_value"] == pytest.approx(0.8)
+    engine.garden_manager.gardens[garden_id].therapeutic_value = 0.1
+    assert engine.get_environment_analytics()["average_therapeutic_value"] == pytest.approx(0.1)
+
+
+def test_growth_status_write_survives_species_table_growth():
+    from src.zero_g_dome.environment_engine import GardenStore
+
+    manager = GardenManager()
+    manager.store = GardenStore(species_capacity=1)
+    garden_id = manager.create_garden("a", ["fern"], np.zeros(3))
+    garden = manager.gardens[garden_id]
+    garden.growth_status = {"fern": 0.25, "moss": 0.5}
+    assert manager.store.growth_status[garden.row, manager.store.species_id["moss"]] == pytest.approx(0.5)
+    assert garden.growth_status == {"fern": 0.25}
+
+
+def test_remove_garden_moves_last_row():
+    manager = GardenManager()
+    ids = [manager.create_garden(f"g{i}", ["fern"], np.array([float(i), 0.0, 0.0])) for i in range(3)]
+    assert manager.remove_garden(ids[0])
+    assert not manager.remove_garden(ids[0])
+    assert manager.store.n == 2
+    assert manager.gardens[ids[2]].position.tolist() == [2.0, 0.0, 0.0]
+    assert manager.store.therapeutic_mean() == pytest.approx(manager.gardens[ids[1]].therapeutic_value)
+
+
+def test_analytics_snapshot_is_per_call_and_follows_state_writes():
+    from src.zero_g_dome.environment_engine import ZeroGEngine
+
+    engine = ZeroGEngine()
+    first = engine.get_environment_analytics()
+    first["current_state"]["temperature"] = 0.0
+    engine.env_controller.current_state.gravity_level = 0.3
+    engine.env_controller.current_state.therapeutic_index = 0.9
+    second = engine.get_environment_analytics()["current_state"]
+    assert second["temperature"] == pytest.approx(293.15)
+    assert second["gravity_level"] == pytest.approx(0.3)
+    assert second["therapeutic_index"] == pytest.approx(0.9)
+    assert engine.get_therapeutic_optimization()["therapeutic_index"] == pytest.approx(0.9)
+
+
+def test_control_tick_starts_from_direct_state_writes():
+    from src.zero_g_dome.environment_engine import EnvironmentController
+
+    controller = EnvironmentController()
+    controller.current_state.temperature = 30.0
+    controller.update_environment(controller.current_state)
+    assert controller.current_state.temperature == pytest.approx(30.0)
+    controller.current_state.temperature = 290.0
+    target = EnvironmentController().current_state
+    controller.update_environment(target)
+    assert controller.current_state.temperature == pytest.approx(290.1)
+
+
+def test_control_tick_copies_in_place_target_level_edits():
+    from src.zero_g_dome.environment_engine import EnvironmentController
+
+    controller = EnvironmentController()
+    target = EnvironmentController().current_state
+    controller.update_environment(target)
+    target.air_quality[0] = 0.002
+    target.energy_levels[1] = 0.5
+    controller.update_environment(target)
+    assert controller.current_state.air_quality[0] == pytest.approx(0.002)
+    assert controller.current_state.energy_levels[1] == pytest.approx(0.5)
+
+
+def test_garden_manager_survives_any_brain_setup_failure(monkeypatch):
+    from src.zero_g_dome import environment_engine
+
+    class BrokenAthenaGardenManager:
+        def __init__(self):
+            raise ValueError("bad config")
+
+    monkeypatch.setattr(environment_engine, "BRAIN_AVAILABLE", True)
+    monkeypatch.setattr(environment_engine, "AthenaGardenManager", BrokenAthenaGardenManager, raising=False)
+    assert GardenManager().brain_manager is None
@@ -0,0 +1,34 @@
+"""Unit tests for the precomputed ethics verdict table."""
+import pytest
+from src.eden_core.ethics_protocol import EthicsProtocol
+
+
+def test_default_policy_verdicts():
+    ethics = EthicsProtocol()
+    assert ethics.evaluate_decision({'zone': 'Stargate Plaza'}, 'open_portal')['approved'] is False
+    assert ethics.evaluate_decision({'zone': 'public'}, 'open_portal')['approved'] is True
+    assert ethics.evaluate_decision({'zone': 'public'}, 'adjust_lighting')['approved'] is True
+    assert ethics.evaluate_decision({}, 'unknown_action')['approved'] is True
+
+
+def test_policies_cannot_be_edited_in_place():
+    ethics = EthicsProtocol()
+    with pytest.raises(TypeError):
+        ethics.policies['x'] = {'zones': ['public'], 'strict': True}
+    with pytest.raises(TypeError):
+        ethics.policies['adjust_lighting']['strict'] = True
+
+
+def test_added_and_removed_policies_update_verdicts():
+    ethics = EthicsProtocol()
+    ethics.add_policy('x', {'zones': ['public'], 'strict': True})
+    assert ethics.evaluate_decision({'zone': 'public'}, 'x')['approved'] is False
+    ethics.remove_policy('x')
+    assert ethics.evaluate_decision({'zone': 'public'}, 'x')['approved'] is True
+
+
+def test_policy_defaults_for_missing_keys():
+    ethics = EthicsProtocol()
+    ethics.policies = {'a': {'zones': ['z']}, 'b': {'strict': True}}
+    assert ethics.evaluate_decision({'zone': 'z'}, 'a')['approved'] is True
+    assert ethics.evaluate_decision({'zone': 'z'}, 'b')['approved'] is True
@@ -0,0 +1,103 @@
+"""Unit tests for the shared WebSocket event reader."""
+import asyncio
+import logging
+import threading
+
+import pytest
+import websockets
+from src.eden_core.event_stream import stream_events
+
+
+async def _serve(frames, callback, until, **kwargs):
+    """Stream *frames* from a local server to *callback* until *until* is set; return the connection count."""
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws)
+        for frame in frames:
+            await ws.send(frame)
+        await ws.wait_closed()
+
+    async with websockets.serve(handler, '127.0.0.1', 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        reader = asyncio.create_task(stream_events(f'ws://127.0.0.1:{port}', callback, 'test', **kwargs))
+        await asyncio.wait_for(until.wait(), 5)
+        await asyncio.sleep(0.05)
+        reader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await reader
+    return len(connections)
+
+
+def test_events_reach_plain_and_coroutine_callbacks():
+    async def run():
+        received = []
+        done = asyncio.Event()
+
+        async def callback(event):
+            received.append(event['n'])
+            if len(received) == 2:
+                done.set()
+
+        await _serve(['{"n": 1}', '{"n": 2}'], callback, done)
+        plain = []
+        plain_done = asyncio.Event()
+
+        def plain_callback(event):
+            plain.append(event['n'])
+            plain_done.set()
+
+        await _serve(['{"n": 3}'], plain_callback, plain_done)
+        return received, plain
+
+    assert asyncio.run(run()) == ([1, 2], [3])
+
+
+def test_dispatched_callbacks_run_off_the_event_loop():
+    async def run():
+        loop = asyncio.get_running_loop()
+        threads = []
+        done = asyncio.Event()
+
+        def callback(event):
+            threads.append(threading.get_ident())
+            loop.call_soon_threadsafe(done.set)
+
+        await _serve(['{"n": 1}'], callback, done, dispatch=True)
+        return threads
+
+    assert asyncio.run(run()) != [threading.get_ident()]
+
+
+FRAMES = ['{"n": 1}', 'not json', '{"n": 2, "fail": true}', '{"n": 3}']
+
+
+def _collect_through_bad_frames(dispatch):
+    async def run():
+        loop = asyncio.get_running_loop()
+        received = []
+        done = asyncio.Event()
+
+        def callback(event):
+            received.append(event['n'])
+            if len(received) == 3:
+                loop.call_soon_threadsafe(done.set)
+            if event.get('fail'):
+                raise RuntimeError('callback failed')
+
+        connections = await _serve(FRAMES, callback, done, dispatch=dispatch)
+        return received, connections
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("dispatch", [False, True])
+def test_bad_frames_and_failing_callbacks_keep_the_connection(caplog, dispatch):
+    with caplog.at_level(logging.WARNING, logger='src.eden_core.event_stream'):
+        received, connections = _collect_through_bad_frames(dispatch)
+    assert sorted(received) == [1, 2, 3]
+    assert connections == 1
+    messages = [record.getMessage() for record in caplog.records if record.name == 'src.eden_core.event_stream']
+    assert any('malformed frame' in message for message in messages)
+    assert any('callback failed' in message for message in messages)
+    assert not any('event stream error' in message for message in messages)
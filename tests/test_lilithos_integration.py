@@ -0,0 +1,22 @@
+"""Unit tests for the LilithOS system-event batcher."""
+from src.eden_core import lilithos_integration
+from src.eden_core.lilithos_integration import _EventBatcher
+
+
+def test_events_are_sent_in_bounded_batches_in_order(monkeypatch):
+    batcher = _EventBatcher('http://lilithos.invalid/events', max_batch=3, max_wait_ms=1000)
+    sent = []
+    monkeypatch.setattr(batcher, '_post', sent.append)
+    assert batcher.flush(timeout=1) is True
+    for i in range(7):
+        batcher.put({'n': i})
+    assert batcher.flush(timeout=5) is True
+    assert all(len(batch) <= 3 for batch in sent)
+    assert [event['n'] for batch in sent for event in batch] == list(range(7))
+
+
+def test_log_system_event_only_queues(monkeypatch):
+    queued = []
+    monkeypatch.setattr(lilithos_integration._batcher, 'put', queued.append)
+    assert lilithos_integration.log_system_event({'type': 'boot'}) == {'status': 'queued'}
+    assert queued == [{'type': 'boot'}]
@@ -0,0 +1,14 @@
+"""Unit tests for per-logger rate-limited warnings."""
+import logging
+
+from src.eden_core.log_limit import warn_limited
+
+
+def test_warnings_are_limited_per_logger(caplog):
+    first = logging.getLogger('tests.log_limit.first')
+    second = logging.getLogger('tests.log_limit.second')
+    with caplog.at_level(logging.WARNING):
+        assert warn_limited(first, 'failed: %s', 'a') is True
+        assert warn_limited(first, 'failed: %s', 'b') is False
+        assert warn_limited(second, 'failed: %s', 'c') is True
+    assert [r.getMessage() for r in caplog.records] == ['failed: a', 'failed: c']
@@ -0,0 +1,117 @@
+"""Unit tests for memory backend storage and feedback hooks."""
+import gc
+
+import pytest
+from src.eden_core.memory_backend import MemoryBackend
+
+
+class _FakeRedis:
+    """In-memory stand-in for a Redis client that counts round-trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def set(self, key, value):
+        self.round_trips += 1
+        self.data[key] = value
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, key, value):
+        self.pending.append((key, value))
+
+    def execute(self):
+        self.client.round_trips += 1
+        self.client.data.update(self.pending)
+
+
+def _redis_backend():
+    pytest.importorskip('redis')
+    backend = MemoryBackend(backend='redis')
+    backend.client = _FakeRedis()
+    return backend
+
+
+def test_unsupported_backend_is_rejected():
+    with pytest.raises(ValueError):
+        MemoryBackend(backend='sqlite')
+
+
+def test_bulk_operations_use_one_round_trip_each():
+    backend = _redis_backend()
+    backend.store_many({'a': 'x', 'b': 'y'})
+    assert backend.retrieve_many(['a', 'missing', 'b']) == ['x', None, 'y']
+    assert backend.retrieve_many([]) == []
+    assert backend.client.round_trips == 2
+
+
+def test_mistral_placeholder_bulk_operations():
+    backend = MemoryBackend(backend='mistral')
+    backend.store_many({'a': 1, 'b': 2})
+    assert backend.retrieve('a') is None
+    assert backend.retrieve_many(['a', 'b']) == [None, None]
+
+
+def test_feedback_hooks_run_and_bound_hooks_are_held_weakly():
+    backend = MemoryBackend(backend='mistral')
+    seen = []
+
+    class Owner:
+        def hook(self, key, value):
+            seen.append(('owner', key, value))
+
+    def failing(key, value):
+        raise RuntimeError('hook failed')
+
+    owner = Owner()
+    backend.feedback_loop(owner.hook)
+    backend.feedback_loop(lambda key, value: seen.append(('lambda', key, value)))
+    backend.feedback_loop(failing)
+    futures = backend.trigger_feedback('k', 1)
+    for future in futures:
+        future.exception(timeout=5)
+    assert sorted(seen) == [('lambda', 'k', 1), ('owner', 'k', 1)]
+    assert isinstance(futures[2].exception(), RuntimeError)
+    del owner
+    gc.collect()
+    assert len(backend.feedback_hooks) == 2
+    backend.shutdown()
+
+
+def test_operations_are_bound_to_the_backend_at_construction():
+    backend = MemoryBackend(backend='mistral')
+    assert backend.store.__func__ is MemoryBackend._mistral_store
+    assert backend.retrieve_many.__func__ is MemoryBackend._mistral_retrieve_many
+
+
+def test_redis_values_round_trip_through_msgpack():
+    pytest.importorskip('msgpack')
+    backend = _redis_backend()
+    value = {'zone': 'plaza', 'levels': [1, 2.5], 'tags': ['calm']}
+    backend.store('k', value)
+    assert isinstance(backend.client.data['k'], bytes)
+    assert backend.retrieve('k') == value
+    backend.store_many({'a': [1, 2], 'b': 'text'})
+    assert backend.retrieve_many(['a', 'b', 'missing']) == [[1, 2], 'text', None]
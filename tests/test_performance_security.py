@@ -0,0 +1,64 @@
+"""Unit tests for the buffered latency store."""
+import gc
+import threading
+
+import pytest
+from src.eden_core.performance_security import PerformanceSecurity
+
+
+def test_exited_thread_buffers_are_flushed_and_dropped():
+    perf = PerformanceSecurity()
+
+    def log():
+        for i in range(10):
+            perf.log_latency('worker', i)
+
+    threads = [threading.Thread(target=log) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    gc.collect()
+    assert perf._lat_buffers == {}
+    assert len(perf.latency_logs) == 80
+
+
+def test_non_numeric_latency_is_rejected():
+    perf = PerformanceSecurity()
+    with pytest.raises(ValueError):
+        perf.log_latency('engine', 'slow')
+    with pytest.raises(TypeError):
+        perf.log_latency('engine', None)
+    perf.log_latency('engine', 5)
+    assert perf.latency_percentile(50) == 5.0
+
+
+def test_latency_p99_rejects_empty_window():
+    perf = PerformanceSecurity()
+    for ms in (1, 2, 3):
+        perf.log_latency('engine', ms)
+    with pytest.raises(ValueError):
+        perf.latency_p99(0)
+    assert list(perf.latency_p99(1)) == [1.0, 2.0, 3.0]
+
+
+def test_audit_writer_survives_a_failing_batch(tmp_path, caplog):
+    calls = []
+
+    def flaky_cipher(payload):
+        calls.append(payload)
+        if len(calls) == 1:
+            raise RuntimeError('key unavailable')
+        return payload
+
+    path = tmp_path / 'audit.log'
+    perf = PerformanceSecurity(audit_path=str(path), audit_cipher=flaky_cipher)
+    perf.audit('lost', {})
+    assert perf.flush_audit()
+    perf.audit('kept', {})
+    assert perf.flush_audit()
+    perf.close_audit()
+
+    assert 'Could not write audit batch' in caplog.text
+    data = path.read_bytes()
+    assert b'"kept"' in data and b'"lost"' not in data
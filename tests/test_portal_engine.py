@@ -1,5 +1,8 @@
 """Unit tests for portal engine placeholder logic."""
-from src.stargate.portal_engine import ResonanceTester
+import numpy as np
+import pytest
+from src.stargate import portal_engine
+from src.stargate.portal_engine import RESONANCE_FEATURES, ResonanceTester
 
 
 def test_cultural_alignment_placeholder():
@@ -11,3 +14,44 @@ def test_genetic_compatibility_placeholder():
     tester = ResonanceTester()
     assert tester._calculate_genetic_compatibility({}) == 0.5
 
+
+def test_batch_resonance_test_matches_single():
+    tester = ResonanceTester()
+    ids = [tester.create_profile(f"entity_{i}") for i in range(4)]
+    tester.profiles[ids[0]].sacred_clearance = True
+    batch = tester.perform_resonance_test_batch({pid: {} for pid in ids})
+    for pid in ids:
+        single = tester.perform_resonance_test(pid, {})
+        assert batch[pid]["access_level"] == single["access_level"]
+        assert batch[pid]["metrics"] == single["metrics"]
+
+
+@pytest.mark.parametrize("numba_path", [True, False])
+def test_batch_matches_single_across_access_levels(monkeypatch, numba_path):
+    # Stand in for real feature extraction so the rows land on every access level
+    monkeypatch.setattr(portal_engine, "_extract_features",
+                        lambda data: np.array([data[f] for f in RESONANCE_FEATURES], dtype=np.float64))
+    monkeypatch.setattr(portal_engine, "NUMBA_AVAILABLE", numba_path)
+    rows = {0: (0.1, 0.1, 0.1, 0.1), 1: (0.5, 0.5, 0.5, 0.5), 2: (0.7, 0.7, 0.7, 0.7),
+            3: (0.9, 0.9, 0.9, 0.9), 4: (0.9, 0.9, 0.9, 0.9)}
+    tester = ResonanceTester()
+    ids = {level: tester.create_profile(f"entity_{level}") for level in rows}
+    tester.profiles[ids[4]].sacred_clearance = True
+    tests = {ids[level]: dict(zip(RESONANCE_FEATURES, row)) for level, row in rows.items()}
+    batch = tester.perform_resonance_test_batch(tests)
+    for level, pid in ids.items():
+        single = tester.perform_resonance_test(pid, tests[pid])
+        assert batch[pid]["access_level"] == single["access_level"] == level
+        assert batch[pid]["metrics"] == single["metrics"]
+
+
+def test_self_reported_features_do_not_raise_access():
+    tester = ResonanceTester()
+    pid = tester.create_profile("entity")
+    claimed = {"emotional_stability": 1.0, "cultural_alignment": 1.0,
+               "genetic_compatibility": 1.0, "spiritual_resonance": 1.0}
+    single = tester.perform_resonance_test(pid, claimed)
+    batch = tester.perform_resonance_test_batch({pid: claimed})
+    for result in (single, batch[pid]):
+        assert result["access_level"] == 1
+        assert set(result["metrics"].values()) == {0.5}